@@ -0,0 +1,79 @@
+"""
+Benchmark Runner
+================
+Runs the benchmark cases, saves the results as JSON and compares them with a baseline. The exit status is 1 when a case is slower than the baseline beyond the tolerance.
+
+Example:
+    Store a baseline on the reference machine, then compare a later run with it ::
+
+        python -m benchmarks --save baseline.json
+        python -m benchmarks --save results.json --baseline baseline.json
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import argparse
+import sys
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+import benchmarks.bench_pipeline  # noqa: F401, registers the cases
+from ensemble.tools.benchmark import (
+    CASES,
+    compare_results,
+    format_time,
+    load_results,
+    run_cases,
+    save_results,
+)
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+
+def log(key: str, result: dict):
+    if "skipped" in result:
+        print(f"{key:<24} skipped: {result['skipped']}")
+        return
+    per_vehicle = result["min"] / result["n"]
+    print(
+        f"{key:<24} {format_time(result['min']):>10} "
+        f"{format_time(per_vehicle):>10}/veh"
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[3])
+    parser.add_argument("cases", nargs="*", help=f"Cases among {list(CASES)}")
+    parser.add_argument("--sizes", help="Comma separated fleet sizes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--save", help="Path of the JSON results")
+    parser.add_argument("--baseline", help="Path of the JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    sizes = [int(n) for n in args.sizes.split(",")] if args.sizes else None
+    results = run_cases(
+        args.cases or None, sizes, args.repeat, args.min_time, log
+    )
+    if args.save:
+        save_results(results, args.save)
+    if not args.baseline:
+        return 0
+
+    rows = compare_results(results, load_results(args.baseline), args.tolerance)
+    print(f"\nCompared with {args.baseline}")
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(f"{row['key']:<24} {row['ratio']:>6.2f}x {flag}")
+    return int(any(row["regression"] for row in rows))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Pipeline Benchmarks
+===================
+Benchmark cases of the step pipeline at increasing fleet sizes. Frames are produced by ``ensemble.handler.synthetic.generator`` on two lanes, so no simulator is needed.
+
+The ``query``, ``update_list``, ``leaders``, ``update_platoons`` and ``operational`` cases run the leader and follower search of ``VehicleList``, whose cost grows with the square of the fleet. They are limited to 1 000 vehicles by ``QUADRATIC``, pass ``--sizes`` to go further. Cases with platoon trucks need the truck dynamics library and the operational case the ``OperationalDLL`` library, they are skipped where these are not available.
+"""
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.component.vehiclelist import VehicleList
+from ensemble.control.operational import CACC
+from ensemble.control.operational.reference import ReferenceHeadway
+from ensemble.control.tactical.gapcordinator import GlobalGapCoordinator
+from ensemble.handler.symuvia.stream import SimulatorRequest
+from ensemble.handler.symuvia.xmlparser import XMLTrajectory
+from ensemble.handler.synthetic.generator import StreamGenerator
+from ensemble.logic.platoon_states import Platooning
+from ensemble.tools.benchmark import case
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+QUADRATIC = (10, 100, 1_000)
+SPACING = 20  # [m]
+
+
+def frames(n: int, truck_share: float = 0.0, steps: int = 2) -> list:
+    """Consecutive frames of ``n`` vehicles spaced by ``SPACING`` on two lanes, vehicles close to equilibrium do not leave the link within ``steps``"""
+    generator = StreamGenerator(
+        links=1,
+        lanes=2,
+        length=(n // 2 + 1) * SPACING,
+        demand=0,
+        truck_share=truck_share,
+        density=1000 / SPACING,
+        seed=0,
+    )
+    result = []
+    for _ in range(steps):
+        generator.advance()
+        result.append(generator.frame())
+    return result
+
+
+def request(n: int, truck_share: float = 0.0) -> SimulatorRequest:
+    """Request holding a registry of ``n`` vehicles"""
+    request = SimulatorRequest()
+    request.query = frames(n, truck_share, 1)[0]
+    return request
+
+
+@case("parse")
+def parse(n: int):
+    frame = frames(n, steps=1)[0]
+    return lambda: XMLTrajectory(frame).todict
+
+
+@case("query", QUADRATIC)
+def query(n: int):
+    first, second = frames(n)
+    simulator = request(n)
+    toggle = [first, second]
+
+    def step():
+        toggle.reverse()
+        simulator.query = toggle[0]
+
+    return step
+
+
+@case("update_list", QUADRATIC)
+def update_list(n: int):
+    registry = request(n).vehicle_registry
+    return registry.update_list
+
+
+@case("leaders", QUADRATIC)
+def leaders(n: int):
+    registry = request(n).vehicle_registry
+
+    def search():
+        registry.update_leaders()
+        registry.update_followers()
+
+    return search
+
+
+@case("neighbours")
+def neighbours(n: int):
+    registry = request(n).vehicle_registry
+
+    def build():
+        registry._neighbours = None
+        return registry.neighbours
+
+    return build
+
+
+@case("update_platoons", QUADRATIC)
+def update_platoons(n: int):
+    coordinator = GlobalGapCoordinator(request(n, 1.0).vehicle_registry)
+    coordinator.update_platoons()
+    return coordinator.update_platoons
+
+
+@case("reference")
+def reference(n: int):
+    references = [ReferenceHeadway() for _ in range(n)]
+    state = Platooning()
+
+    def create():
+        for headway in references:
+            headway.create_time_gap_hwy(state)
+
+    return create
+
+
+@case("operational", QUADRATIC)
+def operational(n: int):
+    coordinator = GlobalGapCoordinator(request(n, 1.0).vehicle_registry)
+    coordinator.update_platoons()
+    coordinator.cacc = CACC()
+    return lambda: coordinator.apply_cacc(0.0)
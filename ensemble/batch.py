@@ -0,0 +1,322 @@
+"""
+Batch Runner
+============
+This module runs many scenarios, and several seeds per scenario, across a pool of worker processes. It is meant for parameter studies involving hundreds of runs.
+
+* Scenario files are given as paths or glob patterns, each run is a pair (scenario, seed)
+* The seed is written into the ``SIMULATION`` element of a temporary copy of the scenario placed next to the original, so relative references keep working
+* Each worker loads the simulator library once and reuses its connector for all the runs it receives
+* KPIs and timings of each run are gathered into a single summary table, a failing run is reported in the table and does not stop the batch
+
+Example:
+    Run all the scenarios of a folder with three seeds over four processes ::
+
+        >>> from ensemble.batch import run_batch
+        >>> summary = run_batch(
+        ...     ["scenarios/*.xml"],
+        ...     seeds=(1, 2, 3),
+        ...     library_path="path/to/libSymuFlow.so",
+        ...     workers=4,
+        ... )
+        >>> summary.to_csv("summary.csv")
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+import glob
+import tempfile
+from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter, process_time
+from typing import Iterable, List, Optional
+import multiprocessing as mp
+from lxml import etree
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.configurator import Configurator
+from ensemble.logic import RuntimeDevice
+from ensemble.tools.constants import DCT_RUNTIME_PARAM
+from ensemble.tools.screen import log_success, log_warning
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+COLUMNS = (
+    "scenario",
+    "seed",
+    "status",
+    "steps",
+    "simulated",
+    "wall",
+    "cpu",
+    "vehicles",
+    "vehicles_max",
+    "platoons_max",
+    "ttc_min",
+    "time_gap_min",
+    "worker",
+)
+
+_CONNECTOR = None  # Connector of the worker process, reused across runs
+
+
+@dataclass
+class BatchRun:
+    """A single run of the batch
+
+    Args:
+        index (int): Position of the run in the plan
+        scenario (str): Scenario file
+        seed (int): Seed of the run, None keeps the seed of the file
+    """
+
+    index: int
+    scenario: str
+    seed: Optional[int] = None
+
+
+def expand(patterns: Iterable[str]) -> List[str]:
+    """Expands paths and glob patterns into scenario files, duplicates are dropped and the order of the patterns is kept
+
+    Args:
+        patterns (Iterable[str]): Paths or glob patterns
+
+    Returns:
+        list: Absolute paths of the scenario files
+    """
+    files = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches and not glob.has_magic(pattern):
+            matches = [pattern]
+        for match in matches:
+            files.setdefault(os.path.abspath(match), None)
+    return list(files)
+
+
+def plan(scenarios: Iterable[str], seeds: Iterable = (None,)) -> List[BatchRun]:
+    """Runs of the batch, every scenario is run with every seed
+
+    Args:
+        scenarios (Iterable[str]): Paths or glob patterns of scenario files
+        seeds (Iterable, optional): Seeds, None keeps the seed of the file. Defaults to (None,).
+
+    Returns:
+        list: Runs of the batch
+    """
+    seeds = tuple(seeds) or (None,)
+    pairs = ((s, seed) for s in expand(scenarios) for seed in seeds)
+    return [BatchRun(i, s, seed) for i, (s, seed) in enumerate(pairs)]
+
+
+def seeded_copy(scenario: str, seed: int) -> str:
+    """Writes a copy of a SymuVia scenario with the given seed next to the original file
+
+    Args:
+        scenario (str): Scenario file
+        seed (int): Seed of the simulation
+
+    Returns:
+        str: Path of the copy, to be removed by the caller
+    """
+    tree = etree.parse(scenario)
+    for simulation in tree.getroot().iter("SIMULATION"):
+        simulation.set("seed", str(seed))
+    path = Path(scenario)
+    fd, copy = tempfile.mkstemp(
+        suffix=path.suffix, prefix=f".{path.stem}_seed{seed}_", dir=path.parent
+    )
+    with os.fdopen(fd, "wb") as f:
+        tree.write(f, xml_declaration=True, encoding="UTF-8")
+    return copy
+
+
+class RunKPIs:
+    """Step hook collecting the KPIs of a run"""
+
+    def __init__(self):
+        self.vehicles = set()
+        self.vehicles_max = 0
+        self.platoons_max = 0
+
+    def __call__(self, configurator):
+        request = getattr(configurator.connector, "request", None)
+        vehicles = getattr(request, "vehicle_registry", None)
+        if vehicles is not None:
+            self.vehicles.update(v.vehid for v in vehicles)
+            self.vehicles_max = max(self.vehicles_max, len(vehicles))
+        platoons = getattr(configurator, "platoon_registry", None)
+        if platoons is not None:
+            self.platoons_max = max(self.platoons_max, platoons.nplatoons)
+
+
+def _minimum(monitor, metric: str) -> float:
+    """Overall minimum of a safety indicator, nan without monitor or sample"""
+    if monitor is None or not len(monitor):
+        return np.nan
+    return float(min(monitor.minimum(metric).values()))
+
+
+def _init_worker(library_path: str, simulation_platform: str):
+    """Loads the simulator library of a worker process once, a failure is reported by the runs"""
+    global _CONNECTOR
+    configurator = Configurator(
+        simulation_platform=simulation_platform, library_path=library_path
+    )
+    try:
+        configurator.load_socket()
+        _CONNECTOR = configurator.connector
+    except Exception:
+        _CONNECTOR = None
+
+
+def run_scenario(
+    run: BatchRun,
+    library_path: str,
+    simulation_platform: str = "symuvia",
+    sim_steps: int = 0,
+    parameters: dict = None,
+) -> dict:
+    """Runs a single scenario of the batch, the connector of the process is reused when available
+
+    Args:
+        run (BatchRun): Run to perform
+        library_path (str): Path of the simulator library
+        simulation_platform (str, optional): "symuvia" or "vissim". Defaults to "symuvia".
+        sim_steps (int, optional): Number of steps, 0 for ``total_steps``. Defaults to 0.
+        parameters (dict, optional): Simulation parameters replacing ``DCT_RUNTIME_PARAM`` entries. Defaults to None.
+
+    Returns:
+        dict: KPIs and timings of the run, keys in ``COLUMNS``
+    """
+    global _CONNECTOR
+
+    configurator = Configurator(
+        info=False,
+        simulation_platform=simulation_platform,
+        library_path=library_path,
+        sim_steps=sim_steps,
+    )
+    configurator.simulation_parameters = {
+        **DCT_RUNTIME_PARAM,
+        **(parameters or {}),
+    }
+    if _CONNECTOR is not None:
+        configurator.connector = _CONNECTOR
+
+    scenario, copy, device = run.scenario, None, None
+    kpis = RunKPIs()
+    result = dict(scenario=run.scenario, seed=run.seed, worker=os.getpid())
+    t0, c0 = perf_counter(), process_time()
+    try:
+        if run.seed is not None:
+            if simulation_platform == "symuvia":
+                scenario = copy = seeded_copy(run.scenario, run.seed)
+            else:
+                log_warning(f"\tSeeds are not supported on {simulation_platform}")
+        configurator.scenario_files = [scenario]
+        device = RuntimeDevice(configurator)
+        device.add_hook(kpis)
+        if device.start():
+            device.loop(device.compile())
+            result["status"] = "ok"
+        else:
+            result["status"] = f"failed: {type(device.state).__name__.lower()}"
+        device.terminate()
+    except Exception as error:
+        result["status"] = f"error: {error}"
+    finally:
+        if copy is not None:
+            os.remove(copy)
+    result["wall"] = perf_counter() - t0
+    result["cpu"] = process_time() - c0
+
+    connector = getattr(configurator, "connector", None)
+    _CONNECTOR = connector if connector is not None else _CONNECTOR
+    registry = getattr(configurator, "platoon_registry", None)
+    monitor = getattr(registry, "monitor", None)
+    steps = device.step if device is not None else 0
+    result.update(
+        steps=steps,
+        simulated=steps * configurator.simulation_parameters["sampling_time"],
+        vehicles=len(kpis.vehicles),
+        vehicles_max=kpis.vehicles_max,
+        platoons_max=kpis.platoons_max,
+        ttc_min=_minimum(monitor, "ttc"),
+        time_gap_min=_minimum(monitor, "time_gap"),
+    )
+    return result
+
+
+def run_batch(
+    scenarios: Iterable[str],
+    seeds: Iterable = (None,),
+    library_path: str = "",
+    simulation_platform: str = "symuvia",
+    workers: int = 0,
+    sim_steps: int = 0,
+    parameters: dict = None,
+) -> pd.DataFrame:
+    """Runs all pairs (scenario, seed) across worker processes
+
+    Args:
+        scenarios (Iterable[str]): Paths or glob patterns of scenario files
+        seeds (Iterable, optional): Seeds, None keeps the seed of the file. Defaults to (None,).
+        library_path (str, optional): Path of the simulator library. Defaults to "".
+        simulation_platform (str, optional): "symuvia" or "vissim". Defaults to "symuvia".
+        workers (int, optional): Worker processes, 0 for the number of CPUs and 1 to run in the current process. Defaults to 0.
+        sim_steps (int, optional): Number of steps per run, 0 for ``total_steps``. Defaults to 0.
+        parameters (dict, optional): Simulation parameters replacing ``DCT_RUNTIME_PARAM`` entries. Defaults to None.
+
+    Returns:
+        pd.DataFrame: KPIs and timings per run, indexed by run
+    """
+    runs = plan(scenarios, seeds)
+    workers = min(workers or os.cpu_count() or 1, max(len(runs), 1))
+    args = (library_path, simulation_platform, sim_steps, parameters)
+    log_success(f"Batch of {len(runs)} runs over {workers} worker(s)")
+
+    results = {}
+    if workers == 1:
+        for run in runs:
+            results[run.index] = run_scenario(run, *args)
+    else:
+        # Spawned workers do not inherit the library loaded by the parent
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(library_path, simulation_platform),
+        ) as pool:
+            futures = {pool.submit(run_scenario, r, *args): r for r in runs}
+            for future in as_completed(futures):
+                run = futures[future]
+                try:
+                    results[run.index] = future.result()
+                except Exception as error:  # Worker lost
+                    results[run.index] = dict(
+                        scenario=run.scenario,
+                        seed=run.seed,
+                        status=f"error: {error}",
+                    )
+                log_success(
+                    f"Run {len(results)}/{len(runs)}:",
+                    f"\t{Path(run.scenario).name} seed={run.seed} "
+                    f"{results[run.index]['status']}",
+                )
+
+    summary = pd.DataFrame(
+        [results[run.index] for run in runs], columns=COLUMNS
+    )
+    summary.index.name = "run"
+    return summary
@@ -0,0 +1,183 @@
+"""
+Bench Runner
+============
+This module runs a standard synthetic workload through the ``RuntimeDevice`` pipeline, without a simulator, and reports its throughput. It is meant to size nodes and to validate releases on the target hardware.
+
+* The fleet is generated by ``ensemble.handler.synthetic`` on a corridor long enough to hold ``vehicles`` at ``DENSITY``, and the demand entering each lane keeps this density
+* The tactical and operational layers and the safety monitor are enabled through ``layers``
+* Platoon trucks, any ``truck_share`` above 0, need the truck dynamics library, pass ``truck_share=0`` where it is not available
+* ``PROFILER`` is enabled for the run, the throughput is computed from the time of the steps, so loading the scenario is not counted
+
+The report holds the simulated seconds per wall second, the vehicle-steps per second and the wall time spent in each phase and section of a step.
+
+Example:
+    Bench 10 000 vehicles, 20% of platoon trucks, over 120 steps ::
+
+        >>> from ensemble.bench import run_bench
+        >>> report = run_bench(10_000, steps=120, truck_share=0.2)
+        >>> report["vehicle_rate"]
+
+    Or from the command line ::
+
+        ensemble bench -n 10000 --steps 120 --truck-share 0.2
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+import json
+import tempfile
+from typing import Iterable
+import pandas as pd
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.configurator import Configurator
+from ensemble.logic import RuntimeDevice
+from ensemble.tools.constants import DCT_RUNTIME_PARAM
+from ensemble.tools.profiler import PROFILER
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+LAYERS = ("tactical", "operational", "safety")
+DENSITY = 20  # [veh/km/lane] Initial density of the corridor
+SPEED = 25  # [m/s] Speed sustaining the density with the demand
+PHASE_COLUMNS = ("count", "total", "mean", "p95", "share")
+
+
+def workload(
+    vehicles: int,
+    truck_share: float = 0.1,
+    links: int = 10,
+    lanes: int = 2,
+    seed: int = 0,
+) -> dict:
+    """Parameters of the synthetic generator holding ``vehicles`` at ``DENSITY``
+
+    Args:
+        vehicles (int): Initial number of vehicles
+        truck_share (float, optional): Share of platoon trucks. Defaults to 0.1.
+        links (int, optional): Number of links of the corridor. Defaults to 10.
+        lanes (int, optional): Number of lanes of each link. Defaults to 2.
+        seed (int, optional): Seed of the generator. Defaults to 0.
+
+    Returns:
+        dict: Parameters of ``StreamGenerator``
+    """
+    return {
+        "links": links,
+        "lanes": lanes,
+        "length": vehicles * 1000 / (DENSITY * links * lanes),
+        "demand": DENSITY * SPEED * 3.6,
+        "truck_share": truck_share,
+        "density": DENSITY,
+        "seed": seed,
+    }
+
+
+def phases(stats: dict) -> pd.DataFrame:
+    """Wall time of the phases and sections of a step
+
+    Args:
+        stats (dict): Statistics of ``PROFILER.to_dict``
+
+    Returns:
+        pd.DataFrame: Statistics per phase or section, ``share`` is the part of the step time. Sections are nested in phases, so their shares overlap.
+    """
+    timers = stats["timers"]
+    step = timers.get("step", {"wall": {"total": 0}})["wall"]["total"]
+    rows = {
+        name: {**timer["wall"], "share": timer["wall"]["total"] / step}
+        for name, timer in timers.items()
+        if name != "step" and step
+    }
+    table = pd.DataFrame.from_dict(
+        rows, orient="index", columns=PHASE_COLUMNS
+    )
+    table.index.name = "phase"
+    return table.sort_values("total", ascending=False)
+
+
+def run_bench(
+    vehicles: int = 1000,
+    steps: int = 60,
+    truck_share: float = 0.1,
+    layers: Iterable[str] = ("tactical",),
+    links: int = 10,
+    lanes: int = 2,
+    seed: int = 0,
+    stream: str = "symuvia",
+) -> dict:
+    """Runs the synthetic workload through a ``RuntimeDevice``
+
+    Args:
+        vehicles (int, optional): Initial number of vehicles. Defaults to 1000.
+        steps (int, optional): Number of steps. Defaults to 60.
+        truck_share (float, optional): Share of platoon trucks, they need the truck dynamics library. Defaults to 0.1.
+        layers (Iterable[str], optional): Enabled layers among ``LAYERS``. Defaults to ("tactical",).
+        links (int, optional): Number of links of the corridor. Defaults to 10.
+        lanes (int, optional): Number of lanes of each link. Defaults to 2.
+        seed (int, optional): Seed of the generator. Defaults to 0.
+        stream (str, optional): Format of the frames, "symuvia" or "vissim". Defaults to "symuvia".
+
+    Returns:
+        dict: Workload, throughput and ``phases`` table of the run
+    """
+    layers = tuple(layers)
+    unknown = set(layers) - set(LAYERS)
+    if unknown:
+        raise ValueError(f"Unknown layers: {sorted(unknown)}")
+    if "operational" in layers and "tactical" not in layers:
+        raise ValueError("The operational layer needs the tactical layer")
+
+    configurator = Configurator(
+        info=False, simulation_platform="synthetic", sim_steps=steps
+    )
+    configurator.simulation_parameters = {
+        **DCT_RUNTIME_PARAM,
+        "tactical": "tactical" in layers,
+        "operational": "operational" in layers,
+        "safety_monitor": "safety" in layers,
+        "log_interval": float("inf"),
+    }
+    parameters = workload(vehicles, truck_share, links, lanes, seed)
+    fd, scenario = tempfile.mkstemp(suffix=".json", prefix="ensemble_bench_")
+    with os.fdopen(fd, "w") as f:
+        json.dump({**parameters, "stream": stream}, f)
+    configurator.scenario_files = [scenario]
+
+    device = RuntimeDevice(configurator)
+
+    PROFILER.reset()
+    PROFILER.enable()
+    try:
+        with device:
+            pass
+    finally:
+        PROFILER.disable()
+        os.remove(scenario)
+
+    stats = PROFILER.to_dict()
+    wall = stats["timers"].get("step", {"wall": {"total": 0.0}})
+    wall = wall["wall"]["total"]
+    counted = stats["counters"].get("vehicles", {"total": 0})["total"]
+    sampling_time = configurator.simulation_parameters["sampling_time"]
+    simulated = device.step * sampling_time
+    return {
+        "vehicles": vehicles,
+        "steps": device.step,
+        "truck_share": truck_share,
+        "layers": layers,
+        "simulated": simulated,
+        "wall": wall,
+        "vehicle_steps": counted,
+        "sim_rate": simulated / wall if wall else float("nan"),
+        "vehicle_rate": counted / wall if wall else float("nan"),
+        "phases": phases(stats),
+    }
@@ -10,6 +10,7 @@ Scenario launcher for ENSEMBLE simulations
 
 from platform import platform
 import sys
+import json
 import click
 from click.core import Context
 
@@ -24,6 +25,8 @@ from ensemble.ensemble import (
     run_operational_runtime,
 )
 from ensemble.configurator import Configurator
+from ensemble.batch import run_batch
+from ensemble.bench import LAYERS, run_bench
 
 # ============================================================================
 # CLASS AND DEFINITIONS
@@ -67,7 +70,7 @@ file://ensemble/docs/_build/html/index.html
     "-p",
     "--platform",
     default="",
-    help="Selects a simulation platform when available. 'symuvia' or 'vissim'",
+    help="Selects a simulation platform when available. 'symuvia', 'vissim', 'replay' or 'synthetic'",
 )
 @click.pass_context
 def main(ctx: Context, verbose: bool, info: str, platform: str) -> int:
@@ -110,9 +113,86 @@ def main(ctx: Context, verbose: bool, info: str, platform: str) -> int:
 )
 @click.option("--check", is_flag=True, help="Enable check flag")
 @click.option("--steps", default=0, help="Simulates n time steps")
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile the simulation steps, exports JSON/CSV timings and a pstats file",
+)
+@click.option(
+    "--profile-output",
+    default="ensemble_profile",
+    type=str,
+    help="Path prefix of the profile files.",
+)
+@click.option(
+    "--memory",
+    is_flag=True,
+    help="Samples memory and object counts, exports a JSON/CSV timeline",
+)
+@click.option(
+    "--memory-output",
+    default="ensemble_memory",
+    type=str,
+    help="Path prefix of the memory report.",
+)
+@click.option(
+    "--memory-interval",
+    default=100,
+    type=int,
+    help="Steps between memory samples.",
+)
+@click.option(
+    "--metrics-port",
+    default=0,
+    type=int,
+    help="Serves live metrics at http://127.0.0.1:<port>/metrics",
+)
+@click.option(
+    "--record",
+    default="",
+    type=str,
+    help="Records vehicle and platoon trajectories as chunked columnar files in this folder",
+)
+@click.option(
+    "--archive",
+    default="",
+    type=str,
+    help="Archives the raw simulator frames at this path, with a step index for random access",
+)
+@click.option(
+    "--pipelined",
+    is_flag=True,
+    help="Runs the simulator step in background while the previous one is controlled, one step lag",
+)
+@click.option(
+    "--fast-forward",
+    is_flag=True,
+    help="Skips parsing until a platoon vehicle enters the network",
+)
+@click.option(
+    "--fast-forward-until",
+    default=0.0,
+    type=float,
+    help="Simulation time [s] ending the fast forward, 0 waits for a platoon vehicle",
+)
 @pass_config
 def launch(
-    config: Configurator, scenario: str, library: str, check: bool, steps: int
+    config: Configurator,
+    scenario: str,
+    library: str,
+    check: bool,
+    steps: int,
+    profile: bool,
+    profile_output: str,
+    memory: bool,
+    memory_output: str,
+    memory_interval: int,
+    metrics_port: int,
+    record: str,
+    archive: str,
+    pipelined: bool,
+    fast_forward: bool,
+    fast_forward_until: float,
 ) -> None:
     """Launches an escenario for a specific platform"""
     click.echo(
@@ -122,7 +202,18 @@ def launch(
 
     # Update configurator
     config.update_values(
-        library_path=library, scenario_files=scenario, sim_steps=steps
+        library_path=library,
+        scenario_files=scenario,
+        sim_steps=steps,
+        profile=profile_output if profile else "",
+        memory=memory_output if memory else "",
+        memory_interval=memory_interval,
+        metrics_port=metrics_port,
+        record=record,
+        archive=archive,
+        pipelined=pipelined,
+        fast_forward=fast_forward or fast_forward_until > 0,
+        fast_forward_until=fast_forward_until,
     )
 
     # Run optional check
@@ -132,6 +223,147 @@ def launch(
     launch_simulation(config)
 
 
+# ------------------------------ Batch command---------------------------------
+
+
+@main.command()
+@click.option(
+    "-s",
+    "--scenario",
+    default=[],
+    multiple=True,
+    help="Scenario file(s) or glob pattern(s), e.g. 'scenarios/*.xml'.",
+)
+@click.option(
+    "--seed",
+    default=[],
+    multiple=True,
+    type=int,
+    help="Seed(s) of the runs, each scenario is run with each seed.",
+)
+@click.option(
+    "-l",
+    "--library",
+    default="",
+    type=str,
+    help="Full path towards the simulatorlibrary.",
+)
+@click.option(
+    "-w",
+    "--workers",
+    default=0,
+    type=int,
+    help="Worker processes, 0 uses all the CPUs.",
+)
+@click.option("--steps", default=0, help="Simulates n time steps per run")
+@click.option(
+    "-o",
+    "--output",
+    default="",
+    type=str,
+    help="CSV file of the summary table.",
+)
+@pass_config
+def batch(
+    config: Configurator,
+    scenario: str,
+    seed: int,
+    library: str,
+    workers: int,
+    steps: int,
+    output: str,
+) -> None:
+    """Runs several scenarios and seeds in parallel processes"""
+    click.echo(
+        "Launching batch on platform: "
+        + click.style((f"{config.simulation_platform}"), fg="green")
+    )
+
+    summary = run_batch(
+        scenario,
+        seeds=seed or (None,),
+        library_path=library or config.library_path,
+        simulation_platform=config.simulation_platform,
+        workers=workers,
+        sim_steps=steps,
+    )
+    click.echo(summary.to_string())
+    if output:
+        summary.to_csv(output)
+
+
+# ------------------------------ Bench command---------------------------------
+
+
+@main.command()
+@click.option(
+    "-n",
+    "--vehicles",
+    default=1000,
+    type=int,
+    help="Initial number of vehicles of the synthetic fleet.",
+)
+@click.option("--steps", default=60, type=int, help="Simulates n time steps")
+@click.option(
+    "--truck-share",
+    default=0.1,
+    type=float,
+    help="Share of platoon trucks in the fleet, trucks need the truck dynamics library.",
+)
+@click.option(
+    "--layer",
+    default=["tactical"],
+    multiple=True,
+    type=click.Choice(LAYERS),
+    help="Enabled layer(s), repeat the option for several layers.",
+)
+@click.option("--no-layer", is_flag=True, help="Runs the query phase only")
+@click.option("--seed", default=0, type=int, help="Seed of the fleet.")
+@click.option(
+    "-o",
+    "--output",
+    default="",
+    type=str,
+    help="JSON file of the report.",
+)
+def bench(
+    vehicles: int,
+    steps: int,
+    truck_share: float,
+    layer: str,
+    no_layer: bool,
+    seed: int,
+    output: str,
+) -> None:
+    """Measures the throughput of a synthetic workload, no simulator needed"""
+    layers = () if no_layer else layer
+    click.echo(
+        f"Bench of {vehicles} vehicles over {steps} steps, layers: "
+        + click.style(", ".join(layers) or "none", fg="green")
+    )
+    try:
+        report = run_bench(
+            vehicles,
+            steps=steps,
+            truck_share=truck_share,
+            layers=layers,
+            seed=seed,
+        )
+    except ValueError as error:
+        raise click.UsageError(str(error))
+    table = report.pop("phases")
+    click.echo(
+        f"Simulated seconds per wall second: {report['sim_rate']:.3g}\n"
+        f"Vehicle-steps per second:          {report['vehicle_rate']:.3g}\n"
+        f"Wall time of the steps:            {report['wall']:.3g} s"
+    )
+    click.echo(table.to_string(float_format="{:.3g}".format))
+    if output:
+        with open(output, "w") as f:
+            report["phases"] = table.to_dict("index")
+            json.dump(report, f, indent=2)
+
+
 # ----------------------------- Check command----------------------------------
 
 
@@ -104,6 +104,15 @@ class TruckDynamics(AbsDynamics):
         """Loads the truck library into the class"""
         self.lib = cdll.LoadLibrary(path_library)
 
+    def __getstate__(self):
+        """Pickles the truck state without the loaded library"""
+        return {k: v for k, v in self.__dict__.items() if k != "lib"}
+
+    def __setstate__(self, state):
+        """Restores the truck state and reloads the library"""
+        self.__dict__.update(state)
+        self.load_library(self.library)
+
     @property
     def T(self):
         return TIME_STEP
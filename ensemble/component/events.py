@@ -0,0 +1,92 @@
+"""
+Vehicle Events
+==============
+This module defines typed events of a simulation step:
+
+* **Creation**: A vehicle is created at a network entry
+* **Exit**: A vehicle leaves the network
+* **Queue**: Number of vehicles waiting to enter at a network entry
+
+The events of a step are gathered in ``StepEvents``. They drive the creation and release of vehicles in ``VehicleList`` and expose the demand waiting at the entries.
+
+Example:
+    Read the events of the current frame ::
+
+        >>> events = simrequest.events
+        >>> [e.vehid for e in events.creations]
+        >>> events.queued
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class Creation:
+    """Vehicle created at an entry
+
+    Args:
+        vehid (int): Vehicle id
+        vehtype (str): Vehicle type
+        entry (str): Entry of the vehicle
+        exit (str): Destination of the vehicle
+    """
+
+    vehid: int
+    vehtype: str = ""
+    entry: str = ""
+    exit: str = ""
+
+
+@dataclass(frozen=True)
+class Exit:
+    """Vehicle leaving the network
+
+    Args:
+        vehid (int): Vehicle id
+        exit (str): Exit of the vehicle
+    """
+
+    vehid: int
+    exit: str = ""
+
+
+@dataclass(frozen=True)
+class Queue:
+    """Vehicles waiting at an entry
+
+    Args:
+        entry (str): Entry id
+        waiting (int): Number of vehicles waiting to enter
+    """
+
+    entry: str
+    waiting: int = 0
+
+
+@dataclass(frozen=True)
+class StepEvents:
+    """Events of a simulation step
+
+    Args:
+        creations (tuple): Vehicles created
+        exits (tuple): Vehicles leaving the network
+        queues (tuple): Vehicles waiting per entry
+    """
+
+    creations: Tuple[Creation, ...] = field(default_factory=tuple)
+    exits: Tuple[Exit, ...] = field(default_factory=tuple)
+    queues: Tuple[Queue, ...] = field(default_factory=tuple)
+
+    @property
+    def queued(self) -> Dict[str, int]:
+        """Vehicles waiting per entry"""
+        return {q.entry: q.waiting for q in self.queues}
@@ -0,0 +1,202 @@
+"""
+Neighbour Table
+===============
+This module computes for every vehicle its neighbours on the same link:
+
+* **leader / follower**: Same lane
+* **left_leader / left_follower**: Left lane (``lane + 1``)
+* **right_leader / right_follower**: Right lane (``lane - 1``)
+
+For each neighbour the table keeps its index, the gap (always positive) and the relative speed (neighbour speed - ego speed). Missing neighbours have index ``-1`` and a ``nan`` gap and speed.
+
+The table is built with a single sort of the vehicles per link and lane and a merge of the queries for adjacent lanes, no pairwise comparison is performed.
+
+Example:
+    Build the table from the vehicle data ::
+
+        >>> from ensemble.component.neighbours import NeighbourTable
+        >>> table = NeighbourTable.build(vehid, link, lane, distance, speed)
+        >>> table.row(vehid=1)["leader"]
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from dataclasses import dataclass, field
+from typing import Dict
+import numpy as np
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+SIDES = {"": 0, "left_": 1, "right_": -1}  # Lane offset per side
+
+
+def _insertion(
+    group: np.ndarray,
+    position: np.ndarray,
+    qgroup: np.ndarray,
+    qposition: np.ndarray,
+) -> np.ndarray:
+    """Insertion index of each query into the data sorted by (group, position). Queries are placed after data at the same key (right side).
+
+    Args:
+        group (np.ndarray): Sorted data groups
+        position (np.ndarray): Sorted data positions within groups
+        qgroup (np.ndarray): Query groups
+        qposition (np.ndarray): Query positions
+
+    Returns:
+        np.ndarray: Insertion index per query
+    """
+    n = len(group)
+    flag = np.concatenate(
+        (np.zeros(n, dtype=int), np.ones(len(qgroup), dtype=int))
+    )
+    order = np.lexsort(
+        (
+            flag,
+            np.concatenate((position, qposition)),
+            np.concatenate((group, qgroup)),
+        )
+    )
+    isdata = order < n
+    before = np.cumsum(isdata) - isdata
+    result = np.empty(len(qgroup), dtype=int)
+    result[order[~isdata] - n] = before[~isdata]
+    return result
+
+
+@dataclass
+class NeighbourTable:
+    """Neighbours of every vehicle on its link. Arrays are aligned with ``vehid``.
+
+    Args:
+        vehid (np.ndarray): Vehicle ids
+        index (dict): Neighbour index per key, -1 when missing
+        gap (dict): Gap towards the neighbour per key [m]
+        dv (dict): Relative speed of the neighbour per key [m/s]
+    """
+
+    vehid: np.ndarray
+    index: Dict[str, np.ndarray] = field(default_factory=dict)
+    gap: Dict[str, np.ndarray] = field(default_factory=dict)
+    dv: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self):
+        return len(self.vehid)
+
+    @classmethod
+    def build(
+        cls,
+        vehid: np.ndarray,
+        link: np.ndarray,
+        lane: np.ndarray,
+        distance: np.ndarray,
+        speed: np.ndarray,
+    ):
+        """Builds the neighbour table
+
+        Args:
+            vehid (np.ndarray): Vehicle ids
+            link (np.ndarray): Link of each vehicle
+            lane (np.ndarray): Lane of each vehicle
+            distance (np.ndarray): Position of each vehicle on its link [m]
+            speed (np.ndarray): Speed of each vehicle [m/s]
+        """
+        vehid = np.asarray(vehid)
+        n = len(vehid)
+        table = cls(vehid)
+        if n == 0:
+            for side in SIDES:
+                for key in (f"{side}leader", f"{side}follower"):
+                    table.index[key] = np.empty(0, dtype=int)
+                    table.gap[key] = np.empty(0)
+                    table.dv[key] = np.empty(0)
+            return table
+
+        distance = np.asarray(distance, dtype=float)
+        speed = np.asarray(speed, dtype=float)
+        lane = np.asarray(lane, dtype=int)
+        _, linkcode = np.unique(np.asarray(link), return_inverse=True)
+        linkcode = linkcode.reshape(-1)
+
+        # Sort per link, lane and position
+        order = np.lexsort((distance, lane, linkcode))
+        slink, slane = linkcode[order], lane[order]
+        spos = distance[order]
+
+        # Groups of (link, lane), consecutive in the sorted order
+        newgroup = np.ones(n, dtype=bool)
+        newgroup[1:] = (slink[1:] != slink[:-1]) | (slane[1:] != slane[:-1])
+        sgroup = np.cumsum(newgroup) - 1
+        gend = np.append(np.flatnonzero(newgroup)[1:], n)
+        glink, glane = slink[newgroup], slane[newgroup]
+
+        # Sorted keys of the (link, lane) groups, lanes padded for offsets
+        lmin, span = lane.min() - 1, lane.max() - lane.min() + 3
+        gkey = glink * span + (glane - lmin)
+
+        for side, offset in SIDES.items():
+            if offset == 0:
+                # Same lane: neighbours in the sorted order
+                qgroup = sgroup
+                ins = np.arange(1, n + 1)
+            else:
+                qkey = slink * span + (slane + offset - lmin)
+                qgroup = np.searchsorted(gkey, qkey)
+                found = qgroup < len(gkey)
+                found[found] = gkey[qgroup[found]] == qkey[found]
+                qgroup = np.where(found, qgroup, -1)
+                ins = _insertion(sgroup, spos, qgroup, spos)
+
+            valid = qgroup >= 0
+            gstart = np.zeros(n, dtype=int)
+            gstop = np.zeros(n, dtype=int)
+            gstart[valid] = np.append(0, gend[:-1])[qgroup[valid]]
+            gstop[valid] = gend[qgroup[valid]]
+
+            lead = np.where(valid & (ins < gstop), ins, -1)
+            follow = ins - 1 if offset else ins - 2
+            follow = np.where(valid & (follow >= gstart), follow, -1)
+
+            keys = (f"{side}leader", lead), (f"{side}follower", follow)
+            for key, sidx in keys:
+                found = sidx >= 0
+                idx = np.full(n, -1, dtype=int)
+                idx[found] = order[sidx[found]]
+                gap = np.full(n, np.nan)
+                dv = np.full(n, np.nan)
+                gap[found] = np.abs(spos[sidx[found]] - spos[found])
+                dv[found] = speed[order][sidx[found]] - speed[order][found]
+
+                # Back to the original order
+                table.index[key] = np.empty(n, dtype=int)
+                table.gap[key] = np.empty(n)
+                table.dv[key] = np.empty(n)
+                table.index[key][order] = idx
+                table.gap[key][order] = gap
+                table.dv[key][order] = dv
+        return table
+
+    def row(self, vehid: int) -> dict:
+        """Neighbours of a single vehicle
+
+        Args:
+            vehid (int): Vehicle id
+
+        Returns:
+            dict: Neighbour vehicle id (or None), gap and relative speed per key
+        """
+        i = int(np.flatnonzero(self.vehid == vehid)[0])
+        result = {}
+        for key, idx in self.index.items():
+            j = idx[i]
+            result[key] = {
+                "vehid": self.vehid[j] if j >= 0 else None,
+                "gap": self.gap[key][i],
+                "dv": self.dv[key][i],
+            }
+        return result
@@ -0,0 +1,144 @@
+"""
+Region of Interest
+==================
+This module selects the vehicles of a simulator frame worth materializing. The selection works on raw columns of the frame, before any type conversion or ``Vehicle`` creation:
+
+* **links**: Vehicles on one of the links
+* **bbox**: Vehicles within the bounding box ``(xmin, ymin, xmax, ymax)``
+* **types**: Vehicles of one of the types
+* **radius**: Platoon vehicles and vehicles closer than ``radius`` to one of them
+
+Links and bounding box restrict the region. Within it, a vehicle is kept when it matches ``types`` or ``radius``, all vehicles are kept when none of both is set.
+
+Example:
+    Keep trucks and cars within communication range of them ::
+
+        >>> from ensemble.component.region import RegionOfInterest
+        >>> roi = RegionOfInterest(radius=100)
+        >>> keep = roi.mask(link, vehtype, x, y)
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Sequence, Tuple
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.tools.constants import DCT_PLT_CONST
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+
+def _isin(values: Sequence[str], accepted: FrozenSet[str]) -> np.ndarray:
+    """Membership of string values, without converting them"""
+    return np.fromiter((v in accepted for v in values), bool, len(values))
+
+
+@dataclass
+class RegionOfInterest:
+    """Selection of the vehicles to materialize from a frame
+
+    Args:
+        links (FrozenSet[str], optional): Links of the region, None for all. Defaults to None.
+        types (FrozenSet[str], optional): Vehicle types kept, None for all. Defaults to None.
+        bbox (Tuple[float], optional): Bounding box ``(xmin, ymin, xmax, ymax)`` [m]. Defaults to None.
+        radius (float, optional): Distance to a platoon vehicle [m], 0 disables it. Defaults to 0.
+        platoon_types (Tuple[str], optional): Platoon vehicle types. Defaults to ``DCT_PLT_CONST["platoon_types"]``.
+    """
+
+    links: Optional[FrozenSet[str]] = None
+    types: Optional[FrozenSet[str]] = None
+    bbox: Optional[Tuple[float, float, float, float]] = None
+    radius: float = 0.0
+    platoon_types: Tuple[str] = DCT_PLT_CONST["platoon_types"]
+
+    def __post_init__(self):
+        if self.links is not None:
+            self.links = frozenset(self.links)
+        if self.types is not None:
+            self.types = frozenset(self.types)
+        if self.bbox is not None:
+            self.bbox = tuple(map(float, self.bbox))
+        self.platoon_types = frozenset(self.platoon_types)
+
+    @property
+    def positional(self) -> bool:
+        """True when vehicle positions are required"""
+        return self.bbox is not None or self.radius > 0
+
+    def mask(
+        self,
+        link: Sequence[str],
+        vehtype: Sequence[str],
+        x: np.ndarray = None,
+        y: np.ndarray = None,
+    ) -> np.ndarray:
+        """Vehicles in the region
+
+        Args:
+            link (Sequence[str]): Link of each vehicle
+            vehtype (Sequence[str]): Type of each vehicle
+            x (np.ndarray, optional): Abscissa of each vehicle, required when ``positional``. Defaults to None.
+            y (np.ndarray, optional): Ordinate of each vehicle, required when ``positional``. Defaults to None.
+
+        Returns:
+            np.ndarray: True for the vehicles to keep
+        """
+        n = len(link)
+        keep = np.ones(n, dtype=bool)
+        if self.links is not None:
+            keep &= _isin(link, self.links)
+        if self.bbox is not None:
+            xmin, ymin, xmax, ymax = self.bbox
+            keep &= (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+        if self.types is None and not self.radius > 0:
+            return keep
+
+        select = np.zeros(n, dtype=bool)
+        if self.types is not None:
+            select |= _isin(vehtype, self.types)
+        if self.radius > 0:
+            platoon = keep & _isin(vehtype, self.platoon_types)
+            select |= platoon
+            select |= self.near(x, y, platoon, keep & ~select)
+        return keep & select
+
+    def near(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        center: np.ndarray,
+        candidate: np.ndarray,
+    ) -> np.ndarray:
+        """Candidates within ``radius`` of a center. Candidates are sorted by abscissa once, each center only checks the window ``x ± radius``.
+
+        Args:
+            x (np.ndarray): Abscissa of each vehicle
+            y (np.ndarray): Ordinate of each vehicle
+            center (np.ndarray): True for the centers
+            candidate (np.ndarray): True for the candidates
+
+        Returns:
+            np.ndarray: True for the candidates close to a center
+        """
+        result = np.zeros(len(x), dtype=bool)
+        index = np.flatnonzero(candidate)
+        if not center.any() or not len(index):
+            return result
+        index = index[np.argsort(x[index], kind="stable")]
+        xs, ys = x[index], y[index]
+        r2 = self.radius**2
+        lo = np.searchsorted(xs, x[center] - self.radius, "left")
+        hi = np.searchsorted(xs, x[center] + self.radius, "right")
+        for cx, cy, a, b in zip(x[center], y[center], lo, hi):
+            close = (xs[a:b] - cx) ** 2 + (ys[a:b] - cy) ** 2 <= r2
+            result[index[a:b][close]] = True
+        return result
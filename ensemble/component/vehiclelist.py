@@ -22,6 +22,7 @@ from itertools import groupby
 
 from ensemble.component.vehicle import Vehicle
 from ensemble.component.platoon_vehicle import PlatoonVehicle
+from ensemble.component.neighbours import NeighbourTable
 from ensemble.tools.constants import DCT_PLT_CONST
 
 from ensemble.logic.frozen_set import SortedFrozenSet
@@ -60,9 +61,9 @@ class VehicleList(SortedFrozenSet, Publisher):
             >>> v2 = Vehicle(simrequest, vehid=2)
             >>> vl.update_list(optional=[v1,v2]) # Adds vehicles to the list
     The list could be eventually updated as an observer but for simplicity reasons it is kept like this.
-    """
 
-    _cumul = set()
+    When the request provides step ``events`` (creations and exits), vehicles are created and released from them. Created vehicles are pending until they appear in the vehicle data. If the resulting number of vehicles does not match the data, e.g. after a fast forward or with a region of interest, the list falls back to comparing vehicle ids. Known vehicle ids are kept per list, so the registries of different requests do not share them.
+    """
 
     def __init__(self, request):
         self._request = request
@@ -73,28 +74,82 @@ class VehicleList(SortedFrozenSet, Publisher):
             for v in request.get_vehicle_data()
         )
         self._free = []
-        self.__class__._cumul = self.__class__._cumul.union(
-            request.get_vehicles_property("vehid")
-        )
+        self._neighbours = None
+        self._pending = set()
+        events = getattr(request, "events", None)
+        if events is not None:
+            present = set(request.get_vehicles_property("vehid"))
+            self._pending.update(
+                e.vehid for e in events.creations if e.vehid not in present
+            )
+        self._cumul = set(request.get_vehicles_property("vehid"))
         SortedFrozenSet.__init__(self, tuple(data))
         Publisher.__init__(self)
 
+    def _create(self, v: dict) -> VehType:
+        """Creates a vehicle from its data, with its leader and follower"""
+        if v.get("vehtype") in PLT_TYPE:
+            veh = PlatoonVehicle(self._request, **v)
+        else:
+            veh = Vehicle(self._request, **v)
+        self._cumul.add(v.get("vehid"))
+        veh.leadid = self.get_leader(veh).vehid
+        veh.followid = self.get_follower(veh).vehid
+        return veh
+
+    def apply_events(self, events) -> bool:
+        """Creates and releases vehicles from the events of the step
+
+        Args:
+            events (StepEvents): Events of the step
+
+        Returns:
+            bool: False when the vehicle ids do not match the data, the list is then left untouched
+        """
+        vehdata = self._request.get_vehicle_data()
+        cumul = self._cumul
+        exits = {e.vehid for e in events.exits}
+        self._pending.update(
+            e.vehid for e in events.creations if e.vehid not in cumul
+        )
+        self._pending.difference_update(exits)
+        leaving = [veh for veh in self._items if veh.vehid in exits]
+        entering = [v for v in vehdata if v.get("vehid") in self._pending]
+        if len(self._items) - len(leaving) + len(entering) != len(vehdata):
+            return False
+        # Same count, e.g. a vehicle left a region of interest as another one came in
+        present = {v.get("vehid") for v in vehdata}
+        staying = (veh.vehid for veh in self._items if veh.vehid not in exits)
+        if not present.issuperset(staying):
+            return False
+
+        for veh in leaving:
+            self.release(veh)
+        newveh = [self._create(v) for v in entering]
+        self._pending.difference_update(v.get("vehid") for v in entering)
+        self._items = SortedFrozenSet(self._items).union(newveh)._items
+        return True
+
     def update_list(self, extra: Iterable[Vehicle] = []):
         """Update vehicle data according to an update in the request."""
+        events = getattr(self._request, "events", None)
+        if extra or events is None or not self.apply_events(events):
+            self.compare_ids(extra)
+
+        # Publish for followers
+        self._neighbours = None
+        self.dispatch()
+        self.update_leaders()
+        self.update_followers()
+
+    def compare_ids(self, extra: Iterable[Vehicle] = []):
+        """Creates vehicles whose id is new and releases vehicles missing from the data"""
         newveh = []
+        vehdata = self._request.get_vehicle_data()
         # Create only new vehicles
-        for v in self._request.get_vehicle_data():
-            if v.get("vehid") not in self.__class__._cumul:
-                if v.get("vehtype") in PLT_TYPE:
-                    newveh.append(PlatoonVehicle(self._request, **v))
-                    self.__class__._cumul.add(v.get("vehid"))
-                else:
-                    newveh.append(Vehicle(self._request, **v))
-                    self.__class__._cumul.add(v.get("vehid"))
-                lead = self.get_leader(newveh[-1])
-                newveh[-1].leadid = lead.vehid
-                follow = self.get_follower(newveh[-1])
-                newveh[-1].followid = follow.vehid
+        for v in vehdata:
+            if v.get("vehid") not in self._cumul:
+                newveh.append(self._create(v))
         data = SortedFrozenSet(self._items).union(newveh)
         data = data.union(extra)
 
@@ -102,19 +157,14 @@ class VehicleList(SortedFrozenSet, Publisher):
         self._items = data._items
 
         # Take out exciting vehicles
-        for veh in self._items:
-            if veh.vehid not in self._request.get_vehicles_property(
-                "vehid"
-            ) and not bool(
+        present = {v.get("vehid") for v in vehdata}
+        self._pending.difference_update(present)
+        for veh in tuple(self._items):
+            if veh.vehid not in present and not bool(
                 extra
             ):  # extra arguments
                 self.release(veh)
 
-        # Publish for followers
-        self.dispatch()
-        self.update_leaders()
-        self.update_followers()
-
     def release(self, veh: VehType):
         """Moves a vehicle to a free list so that it is not considered in the
 
@@ -122,7 +172,7 @@ class VehicleList(SortedFrozenSet, Publisher):
             r (VehType): Vehicle object
         """
         self._items.remove(veh)
-        self.__class__._cumul.remove(veh.vehid)
+        self._cumul.remove(veh.vehid)
         self._free.append(veh)
 
     def _get_vehicles_attribute(self, attribute: str) -> pd.Series:
@@ -181,6 +231,19 @@ class VehicleList(SortedFrozenSet, Publisher):
         """Returns all leader vehicle's vehid"""
         return self._get_vehicles_attribute("leadid")
 
+    @property
+    def neighbours(self) -> NeighbourTable:
+        """Neighbour table of the vehicles, aligned with the internal vehicle order. Built once per update of the list."""
+        if self._neighbours is None:
+            self._neighbours = NeighbourTable.build(
+                [v.vehid for v in self._items],
+                [v.link for v in self._items],
+                [v.lane for v in self._items],
+                [v.distance for v in self._items],
+                [v.speed for v in self._items],
+            )
+        return self._neighbours
+
     def distance_filter(
         self,
         ego: Vehicle,
@@ -261,7 +324,8 @@ class VehicleList(SortedFrozenSet, Publisher):
 
         distances = np.asarray(list(candidates.values()))
         idx = distances.argmin()
-        leader = self[list(candidates.keys())[idx]]
+        closest = list(candidates.keys())[idx]
+        leader = [v for v in self._items if v.vehid == closest][0]
 
         ego.leadid = leader.vehid
         return leader
@@ -318,7 +382,8 @@ class VehicleList(SortedFrozenSet, Publisher):
 
         distances = np.asarray(list(candidates.values()))
         idx = distances.argmin()
-        follower = self[list(candidates.keys())[idx]]
+        closest = list(candidates.keys())[idx]
+        follower = [v for v in self._items if v.vehid == closest][0]
 
         ego.followid = follower.vehid
         return follower
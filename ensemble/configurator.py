@@ -24,12 +24,18 @@ from ensemble.tools.constants import (
 )
 from ensemble.handler.symuvia import SymuviaConnector, SymuviaScenario
 from ensemble.handler.vissim.connector import VissimConnector, VissimScenario
+from ensemble.handler.replay import ReplayConnector
+from ensemble.handler.synthetic import SyntheticConnector
 
 # from ensemble.control.governor import MultiBrandPlatoonRegistry
 from ensemble.component.vehiclelist import VehicleList
+from ensemble.component.region import RegionOfInterest
+from ensemble.tools.archive import FrameArchive
 from ensemble.control.tactical.gapcordinator import GlobalGapCoordinator
+from ensemble.control.tactical.monitor import SafetyMonitor
 from ensemble.tools.screen import log_success, log_verify, log_warning
 from ensemble.control.operational import CACC
+from ensemble.control.operational.executor import OperationalExecutor
 
 # ============================================================================
 # CLASS AND DEFINITIONS
@@ -59,6 +65,21 @@ class Configurator:
 
     simulation_parameters (dict):
         List of simulatio parameters. Check ``constants`` module for more information
+
+    profile (str):
+        Path prefix of the profile exports, empty to disable profiling
+
+    metrics_port (int):
+        Port of the live metrics endpoint, 0 to disable it
+
+    record (str):
+        Folder of the trajectory recording, empty to disable it
+
+    archive (str):
+        Path of the raw frame archive, empty to disable it
+
+    memory (str):
+        Path prefix of the memory report, empty to disable memory sampling
     """
 
     verbose: bool = False
@@ -67,6 +88,11 @@ class Configurator:
     simulation_platform: str = ""
     library_path: str = ""
     sim_steps: int = 0
+    profile: str = ""
+    metrics_port: int = 0
+    record: str = ""
+    archive: str = ""
+    memory: str = ""
 
     def __init__(self, **kwargs) -> None:
         """Configurator class for containing specific simulator parameter
@@ -97,12 +123,13 @@ class Configurator:
 
         self.scenario_files = []
         self.simulation_parameters = DCT_RUNTIME_PARAM
+        self.scheduler = None
 
     def set_simulation_platform(self, simulation_platform: str = "") -> None:
         """A simpler setter for the simulation platform based on OS
 
         Args:
-            simulation_platform (str): "symuvia" or "vissim", defaults to ""
+            simulation_platform (str): "symuvia", "vissim", "replay" or "synthetic", defaults to ""
         """
         if simulation_platform:
             self.simulation_platform = simulation_platform
@@ -158,19 +185,98 @@ class Configurator:
                 f"\t{self.sim_steps}",
             )
 
+        if kwargs.get("profile"):
+            self.profile = kwargs.get("profile")
+
+            log_verify("Profiling the simulation into:", f"\t{self.profile}")
+
+        if kwargs.get("metrics_port"):
+            self.metrics_port = kwargs.get("metrics_port")
+
+        if kwargs.get("record"):
+            self.record = kwargs.get("record")
+
+            log_verify("Recording trajectories into:", f"\t{self.record}")
+
+        if kwargs.get("archive"):
+            self.archive = kwargs.get("archive")
+
+            log_verify("Archiving raw frames into:", f"\t{self.archive}")
+
+        if kwargs.get("memory"):
+            self.memory = kwargs.get("memory")
+
+            log_verify("Sampling memory into:", f"\t{self.memory}")
+
+        if kwargs.get("memory_interval"):
+            self.simulation_parameters = {
+                **self.simulation_parameters,
+                "memory_interval": kwargs.get("memory_interval"),
+            }
+
+        if kwargs.get("fast_forward"):
+            self.simulation_parameters = {
+                **self.simulation_parameters,
+                "fast_forward": True,
+                "fast_forward_until": kwargs.get("fast_forward_until", 0),
+            }
+
+            log_verify("Fast forward until a platoon vehicle is found")
+
+        if kwargs.get("pipelined"):
+            self.simulation_parameters = {
+                **self.simulation_parameters,
+                "pipelined": True,
+            }
+
+            log_verify("Pipelined simulator steps, control lags one step")
+
     def load_socket(self):
-        """Determines simulation platform to connect"""
+        """Determines simulation platform to connect. A connector already set is reused, so the simulator library is loaded once for several scenarios."""
         if self.simulation_platform == "symuvia":
-            self.connector = SymuviaConnector(
-                library_path=self.library_path,
-                step_launch_mode="traj",
-                write_xml=True,
-            )
-        else:
+            if getattr(self, "connector", None) is None:
+                self.connector = SymuviaConnector(
+                    library_path=self.library_path,
+                    step_launch_mode="traj",
+                    write_xml=True,
+                )
+            self.connector.pipelined = self.pipelined
+            if self.archive:
+                self.connector.archive = FrameArchive(self.archive, "w")
+            roi = self.simulation_parameters.get("region_of_interest")
+            self.connector.roi = RegionOfInterest(**roi) if roi else None
+        elif self.simulation_platform == "replay":
+            if getattr(self, "connector", None) is None:
+                self.connector = ReplayConnector()
+            roi = self.simulation_parameters.get("region_of_interest")
+            self.connector.roi = RegionOfInterest(**roi) if roi else None
+        elif self.simulation_platform == "synthetic":
+            if getattr(self, "connector", None) is None:
+                self.connector = SyntheticConnector()
+            self.connector.total_steps = self.total_steps or 0
+            roi = self.simulation_parameters.get("region_of_interest")
+            self.connector.roi = RegionOfInterest(**roi) if roi else None
+        elif getattr(self, "connector", None) is None:
             self.connector = VissimConnector(library_path=self.library_path)
+        for key in ("fast_forward", "fast_forward_until", "probe_interval"):
+            if key in self.simulation_parameters:
+                setattr(self.connector, key, self.simulation_parameters[key])
+
+    def close_connector(self):
+        """Waits for the simulator step running in background if any and closes the frame archive"""
+        connector = getattr(self, "connector", None)
+        if connector is not None and hasattr(connector, "drain"):
+            connector.drain()
+        archive = getattr(connector, "archive", None)
+        if archive is not None:
+            archive.close()
+            connector.archive = None
 
     def load_scenario(self):
         self.scenario_files = tuple(self.scenario_files)
+        if self.simulation_platform in ("replay", "synthetic"):
+            self.connector.load_scenario(self.scenario_files[0])
+            return
         if self.simulation_platform == "symuvia":
             scenario = SymuviaScenario.create_input(
                 *self.scenario_files
@@ -186,22 +292,71 @@ class Configurator:
     def query_data(self):
         """Queries data from the simulator and updates vehicle list"""
         self.connector.query_data()
+        if self.scheduler is not None:
+            self.scheduler.tick("simulator", self.simulation_time)
 
     def create_platoon_registry(self):
         """Creates a platoon registry for all coordinators (FGC-RGC)"""
         self.platoon_registry = GlobalGapCoordinator(self.vehicle_registry)
         self.initialize_operational_layer()
+        if self.simulation_parameters.get("safety_monitor", False):
+            monitor = SafetyMonitor()
+            self.platoon_registry.monitor = monitor
+            self.platoon_registry.listeners.append(monitor.on_event)
 
     def initialize_operational_layer(self):
-        """Initialize the Operational layer"""
+        """Initialize the Operational layer. When ``operational_workers`` is set the vehicles are evolved across worker processes."""
         self.platoon_registry.cacc = CACC()
+        workers = self.simulation_parameters.get("operational_workers", 0)
+        if workers:
+            self.platoon_registry.executor = OperationalExecutor(
+                self.platoon_registry.cacc, workers=workers
+            )
 
     def update_platoon_registry(self):
-        """Updates the platoon vehicle registry and the tactical layer"""
-        if hasattr(self, "platoon_registry"):
+        """Updates the platoon vehicle registry and the tactical layer. When a scheduler is attached the tactical layer is solved at its own sampling time and platoon states are held in between."""
+        if not self.simulation_parameters.get("tactical", True):
+            return
+        if not hasattr(self, "platoon_registry"):
+            self.create_platoon_registry()
+            return
+        if self.scheduler is None:
             self.platoon_registry.update_platoons()
             return
-        self.create_platoon_registry()
+        tactical = self.scheduler.is_due("tactical", self.simulation_time)
+        self.platoon_registry.update_platoons(tactical=tactical)
+        if tactical:
+            self.scheduler.tick("tactical", self.simulation_time)
+
+    def update_operational_layer(self):
+        """Applies the operational layer, all operational steps within the current simulator step are computed in a single batch. Nothing is done until the platoon registry exists."""
+        if not self.simulation_parameters.get("operational", True):
+            return
+        if getattr(self, "platoon_registry", None) is None:
+            return
+        time = self.simulation_time
+        if self.scheduler is None:
+            self.platoon_registry.apply_cacc(time)
+            return
+        self.scheduler.run(
+            "operational",
+            time,
+            self.platoon_registry.apply_cacc,
+            time,
+            self.scheduler["operational"].period,
+        )
+
+    def close_operational_layer(self):
+        """Releases the operational workers if any"""
+        registry = getattr(self, "platoon_registry", None)
+        if registry is not None and registry.executor is not None:
+            registry.executor.close()
+
+    def update_safety_monitor(self):
+        """Adds the surrogate safety indicators of the current step to the monitor if any"""
+        registry = getattr(self, "platoon_registry", None)
+        if registry is not None and registry.monitor is not None:
+            registry.monitor.update(registry.vgcs(), self.simulation_time)
 
     def update_traffic_state(self):
         """Update the vehicle list and the platoon corresponding vehicle state"""
@@ -219,9 +374,27 @@ class Configurator:
             else self.simulation_parameters.get("total_steps")
         )
 
+    @property
+    def pipelined(self) -> bool:
+        """Simulator steps overlap the control with a one step lag, closed-loop control forces synchronous steps"""
+        if not self.simulation_parameters.get("pipelined", False):
+            return False
+        if self.simulation_parameters.get("closed_loop", False):
+            log_warning("\tClosed-loop control, simulator steps are synchronous")
+            return False
+        return True
+
     @property
     def vehicle_registry(self):
         return self.connector.request.vehicle_registry
 
+    @property
+    def simulation_time(self) -> float:
+        """Current simulation time [s]"""
+        return (
+            self.connector.simulation_step
+            * self.simulation_parameters["sampling_time"]
+        )
+
 if __name__ == "__main__":
     Configurator()
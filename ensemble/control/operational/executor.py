@@ -0,0 +1,396 @@
+"""
+Operational Executor
+====================
+This module implements an executor to evolve the operational layer of all the vehicle gap coordinators, either serially or in parallel across worker processes.
+
+Coordinators are partitioned into independent groups: a group is a connected component of the leader relationships so that no vehicle reads the state of a vehicle in another group during the operational step. Groups are assigned to workers by size and the per vehicle data is exchanged through a shared memory block:
+
+* **inputs**: initial state, leader initial state, identifiers and controls, local leader index and the reference chunk
+* **outputs**: state and control at each operational step
+
+The serial and the parallel modes call the same kernel over the same data, results are bitwise identical.
+
+Example:
+    Evolve the operational layer with 4 worker processes ::
+
+        >>> from ensemble.control.operational import CACC
+        >>> from ensemble.control.operational.executor import OperationalExecutor
+        >>> with OperationalExecutor(CACC(), workers=4) as executor:
+        ...     executor(platoon_registry.iter_group_link(group=True), time, 0.1)
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from typing import Iterable, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.metaclass.controller import AbsController
+from ensemble.metaclass.dynamics import AbsDynamics
+from ensemble.tools.constants import DCT_RUNTIME_PARAM
+from ensemble.tools.exceptions import EnsembleAPIError
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+TIME_STEP_OP = DCT_RUNTIME_PARAM["sampling_time_operational"]
+
+# Fixed columns per vehicle: state0 (3), lead0 (3), ids & controls (4), leader (1)
+NFIXED = 11
+
+_CONTROLLER = None  # Worker controller
+_SEGMENTS = {}  # Worker attached shared memory blocks
+
+
+def layout(nsteps: int) -> dict:
+    """Column slices of the shared block for ``nsteps`` operational steps
+
+    Args:
+        nsteps (int): Number of operational steps within a simulator step
+
+    Returns:
+        dict: Column slice per field
+    """
+    rs, ss = NFIXED, NFIXED + 3 * nsteps
+    return {
+        "state0": slice(0, 3),
+        "lead0": slice(3, 6),
+        "scalars": slice(6, 10),
+        "leader": slice(10, 11),
+        "reference": slice(rs, ss),
+        "states": slice(ss, ss + 3 * nsteps),
+        "controls": slice(ss + 3 * nsteps, ss + 4 * nsteps),
+    }
+
+
+def views(block: np.ndarray, nsteps: int) -> dict:
+    """Named views over the rows of a shared block"""
+    fields = {key: block[:, cols] for key, cols in layout(nsteps).items()}
+    n = len(block)
+    fields["reference"] = fields["reference"].reshape(n, nsteps, 3)
+    fields["states"] = fields["states"].reshape(n, nsteps, 3)
+    fields["leader"] = fields["leader"].reshape(n)
+    return fields
+
+
+def evolve_block(
+    controller: AbsController,
+    dynamics: List[AbsDynamics],
+    data: dict,
+    time_step: float,
+) -> None:
+    """Kernel evolving the operational layer for a group of vehicles stored in processing order. The outputs ``states`` and ``controls`` are written in place.
+
+    The leader state read at each operational step follows the serial semantics: the current state when the vehicle is its own leader, the final state when the leader was processed before and the initial state otherwise.
+
+    Args:
+        controller (AbsController): Operational controller with a ``single_call_control`` method
+        dynamics (List[AbsDynamics]): Dynamics per vehicle
+        data (dict): Views of the group rows, check ``views``
+        time_step (float): Operational sampling time
+    """
+    state0, lead0 = data["state0"], data["lead0"]
+    states, controls = data["states"], data["controls"]
+    for i, reference in enumerate(data["reference"]):
+        j = int(data["leader"][i])
+        ego_id, lead_id, ego_u, lead_u = data["scalars"][i]
+        ego_id, lead_id = int(ego_id), int(lead_id)
+        state = state0[i].copy()
+        for k, r in enumerate(reference):
+            if j == i:
+                lstate = state
+            elif 0 <= j < i:
+                lstate = states[j, -1]
+            else:
+                lstate = lead0[i]
+            leader = {
+                "id": lead_id,
+                "x": lstate[0],
+                "v": lstate[1],
+                "a": lstate[2],
+                "u": lead_u,
+            }
+            ego = {
+                "id": ego_id,
+                "x": state[0],
+                "v": state[1],
+                "a": state[2],
+                "u": ego_u,
+            }
+            r_dct = {"t": r[0], "g_cacc": r[1], "g_acc": r[1], "v": r[2]}
+            control = controller.single_call_control(
+                leader, ego, r_dct, r_dct.get("t", 1), time_step
+            )
+            state = np.array(dynamics[i](state, np.array([control])))
+            states[i, k] = state
+            controls[i, k] = control
+
+
+def partition(vgcs: Iterable) -> List[list]:
+    """Partitions coordinators into independent groups following the leader relationships. Each group keeps the processing order.
+
+    Args:
+        vgcs (Iterable): Vehicle gap coordinators in processing order
+
+    Returns:
+        List[list]: Groups of coordinators
+    """
+    vgcs = list(vgcs)
+    parent = {vgc.vehid: vgc.vehid for vgc in vgcs}
+
+    def find(key):
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    for vgc in vgcs:
+        if vgc.leader.vehid in parent:
+            parent[find(vgc.vehid)] = find(vgc.leader.vehid)
+
+    groups = {}
+    for vgc in vgcs:
+        groups.setdefault(find(vgc.vehid), []).append(vgc)
+    return list(groups.values())
+
+
+def balance(sizes: List[int], workers: int) -> List[List[int]]:
+    """Assigns groups to workers, largest group first on the less loaded worker
+
+    Args:
+        sizes (List[int]): Number of vehicles per group
+        workers (int): Number of workers
+
+    Returns:
+        List[List[int]]: Group indices per worker
+    """
+    loads = [0] * workers
+    assignment = [[] for _ in range(workers)]
+    for idx in sorted(range(len(sizes)), key=lambda i: -sizes[i]):
+        w = loads.index(min(loads))
+        assignment[w].append(idx)
+        loads[w] += sizes[idx]
+    return [sorted(a) for a in assignment if a]
+
+
+def dynamics_state(dynamics: AbsDynamics) -> dict:
+    """Picklable internal state of a dynamics object"""
+    return {k: v for k, v in vars(dynamics).items() if k != "lib"}
+
+
+def _init_worker(controller: AbsController) -> None:
+    """Worker initializer, keeps the controller for all the tasks"""
+    global _CONTROLLER
+    _CONTROLLER = controller
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attaches a shared memory block from the worker, former blocks are closed"""
+    if name not in _SEGMENTS:
+        for shm in _SEGMENTS.values():
+            shm.close()
+        _SEGMENTS.clear()
+        _SEGMENTS[name] = shared_memory.SharedMemory(name=name)
+    return _SEGMENTS[name]
+
+
+def _run_task(
+    name: str,
+    shape: Tuple[int, int],
+    nsteps: int,
+    bounds: List[Tuple[int, int]],
+    dynamics: List[list],
+    time_step: float,
+) -> List[list]:
+    """Worker task evolving a set of groups stored in the shared block"""
+    shm = _attach(name)
+    block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    result = []
+    for (start, stop), dyn in zip(bounds, dynamics):
+        data = views(block[start:stop], nsteps)
+        evolve_block(_CONTROLLER, dyn, data, time_step)
+        result.append([dynamics_state(d) for d in dyn])
+    return result
+
+
+class OperationalExecutor:
+    """This class evolves the operational layer over all vehicle gap coordinators.
+
+    Args:
+        controller (AbsController): Operational controller
+        workers (int, optional): Number of worker processes, 0 runs serially. Defaults to 0.
+    """
+
+    def __init__(self, controller: AbsController, workers: int = 0):
+        self.controller = controller
+        self.workers = workers
+        self._pool = None
+        self._shm = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(workers={self.workers})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def parallel(self) -> bool:
+        """True when the groups are evolved in worker processes"""
+        return self.workers > 0
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """Process pool, created on first use"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.controller,),
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Shuts down the workers and releases the shared memory"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def allocate(self, shape: Tuple[int, int]) -> np.ndarray:
+        """Shared block of at least ``shape``, reused while it fits"""
+        nbytes = int(np.prod(shape)) * np.dtype(np.float64).itemsize
+        if not self.parallel:
+            return np.zeros(shape)
+        if self._shm is None or self._shm.size < nbytes:
+            if self._shm is not None:
+                self._shm.close()
+                self._shm.unlink()
+            self._shm = shared_memory.SharedMemory(
+                create=True, size=max(nbytes, 1)
+            )
+        return np.ndarray(shape, dtype=np.float64, buffer=self._shm.buf)
+
+    @staticmethod
+    def gather(vgcs: list, references: list, data: dict) -> None:
+        """Fills the input views for a group of coordinators
+
+        Args:
+            vgcs (list): Group of coordinators in processing order
+            references (list): Reference chunk per coordinator
+            data (dict): Views of the group rows
+        """
+        index = {vgc.vehid: i for i, vgc in enumerate(vgcs)}
+        for i, vgc in enumerate(vgcs):
+            data["state0"][i] = vgc.last_state
+            data["lead0"][i] = vgc.leader.last_state
+            data["scalars"][i] = (
+                vgc.vehid,
+                vgc._ctr_lead_data["id"],
+                vgc.control,
+                vgc.leader.control,
+            )
+            data["leader"][i] = index.get(vgc.leader.vehid, -1)
+            data["reference"][i] = references[i]
+
+    @staticmethod
+    def scatter(vgcs: list, data: dict) -> None:
+        """Writes back the outputs of a group into the coordinators histories. The operational data of the coordinators is left as after a serial evolution.
+
+        Args:
+            vgcs (list): Group of coordinators in processing order
+            data (dict): Views of the group rows
+        """
+        for i, vgc in enumerate(vgcs):
+            states, controls = data["states"][i], data["controls"][i]
+            reference = data["reference"][i]
+            nsteps = len(states)
+            last = 0
+            for k in range(max(nsteps - 2, 0), nsteps):
+                if k > last:
+                    vgc.history_state = states[last:k]
+                    last = k
+                vgc.get_step_data()
+            vgc.history_state = states[last:]
+            vgc.history_control = controls.reshape(-1, 1)
+            vgc.history_reference = reference[:, [0, 2, 1]]
+
+    def __call__(
+        self,
+        vgcs: Iterable,
+        time: float,
+        time_step: float = TIME_STEP_OP,
+    ) -> None:
+        """Evolves the operational layer of all coordinators over a simulator step
+
+        Args:
+            vgcs (Iterable): Vehicle gap coordinators in processing order
+            time (float): Simulation time at the beginning of the simulator step
+            time_step (float, optional): Operational sampling time. Defaults to TIME_STEP_OP.
+        """
+        groups = partition(vgcs)
+        if not groups:
+            return
+
+        # Consumes the reference chunk of the simulator step
+        references = [
+            [np.array(list(vgc.reference)).reshape(-1, 3) for vgc in group]
+            for group in groups
+        ]
+        nsteps = len(references[0][0])
+        if any(len(r) != nsteps for refs in references for r in refs):
+            raise EnsembleAPIError(
+                "Reference chunks of different length within a simulator step"
+            )
+
+        nrows = sum(len(g) for g in groups)
+        shape = (nrows, NFIXED + 7 * nsteps)
+        block = self.allocate(shape)
+
+        bounds, start = [], 0
+        for group, refs in zip(groups, references):
+            bounds.append((start, start + len(group)))
+            rows = views(block[start : start + len(group)], nsteps)
+            self.gather(group, refs, rows)
+            start += len(group)
+
+        dynamics = [[vgc.ego.dynamics for vgc in group] for group in groups]
+
+        if self.parallel:
+            tasks = balance([len(g) for g in groups], self.workers)
+            futures = [
+                self.pool.submit(
+                    _run_task,
+                    self._shm.name,
+                    shape,
+                    nsteps,
+                    [bounds[i] for i in task],
+                    [dynamics[i] for i in task],
+                    time_step,
+                )
+                for task in tasks
+            ]
+            for task, future in zip(tasks, futures):
+                for i, states in zip(task, future.result()):
+                    for dyn, state in zip(dynamics[i], states):
+                        vars(dyn).update(state)
+        else:
+            for (start, stop), dyn in zip(bounds, dynamics):
+                data = views(block[start:stop], nsteps)
+                evolve_block(self.controller, dyn, data, time_step)
+
+        for (start, stop), group in zip(bounds, groups):
+            self.scatter(group, views(block[start:stop], nsteps))
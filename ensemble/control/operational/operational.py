@@ -245,6 +245,15 @@ class CACC(AbsController):
         """Loads the control library into the controller"""
         self.lib = cdll.LoadLibrary(path_library)
 
+    def __getstate__(self):
+        """Pickles the controller without the loaded library"""
+        return {k: v for k, v in self.__dict__.items() if k != "lib"}
+
+    def __setstate__(self, state):
+        """Restores the controller and reloads the library"""
+        self.__dict__.update(state)
+        self.load_library(self._path_library)
+
 
 if __name__ == "__main__":
     c = CACC()
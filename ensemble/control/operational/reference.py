@@ -61,7 +61,13 @@ class ReferenceHeadway:
 
     def __iter__(self):
         self.count = 0
-        self.chunk_space = iter(next(self.chunks_space))
+        try:
+            chunk = next(self.chunks_space)
+        except StopIteration:
+            # Horizon consumed, the reference is extended in the same state
+            self.create_time_gap_hwy(self._state)
+            chunk = next(self.chunks_space)
+        self.chunk_space = iter(chunk)
         self.chunk_speed = iter(next(self.chunks_speed))
         self.time_running = iter(next(self.time_chunks))
         return self
@@ -86,6 +92,7 @@ class ReferenceHeadway:
             Iterable: Iterable array containing time gap values.
         """
 
+        self._state = state
         self.horizon = np.arange(0, self.interval, self.time_step)
 
         if isinstance(state, Platooning) or isinstance(state, Joining):
@@ -10,11 +10,13 @@
 # ============================================================================
 
 from typing import Iterable
+from collections import deque
 import pandas as pd
 import networkx as nx
 from itertools import groupby
 from dataclasses import dataclass, asdict
 from itertools import chain
+from bisect import bisect_right
 
 
 # ============================================================================
@@ -22,15 +24,28 @@ from itertools import chain
 # ============================================================================
 
 from ensemble.component.vehiclelist import EMPTY_MESSAGE, VehicleList
-from ensemble.logic.platoon_set import PlatoonSet
+from ensemble.logic.platoon_set import (
+    PlatoonSet,
+    PlatoonEvent,
+    PlatoonIdAllocator,
+    CREATED,
+    MERGED,
+    SPLIT,
+    DISSOLVED,
+)
 from ensemble.logic.subscriber import Subscriber
 from ensemble.control.tactical.vehcoordinator import (
     VehGapCoordinator,
     MAXNDST,
+    MAXTRKS,
     PLT_TYP,
+    TIME_STEP_OP,
 )
+from ensemble.control.tactical.solver import solve_states
 from ensemble.metaclass.controller import AbsController
 from ensemble.tools.screen import log_in_terminal
+from ensemble.tools.profiler import PROFILER
+from ensemble.tools.constants import DCT_PLT_CONST
 
 # ============================================================================
 # CLASS AND DEFINITIONS
@@ -38,6 +53,9 @@ from ensemble.tools.screen import log_in_terminal
 
 EMPTY_MESSAGE = "\tNo platoons have been registered"
 
+MAXFREE = DCT_PLT_CONST["max_released_coordinators"]
+MAXEVNT = DCT_PLT_CONST["max_platoon_events"]
+
 
 @dataclass
 class GlobalGapCoordinator(Subscriber):
@@ -45,7 +63,16 @@ class GlobalGapCoordinator(Subscriber):
         self._gcnet = nx.DiGraph()
         super().__init__(vehicle_registry)
         self.platoon_sets = {}
-        self.free_gcs = []
+        self.platoon_events = deque(maxlen=MAXEVNT)
+        self.listeners = []
+        self.free_gcs = deque(maxlen=MAXFREE)
+        self._pids = PlatoonIdAllocator()
+        self._unsolved = set()
+        self._unformed = {}
+        self._updates = 0
+        self.skipped = 0
+        self.executor = None
+        self.monitor = None
         self.update_platoons()
 
     # =========================================================================
@@ -137,10 +164,17 @@ class GlobalGapCoordinator(Subscriber):
             self._gcnet.add_node(vgc.ego.vehid, vgc=vgc)
             self[vgc.ego.vehid].init_reference()
             self.update_leader(vgc)
+            self._unsolved.add(vgc.ego.vehid)
+            self._unformed[vgc.ego.vehid] = None
 
     def release_gapcoordinator(self, vgc: VehGapCoordinator):
-        """Releases a single gap coordinator from the node list"""
+        """Releases a single gap coordinator from the node list. Its followers lose their leader."""
+        for vehid in self._gcnet.predecessors(vgc.ego.vehid):
+            if self[vehid].leader is vgc:
+                self[vehid].leader = None
         self._gcnet.remove_node(vgc.ego.vehid)
+        self._unsolved.discard(vgc.ego.vehid)
+        self._unformed.pop(vgc.ego.vehid, None)
         self.free_gcs.append(vgc)
 
     def update_leader(self, vgc: VehGapCoordinator):
@@ -160,10 +194,44 @@ class GlobalGapCoordinator(Subscriber):
         for vgc in self.iter_group_link(downtoup=True, group=True):
             self.update_leader(vgc)
 
-    def update_states(self):
-        """Update platoon state according to current information"""
-        for vgc in self.iter_group_link(downtoup=True, group=True):
-            vgc.status = vgc.solve_state()
+    def update_intruders(self):
+        """Flags coordinators with a non platoon vehicle between them and their leader. The immediate same lane leader is read from the neighbour table of the vehicle registry, check ``NeighbourTable``."""
+        table = self._publisher.neighbours
+        items = self._publisher._items
+        lead, gap = table.index["leader"], table.gap["leader"]
+        row = {vehid: i for i, vehid in enumerate(table.vehid)}
+        for vgc in self.vgcs():
+            i = row.get(vgc.vehid, -1)
+            j = lead[i] if i >= 0 else -1
+            vgc.intruder = bool(
+                j >= 0
+                and vgc.leader is not vgc
+                and items[j].vehid != vgc.leader.vehid
+                and items[j].vehtype not in PLT_TYP
+                and gap[i] < vgc.dx
+            )
+
+    def update_states(self, unsolved: bool = False):
+        """Update platoon state according to current information. All transitions are solved at once, check ``solver``. Coordinators in a stable state whose inputs did not change are skipped, their number is kept in ``skipped``.
+
+        Args:
+            unsolved (bool, optional): Solves only coordinators that have never been solved. The update counter and ``skipped`` are kept, they follow tactical updates. Defaults to False.
+        """
+        vgcs = [
+            vgc
+            for vgc in self.iter_group_link(downtoup=True, group=True)
+            if not unsolved or vgc.ego.vehid in self._unsolved
+        ]
+        if not unsolved:
+            self._updates += 1
+            self.skipped = 0
+        for vgc, state in zip(vgcs, solve_states(vgcs, self._updates)):
+            if state is None:
+                self.skipped += 1
+                continue
+            vgc.status = vgc.apply_state(state)
+            vgc.mark_evaluated(self._updates)
+        self._unsolved.clear()
 
     def iter_group_link(self, downtoup=True, group=False):
         """Iteratorator by link ordered from largest ttd towards smaller
@@ -189,38 +257,148 @@ class GlobalGapCoordinator(Subscriber):
                 yield group_gc
 
     def create_platoon_sets(self):
-        """Create all platoons subsets"""
-        converter = lambda x: x[1].get("vgc")
-        for vgc in self.iter_group_link(downtoup=True, group=True):
-            if not vgc.platoon:
-                if vgc.leader.ego == vgc.ego or vgc.ego in PLT_TYP:
-                    # Head
-                    ps = PlatoonSet((vgc,))
-                    self.platoon_sets[ps.platoonid] = ps
-                    vgc.positionid = len(ps) - 1
+        """Create all platoons subsets.
+
+        Coordinators not yet in a platoon are placed in a single pass from downstream to upstream: a coordinator joins the platoon of its leader from behind when joinable and the platoon has room, otherwise it heads a new platoon. Members are gathered in ordered lists and only the platoons that changed are rebuilt at the end of the pass.
+        """
+        members = {}
+
+        def ordered(platoonid):
+            # Members sorted from tail to head
+            if platoonid not in members:
+                platoon = self.platoon_sets.get(platoonid, ())
+                members[platoonid] = sorted(platoon, key=lambda x: x.x)
+            return members[platoonid]
+
+        def create(vgc):
+            platoonid = self._pids.allocate()
+            members[platoonid] = [vgc]
+            touched.add(platoonid)
+            created.append(platoonid)
+            return platoonid
+
+        touched, created = set(), []
+        unformed = sorted(
+            (self[vehid] for vehid in self._unformed),
+            key=lambda x: x.ego.ttd,
+            reverse=True,
+        )
+        for vgc in unformed:
+            if vgc.leader.ego == vgc.ego:
+                # Head
+                vgc.platoonid = create(vgc)
+            elif vgc.leader.platoon and (
+                vgc.leader.platoonid in self.platoon_sets
+                or vgc.leader.platoonid in touched
+            ):
+                # Try join from behind
+                platoonid = vgc.leader.platoonid
+                platoon = ordered(platoonid)
+                if len(platoon) + 1 < MAXTRKS and vgc.joinable:
+                    keys = [x.x for x in platoon]
+                    platoon.insert(bisect_right(keys, vgc.x), vgc)
+                    vgc.platoonid = platoonid
+                    touched.add(platoonid)
                 else:
-                    # Try join from behind
-
-                    # Retrieve id of leader
-                    lps = self.platoon_sets[vgc.leader.platoonid]
-                    nwps = PlatoonSet((vgc,))
-                    jps = lps + nwps
-
-                    if isinstance(jps, tuple):
-                        # This means back was refused
-                        self.platoon_sets[jps[1].platoonid] = jps[1]
-                        vgc.positionid = len(jps[1]) - 1
-                    else:
-                        self.platoon_sets[vgc.leader.platoonid] = jps
-                        PlatoonSet.set_pid(
-                            nwps.platoonid
-                        )  # Retrieves former id
-                        vgc.positionid = len(jps) - 1
-                vgc.platoon = True
-
-    def update_platoons(self):
+                    # This means back was refused
+                    vgc.platoonid = create(vgc)
+            else:
+                vgc.platoonid = create(vgc)
+            vgc.positionid = len(members[vgc.platoonid]) - 1
+            vgc.platoon = True
+        self._unformed.clear()
+
+        for platoonid in touched:
+            self.platoon_sets[platoonid] = PlatoonSet.from_ordered(
+                members[platoonid], id=platoonid
+            )
+        for platoonid in created:
+            self.notify(CREATED, platoonid)
+
+    # =========================================================================
+    # PLATOON LIFECYCLE
+    # =========================================================================
+
+    def notify(self, kind: str, platoonid: int, source: int = -1):
+        """Registers a platoon lifecycle event and passes it to the ``listeners``"""
+        platoon = self.platoon_sets.get(platoonid, ())
+        members = tuple(vgc.vehid for vgc in platoon)
+        event = PlatoonEvent(kind, platoonid, members, source)
+        self.platoon_events.append(event)
+        for listener in self.listeners:
+            listener(event)
+
+    def set_platoon(self, members: list, platoonid: int) -> PlatoonSet:
+        """Registers a platoon from its members sorted from tail to head and updates their positions"""
+        platoon = PlatoonSet.from_ordered(members, id=platoonid)
+        for position, vgc in enumerate(reversed(members)):
+            vgc.positionid = position
+            vgc.dirty = True
+        self.platoon_sets[platoonid] = platoon
+        return platoon
+
+    def dissolve_platoon(self, platoonid: int):
+        """Removes a platoon from the registry and releases its id"""
+        self.notify(DISSOLVED, platoonid)
+        del self.platoon_sets[platoonid]
+        self._pids.release(platoonid)
+
+    def prune_platoon_sets(self):
+        """Removes released coordinators from their platoons. Platoons without members are dissolved and platoons whose leader chain is broken are split, the downstream part keeps the platoon id."""
+        for platoonid, platoon in list(self.platoon_sets.items()):
+            alive = [vgc for vgc in platoon if vgc.vehid in self._gcnet]
+            if not alive:
+                self.dissolve_platoon(platoonid)
+                continue
+
+            # Segments of the leader chain from head to tail
+            segments = []
+            for vgc in reversed(alive):
+                if segments and vgc.leader in segments[-1]:
+                    segments[-1].append(vgc)
+                else:
+                    segments.append([vgc])
+
+            if len(segments) == 1 and len(alive) == len(platoon):
+                continue
+
+            self.set_platoon(segments[0][::-1], platoonid)
+            for segment in segments[1:]:
+                splitid = self._pids.allocate()
+                self.set_platoon(segment[::-1], splitid)
+                self.notify(SPLIT, splitid, source=platoonid)
+
+    def merge_platoon_sets(self):
+        """Merges a platoon into the platoon ahead when its head is joinable to the tail ahead and the merged platoon has room"""
+        heads = sorted(
+            (platoon[-1] for platoon in self.platoon_sets.values()),
+            key=lambda x: x.ego.ttd,
+            reverse=True,
+        )
+        for head in heads:
+            rear = self.platoon_sets[head.platoonid]
+            front = self.platoon_sets.get(head.leader.platoonid)
+            if (
+                front is None
+                or front is rear
+                or front[0] is not head.leader
+                or len(front) + len(rear) >= MAXTRKS
+                or not head.joinable
+            ):
+                continue
+            members = sorted(chain(rear, front), key=lambda x: x.x)
+            rearid = rear.platoonid
+            del self.platoon_sets[rearid]
+            self._pids.release(rearid)
+            self.set_platoon(members, front.platoonid)
+            self.notify(MERGED, front.platoonid, source=rearid)
+
+    def update_platoons(self, tactical: bool = True):
         """First iteration to fill the platoon registry based on the current
         vehicle information.
+
+        Args:
+            tactical (bool, optional): Solves the platoon state machine for all coordinators. When false the states are held and only new coordinators are solved. Defaults to True.
         """
 
         # The main idea to update the  platoon_registry is the following:
@@ -238,16 +416,23 @@ class GlobalGapCoordinator(Subscriber):
         #             yes -> join current platoon set with my leader
         #             no -> return
 
-        self.update()
+        with PROFILER.section("tactical"):
+            self.update()
 
-        # Gap Coord (gc) Group by link (Vehicle in same link)
-        self.create_platoon_sets()
+            self.update_intruders()
 
-        self.update_states()
+            self.prune_platoon_sets()
+
+            # Gap Coord (gc) Group by link (Vehicle in same link)
+            self.create_platoon_sets()
+
+            self.merge_platoon_sets()
+
+            self.update_states(unsolved=not tactical)
 
     @property
     def nplatoons(self) -> int:
-        """Return the number of created platoons"""
+        """Return the number of live platoons"""
         return len(self.platoon_sets.keys())
 
     @property
@@ -264,8 +449,18 @@ class GlobalGapCoordinator(Subscriber):
         """
         self._cacc = control
 
-    def apply_cacc(self, time: float):
-        """This method intends to apply the cacc over all vehicles within the platoon at specific time step"""
+    def apply_cacc(self, time: float, time_step: float = TIME_STEP_OP):
+        """This method intends to apply the cacc over all vehicles within the platoon at specific time step. All operational steps within a simulator step are computed in a single call per vehicle. When an ``executor`` is attached the vehicles are evolved through it.
 
-        for vgc in self.iter_group_link(downtoup=True, group=True):
-            vgc.evolve_control(self.cacc, time)
+        Args:
+            time (float): Simulation time at the beginning of the simulator step
+            time_step (float, optional): Operational sampling time. Defaults to TIME_STEP_OP.
+        """
+
+        vgcs = self.iter_group_link(downtoup=True, group=True)
+        with PROFILER.section("operational"):
+            if self.executor is not None:
+                self.executor(vgcs, time, time_step)
+                return
+            for vgc in vgcs:
+                vgc.evolve_control(self.cacc, time, time_step)
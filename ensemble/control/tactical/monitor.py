@@ -0,0 +1,224 @@
+"""
+Safety Monitor
+==============
+This module computes surrogate safety indicators for all leader/follower pairs of gap coordinators in a single array operation per step:
+
+* **spacing_error**: Gap minus its reference ``dx - dx_ref`` [m]
+* **time_gap**: Gap over the follower speed [s]
+* **ttc**: Time to collision, gap over the closing speed [s], ``inf`` when not closing
+* **drac**: Deceleration rate to avoid the crash ``closing speed² / (2 gap)`` [m/s²], ``0`` when not closing
+
+Gap and relative speed are consistent with ``VehGapCoordinator.dx`` and ``VehGapCoordinator.dv``.
+
+Indicators are aggregated per platoon of the follower in a streaming way: the exact minimum and a fixed bin histogram per indicator are kept, percentiles are read from the histogram. No trajectory is stored.
+
+Platoon ids are reused by the registry, so aggregates are kept per platoon lifetime ``(platoonid, created_at)``, ``created_at`` being the time of its first sample. A lifetime is closed by the lifecycle events of the registry, pass ``on_event`` to ``GlobalGapCoordinator.listeners``. The next sample of the id opens a new lifetime.
+
+Example:
+    Feed the monitor at each step and read the KPIs ::
+
+        >>> from ensemble.control.tactical.monitor import SafetyMonitor
+        >>> monitor = SafetyMonitor()
+        >>> platoon_registry.listeners.append(monitor.on_event)
+        >>> monitor.update(list(platoon_registry.vgcs()), time)
+        >>> monitor.summary()
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from typing import Dict, Iterable, List
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.control.tactical.vehcoordinator import MAXNDST
+from ensemble.logic.platoon_set import (
+    PlatoonEvent,
+    CREATED,
+    MERGED,
+    SPLIT,
+    DISSOLVED,
+)
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+METRICS = ("spacing_error", "time_gap", "ttc", "drac")
+
+# Histogram edges per indicator, values outside are kept in the edge bins
+BINS = {
+    "spacing_error": np.linspace(-MAXNDST, MAXNDST, 401),
+    "time_gap": np.linspace(0, 10, 201),
+    "ttc": np.linspace(0, 60, 241),
+    "drac": np.linspace(0, 10, 201),
+}
+
+PERCENTILES = (5, 50, 95)
+
+
+def gather_pairs(vgcs: List) -> Dict[str, np.ndarray]:
+    """Gathers the leader/follower pairs, coordinators without a leader are left out
+
+    Args:
+        vgcs (List): Vehicle gap coordinators
+
+    Returns:
+        dict: Arrays of the followers and their leaders
+    """
+    pairs = [vgc for vgc in vgcs if vgc.leader is not vgc]
+    return {
+        "vehid": np.array([v.vehid for v in pairs], dtype=int),
+        "platoonid": np.array([v.platoonid for v in pairs], dtype=int),
+        "x": np.array([v.ego.x for v in pairs], dtype=float),
+        "v": np.array([v.ego.speed for v in pairs], dtype=float),
+        "dx_ref": np.array([v.dx_ref for v in pairs], dtype=float),
+        "leader_x": np.array([v.leader.x for v in pairs], dtype=float),
+        "leader_v": np.array([v.leader.speed for v in pairs], dtype=float),
+    }
+
+
+def surrogate(data: dict) -> Dict[str, np.ndarray]:
+    """Surrogate safety indicators of the pairs
+
+    Args:
+        data (dict): Pair arrays, check ``gather_pairs``
+
+    Returns:
+        dict: Array per indicator in ``METRICS``
+    """
+    dx = data["leader_x"] - data["x"]
+    closing = data["v"] - data["leader_v"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        time_gap = np.where(data["v"] > 0, dx / data["v"], np.inf)
+        ttc = np.where(closing > 0, np.maximum(dx, 0) / closing, np.inf)
+        drac = np.where(
+            closing > 0,
+            np.where(dx > 0, closing**2 / (2 * dx), np.inf),
+            0.0,
+        )
+    return {
+        "spacing_error": dx - data["dx_ref"],
+        "time_gap": np.maximum(time_gap, 0),
+        "ttc": ttc,
+        "drac": drac,
+    }
+
+
+class SafetyMonitor:
+    """Streaming aggregation of the surrogate safety indicators per platoon lifetime
+
+    Args:
+        bins (dict, optional): Histogram edges per indicator. Defaults to ``BINS``.
+    """
+
+    def __init__(self, bins: dict = None):
+        self.bins = dict(BINS if bins is None else bins)
+        self.last = {}
+        self.steps = 0
+        self._rows = {}  # (platoonid, created_at) -> row
+        self._open = {}  # platoonid -> row of its current lifetime
+        self._count = np.zeros(0, dtype=int)
+        self._min = {m: np.zeros(0) for m in METRICS}
+        self._hist = {
+            m: np.zeros((0, len(self.bins[m]) - 1), dtype=int)
+            for m in METRICS
+        }
+
+    def __len__(self):
+        return len(self._rows)
+
+    def on_event(self, event: PlatoonEvent):
+        """Closes the lifetimes ended by a platoon lifecycle event. Created and split ids start a new lifetime, dissolved ids and ids merged into another platoon end theirs."""
+        if event.kind in (CREATED, SPLIT, DISSOLVED):
+            self._open.pop(event.platoonid, None)
+        elif event.kind == MERGED:
+            self._open.pop(event.source, None)
+
+    def _index(self, platoonid: np.ndarray, created_at: float) -> np.ndarray:
+        """Row of each platoon, rows of new lifetimes are appended"""
+        new = [int(p) for p in np.unique(platoonid) if p not in self._open]
+        if new:
+            for p in new:
+                row = len(self._rows)
+                self._rows[(p, created_at)] = row
+                self._open[p] = row
+            n = len(new)
+            self._count = np.append(self._count, np.zeros(n, dtype=int))
+            for m in METRICS:
+                self._min[m] = np.append(self._min[m], np.full(n, np.inf))
+                empty = np.zeros((n, self._hist[m].shape[1]), dtype=int)
+                self._hist[m] = np.vstack((self._hist[m], empty))
+        return np.array([self._open[p] for p in platoonid], dtype=int)
+
+    def update(self, vgcs: Iterable, time: float = None):
+        """Computes the indicators of the current step and adds them to the aggregates
+
+        Args:
+            vgcs (Iterable): Vehicle gap coordinators
+            time (float, optional): Simulation time of the step. Defaults to None.
+        """
+        data = gather_pairs(list(vgcs))
+        metrics = surrogate(data)
+        self.steps += 1
+        self.last = {"time": time, "vehid": data["vehid"], **metrics}
+        if not len(data["vehid"]):
+            return
+
+        created_at = self.steps if time is None else time
+        rows = self._index(data["platoonid"], created_at)
+        np.add.at(self._count, rows, 1)
+        for m, values in metrics.items():
+            np.minimum.at(self._min[m], rows, values)
+            edges = self.bins[m]
+            nbins = len(edges) - 1
+            idx = np.searchsorted(edges, values, "right") - 1
+            idx = np.clip(idx, 0, nbins - 1)
+            np.add.at(self._hist[m], (rows, idx), 1)
+
+    def minimum(self, metric: str) -> Dict[int, float]:
+        """Minimum of an indicator per platoon lifetime"""
+        return {p: self._min[metric][r] for p, r in self._rows.items()}
+
+    def percentile(self, metric: str, q: float) -> Dict[int, float]:
+        """Percentile of an indicator per platoon lifetime, interpolated within the histogram bins
+
+        Args:
+            metric (str): One of ``METRICS``
+            q (float): Percentile in [0, 100]
+
+        Returns:
+            dict: Percentile per ``(platoonid, created_at)``
+        """
+        edges = self.bins[metric]
+        hist = self._hist[metric]
+        cumul = np.cumsum(hist, axis=1)
+        total = cumul[:, -1:]
+        target = q / 100 * total
+        k = np.minimum((cumul < target).sum(axis=1), hist.shape[1] - 1)
+        rows = np.arange(len(hist))
+        before = np.where(k > 0, cumul[rows, np.maximum(k - 1, 0)], 0)
+        inside = np.maximum(hist[rows, k], 1)
+        frac = (target[:, 0] - before) / inside
+        value = edges[k] + frac * (edges[k + 1] - edges[k])
+        value = np.where(total[:, 0] > 0, value, np.nan)
+        return {p: value[r] for p, r in self._rows.items()}
+
+    def summary(self) -> pd.DataFrame:
+        """Safety KPIs per platoon lifetime: number of samples, minimum and percentiles of each indicator"""
+        rows = self._rows.items()
+        columns = {"samples": {p: self._count[r] for p, r in rows}}
+        for m in METRICS:
+            columns[f"{m}_min"] = self.minimum(m)
+            for q in PERCENTILES:
+                columns[f"{m}_p{q}"] = self.percentile(m, q)
+        df = pd.DataFrame(columns)
+        df.index = pd.MultiIndex.from_tuples(
+            df.index, names=("platoonid", "created_at")
+        )
+        return df.sort_index()
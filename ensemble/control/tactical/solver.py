@@ -0,0 +1,249 @@
+"""
+Platoon State Solver
+====================
+This module implements a table driven solver for the platoon state machine over the whole fleet of vehicle gap coordinators.
+
+The vehicle data is gathered once into arrays, the transition predicates are evaluated as boolean arrays and the rules in ``TRANSITIONS`` are applied in a single pass:
+
+* **joinable**: leader accepts a new member, is reachable and communicates
+* **cancel**: join request is cancelled (not joinable)
+* **confirm**: gap to the leader reached its reference
+* **split**: leader is not joinable anymore or a split is requested
+* **rejoin**: split vehicle is joinable again at its reference gap
+* **leave**: split vehicle is not joinable anymore
+* **intruder**: a non platoon vehicle cut in front of the vehicle, check ``GlobalGapCoordinator.update_intruders``
+* **clear**: the intruder left the gap towards the leader
+
+Coordinators in a stable state (``StandAlone``, ``Platooning``) are only re-evaluated when they are dirty: their leader changed, their gap or speed moved beyond a hysteresis threshold since the last evaluation, or the evaluation is older than ``reevaluation_period`` updates.
+
+The per vehicle solution ``VehGapCoordinator.solve_state`` remains available and yields the same states.
+
+Example:
+    Solve the next state of all coordinators ::
+
+        >>> from ensemble.control.tactical.solver import solve_states
+        >>> states = solve_states(list(platoon_registry.vgcs()))
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from typing import Callable, Dict, List, Optional
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.logic.platoon_states import STATES, STABLE, TRANSITIONS
+from ensemble.tools.constants import DCT_PLT_CONST
+from ensemble.control.tactical.vehcoordinator import (
+    MAXTRKS,
+    MAXNDST,
+    MAXDSTR,
+    PLState,
+)
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+CODES = {state: code for code, state in enumerate(STATES)}
+
+HYSTGAP = DCT_PLT_CONST["hysteresis_gap"]
+HYSTSPD = DCT_PLT_CONST["hysteresis_speed"]
+REEVALP = DCT_PLT_CONST["reevaluation_period"]
+
+
+def gather(vgcs: List) -> Dict[str, np.ndarray]:
+    """Gathers the coordinator data required by the predicates into arrays. Leaders outside ``vgcs`` are appended after the coordinators.
+
+    Args:
+        vgcs (List): Vehicle gap coordinators
+
+    Returns:
+        dict: Arrays of the fleet, ``lead`` is the leader index
+    """
+    nodes = list(vgcs)
+    index = {id(vgc): i for i, vgc in enumerate(nodes)}
+    lead = []
+    for vgc in vgcs:
+        leader = vgc.leader
+        if id(leader) not in index:
+            index[id(leader)] = len(nodes)
+            nodes.append(leader)
+        lead.append(index[id(leader)])
+
+    n = len(vgcs)
+    return {
+        "n": n,
+        "lead": np.array(lead, dtype=int),
+        "vehid": np.array([v.vehid for v in nodes], dtype=int),
+        "x": np.array([v.x for v in nodes], dtype=float),
+        "ego_x": np.array([v.ego.x for v in vgcs], dtype=float),
+        "positionid": np.array([v.positionid for v in nodes], dtype=int),
+        "comv2x": np.array([v.comv2x for v in nodes], dtype=bool),
+        "dx_ref": np.array([v.dx_ref for v in vgcs], dtype=float),
+        "split_request": np.array(
+            [bool(v.split_request) for v in vgcs], dtype=bool
+        ),
+        "intruder": np.array([v.cutin() for v in vgcs], dtype=bool),
+        "status": np.array([CODES[type(v.status)] for v in vgcs], dtype=int),
+        "vgcs": vgcs,
+    }
+
+
+def gather_evaluated(vgcs: List) -> Dict[str, np.ndarray]:
+    """Gathers the inputs of the last evaluation with their current values, the data needed to tell dirty coordinators. Coordinators never evaluated are flagged as dirty."""
+    dirty = np.array([v.dirty or v.evaluated is None for v in vgcs])
+    last = [v.evaluated or (-1, np.nan, np.nan, 0) for v in vgcs]
+    leader, dx, speed, update = zip(*last) if last else ((), (), (), ())
+    return {
+        "dirty": dirty,
+        "status": np.array([CODES[type(v.status)] for v in vgcs], dtype=int),
+        "leader": np.array([v.leader.vehid for v in vgcs], dtype=int),
+        "dx": np.array([v.dx for v in vgcs], dtype=float),
+        "speed": np.array([v.speed for v in vgcs], dtype=float),
+        "eval_leader": np.array(leader, dtype=int),
+        "eval_dx": np.array(dx, dtype=float),
+        "eval_speed": np.array(speed, dtype=float),
+        "eval_update": np.array(update, dtype=int),
+    }
+
+
+def _dx(data: dict, cache: dict) -> np.ndarray:
+    lead = data["lead"]
+    own = data["vehid"][lead] == data["vehid"][: data["n"]]
+    return np.where(own, MAXNDST, data["x"][lead] - data["ego_x"])
+
+
+def _joinable(data: dict, cache: dict) -> np.ndarray:
+    lead = data["lead"]
+    return (
+        (data["positionid"][lead] < MAXTRKS - 1)
+        & (predicate("dx", data, cache) < MAXNDST)
+        & data["comv2x"][lead]
+        & (lead != np.arange(data["n"]))
+    )
+
+
+def _confirm(data: dict, cache: dict) -> np.ndarray:
+    return np.abs(predicate("dx", data, cache) - data["dx_ref"]) < MAXDSTR
+
+
+def _split(data: dict, cache: dict) -> np.ndarray:
+    return ~predicate("joinable", data, cache) | data["split_request"]
+
+
+def _rejoin(data: dict, cache: dict) -> np.ndarray:
+    return (
+        ~data["split_request"]
+        & predicate("joinable", data, cache)
+        & predicate("confirm", data, cache)
+    )
+
+
+def _cancel(data: dict, cache: dict) -> np.ndarray:
+    return ~predicate("joinable", data, cache)
+
+
+def _intruder(data: dict, cache: dict) -> np.ndarray:
+    return data["intruder"]
+
+
+def _clear(data: dict, cache: dict) -> np.ndarray:
+    return ~data["intruder"]
+
+
+PREDICATES: Dict[str, Callable] = {
+    "dx": _dx,
+    "joinable": _joinable,
+    "cancel": _cancel,
+    "confirm": _confirm,
+    "split": _split,
+    "rejoin": _rejoin,
+    "leave": _cancel,
+    "intruder": _intruder,
+    "clear": _clear,
+}
+
+
+def predicate(name: str, data: dict, cache: dict) -> np.ndarray:
+    """Evaluates a predicate over the fleet, predicates are evaluated once and only if required"""
+    if name not in cache:
+        cache[name] = PREDICATES[name](data, cache)
+    return cache[name]
+
+
+def dirty(data: dict, update: int) -> np.ndarray:
+    """Coordinators to re-evaluate at ``update``
+
+    Args:
+        data (dict): Fleet arrays, check ``gather_evaluated``
+        update (int): Counter of the tactical update
+
+    Returns:
+        np.ndarray: True for coordinators to re-evaluate
+    """
+    stable = np.isin(data["status"], [CODES[state] for state in STABLE])
+    return (
+        data["dirty"]
+        | ~stable
+        | (data["leader"] != data["eval_leader"])
+        | (np.abs(data["dx"] - data["eval_dx"]) > HYSTGAP)
+        | (np.abs(data["speed"] - data["eval_speed"]) > HYSTSPD)
+        | (update - data["eval_update"] >= REEVALP)
+    )
+
+
+def transition(data: dict) -> np.ndarray:
+    """Applies the transition table over the fleet
+
+    Args:
+        data (dict): Fleet arrays, check ``gather``
+
+    Returns:
+        np.ndarray: Code of the next state per coordinator
+    """
+    status = data["status"]
+    new_status = status.copy()
+    cache = data.setdefault("cache", {})
+    for state, rules in TRANSITIONS.items():
+        pending = status == CODES[state]
+        if not pending.any():
+            continue
+        for names, target in rules:
+            fire = pending.copy()
+            for name in names:
+                fire &= predicate(name, data, cache)
+            new_status[fire] = CODES[target]
+            pending &= ~fire
+    return new_status
+
+
+def solve_states(vgcs: List, update: int = None) -> List[Optional[PLState]]:
+    """Solves the next platoon state of all coordinators. Coordinators keeping their state keep the same state object.
+
+    Args:
+        vgcs (List): Vehicle gap coordinators
+        update (int, optional): Counter of the tactical update. When given only dirty coordinators are solved and ``None`` is returned for the others. Defaults to None.
+
+    Returns:
+        List[PLState]: Next state per coordinator
+    """
+    if not vgcs:
+        return []
+    states = [None] * len(vgcs)
+    if update is None:
+        index = np.arange(len(vgcs))
+    else:
+        index = np.flatnonzero(dirty(gather_evaluated(vgcs), update))
+    if not len(index):
+        return states
+    subset = [vgcs[i] for i in index]
+    data = gather(subset)
+    new_status = transition(data)
+    for i, vgc, old, new in zip(index, subset, data["status"], new_status):
+        states[i] = vgc.status if old == new else STATES[new]()
+    return states
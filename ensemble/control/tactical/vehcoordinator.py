@@ -75,6 +75,11 @@ class VehGapCoordinator(AbsSingleGapCoord):
         self._ctr_lead_data["id"] = max(self.ego.vehid - 1, 0)
         self._ctr_ego_data["id"] = self.ego.vehid
 
+        # Tactical re-evaluation (leader, gap, speed, update)
+        self.dirty = True
+        self._evaluated = None
+        self._intruder = False
+
         # Historical data
         self._history_state = np.array([(vehicle.x, vehicle.v, vehicle.a)])
         self._history_control = np.array([(0,)])
@@ -123,7 +128,24 @@ class VehGapCoordinator(AbsSingleGapCoord):
 
     def solve_state(self) -> PLState:
         """Logic solver for the platoon state machine."""
-        new_state = self.status.next_state(self)
+        return self.apply_state(self.status.next_state(self))
+
+    def mark_evaluated(self, update: int) -> None:
+        """Keeps the inputs of the last platoon state evaluation
+
+        Args:
+            update (int): Counter of the tactical update
+        """
+        self._evaluated = (self.leader.vehid, self.dx, self.speed, update)
+        self.dirty = False
+
+    @property
+    def evaluated(self) -> tuple:
+        """Leader id, gap, speed and update counter at the last evaluation"""
+        return self._evaluated
+
+    def apply_state(self, new_state: PLState) -> PLState:
+        """Propagates a new platoon state towards the vehicle and the reference"""
         self.ego.state = new_state
         self.reference.create_time_gap_hwy(new_state)
         return new_state
@@ -262,7 +284,14 @@ class VehGapCoordinator(AbsSingleGapCoord):
     @property
     def intruder(self):
         """Returns true when the vehtype of my immediate leader is not platoon"""
-        return NotImplementedError
+        return self._intruder
+
+    @intruder.setter
+    def intruder(self, value: bool):
+        """Set from the neighbour table, check ``GlobalGapCoordinator.update_intruders``"""
+        if value != self._intruder:
+            self.dirty = True
+        self._intruder = value
 
     def cancel_join_request(self, value: bool = False):
         """Forces ego to abandon platoon mode"""
@@ -272,6 +301,29 @@ class VehGapCoordinator(AbsSingleGapCoord):
         """Confirms ego platoon mode"""
         return abs(self.dx - self.dx_ref) < MAXDSTR
 
+    @property
+    def split_request(self):
+        """Split requested by the ego vehicle"""
+        return getattr(self.ego, "split_request", False)
+
+    def platoon_split(self):
+        """Determines if ego has to split from the platoon"""
+        return not self.joinable or self.split_request
+
+    def rejoin_platoon(self):
+        """Confirms ego can rejoin the platoon after splitting"""
+        return (
+            not self.split_request and self.joinable and self.confirm_platoon()
+        )
+
+    def leave_platoon(self):
+        """Confirms ego leaves the platoon after splitting"""
+        return not self.joinable
+
+    def cutin(self):
+        """Determines if a vehicle cut in between ego and its leader"""
+        return self.intruder is True
+
     @property
     def leader_data(self):
         """Operational leader control data"""
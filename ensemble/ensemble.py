@@ -7,6 +7,7 @@ Command definitions
 # STANDARD  IMPORTS
 # ============================================================================
 
+from contextlib import ExitStack
 
 # ============================================================================
 # INTERNAL IMPORTS
@@ -15,6 +16,10 @@ from ensemble.configurator import Configurator
 from ensemble.tools.screen import log_in_terminal
 from ensemble.tools.checkers import check_scenario_consistency
 from ensemble.logic import RuntimeDevice
+from ensemble.tools.profiler import profile_run
+from ensemble.tools.metrics import MetricsExporter
+from ensemble.tools.recorder import RecordingHook
+from ensemble.tools.memory import MemoryProbe
 from ensemble.control.operational.basic_test import runtime_op_layer
 
 # ============================================================================
@@ -36,11 +41,33 @@ def launch_simulation(configurator: Configurator):
             >>> scenarios = ('path/to/scenario',)
             >>> config.update_values(library_path=library, scenario_files=scenario)
             >>> launch_simulation(configurator)
+
+        Set ``configurator.profile`` to a path prefix to export the step profile, check ``ensemble.tools.profiler``. Set ``configurator.metrics_port`` to serve live metrics, check ``ensemble.tools.metrics``. Set ``configurator.record`` to a folder to record trajectories, check ``ensemble.tools.recorder``. Set ``configurator.memory`` to a path prefix to sample memory every ``memory_interval`` steps, check ``ensemble.tools.memory``.
     """
     log_in_terminal("Initializing scenario ⏱", fg="magenta")
 
-    with RuntimeDevice(configurator):
-        log_in_terminal("Finalizing simulation ⏱", fg="magenta")
+    with ExitStack() as stack:
+        if configurator.profile:
+            stack.enter_context(profile_run(configurator.profile))
+        device = RuntimeDevice(configurator)
+        if configurator.metrics_port:
+            exporter = MetricsExporter(port=configurator.metrics_port)
+            stack.enter_context(exporter)
+            device.add_hook(exporter.publish)
+        if configurator.record:
+            recording = RecordingHook(configurator.record)
+            stack.enter_context(recording)
+            device.add_hook(recording, "pre", "query")
+            device.add_hook(recording.snapshot, "post", "query")
+        if configurator.memory:
+            interval = configurator.simulation_parameters.get(
+                "memory_interval", 100
+            )
+            probe = MemoryProbe(configurator.memory, interval=interval)
+            stack.enter_context(probe)
+            device.add_hook(probe)
+        with device:
+            log_in_terminal("Finalizing simulation ⏱", fg="magenta")
 
 
 def check_consistency(configurator: Configurator) -> bool:
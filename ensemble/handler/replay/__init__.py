@@ -0,0 +1 @@
+from ensemble.handler.replay.connector import ReplayConnector
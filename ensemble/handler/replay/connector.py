@@ -0,0 +1,191 @@
+"""
+Replay Connector
+================
+This module implements a connector streaming recorded frames through the SymuVia ``SimulatorRequest`` instead of running a simulator. The tactical and operational layers are then fed as in a live run, at the speed of the parsing, without the native library.
+
+Recordings are SymuVia XML traces, folders written by ``ensemble.tools.recorder`` or sequences of ``<INST>`` frames, check ``ensemble.handler.replay.source``.
+
+Steps are counted as in a live run: the first frame of the recording is received at step 1. The replay can be positioned at any step with ``seek`` and restricted to a window of simulation time with ``window``.
+
+Example:
+    Replay the frames between 300 s and 600 s of a trace ::
+
+        >>> from ensemble.handler.replay import ReplayConnector
+        >>> connector = ReplayConnector(source="path/to/trace.xml")
+        >>> connector.load_scenario()
+        >>> connector.window(300, 600)
+        >>> while connector.do_next:
+        ...     connector.query_data()
+
+    Or from the command line ::
+
+        ensemble -p replay launch -s path/to/trace.xml
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.metaclass.connector import AbsConnector
+from ensemble.handler.symuvia.stream import SimulatorRequest
+from ensemble.handler.replay.source import open_source
+from ensemble.tools.exceptions import EnsembleAPILoadFileError
+from ensemble.tools.screen import log_verify
+from ensemble.tools.profiler import PROFILER
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+
+class ReplayConnector(AbsConnector):
+    """Connector replaying recorded frames
+
+    Args:
+        source (optional): Recording, path or sequence of frames. Defaults to None.
+        roi (RegionOfInterest, optional): Region of interest of the request. Defaults to None.
+    """
+
+    def __init__(self, source=None, roi=None):
+        self.source = source
+        self.roi = roi
+        self.library_path = ""
+        self.frames = None
+        self.request = SimulatorRequest(roi=roi)
+        self._next = 0
+        self._stop = 0
+        self._c_iter = 0
+        self._bContinue = False
+
+    def __len__(self) -> int:
+        return len(self.frames) if self.frames is not None else 0
+
+    # ========================================================================
+    # LOADING METHODS
+    # ========================================================================
+
+    def load_simulator(self):
+        """Nothing to load, frames come from the recording"""
+        pass
+
+    def register_simulation(self, scenarioPath):
+        """Registers a recording
+
+        Args:
+            scenarioPath: Path of the recording or sequence of frames
+        """
+        self.source = scenarioPath
+
+    def load_scenario(self, scenario=None):
+        """Opens the recording and positions the replay at its first frame
+
+        Args:
+            scenario (optional): Recording replacing ``source``. Defaults to None.
+        """
+        if scenario is not None:
+            self.register_simulation(scenario)
+        if self.frames is not None:
+            self.frames.close()
+        try:
+            self.frames = open_source(self.source)
+        except (OSError, ValueError, KeyError):
+            raise EnsembleAPILoadFileError(
+                "\t Recording could not be loaded", str(self.source)
+            )
+        self.performInitialize()
+        log_verify(f"\t Recording successfully loaded: {len(self)} frames")
+
+    def performInitialize(self):
+        """Resets the request and replays all frames"""
+        self.request = SimulatorRequest(roi=self.roi)
+        self.seek(1, len(self))
+
+    # ========================================================================
+    # NAVIGATION
+    # ========================================================================
+
+    def seek(self, step: int, stop: int = None):
+        """Positions the replay so that the next query receives the frame of ``step``. Registries are kept, vehicles are reconciled from the next frame.
+
+        Args:
+            step (int): Step of the next frame, starting from 1
+            stop (int, optional): Last step replayed, None keeps the current one. Defaults to None.
+        """
+        if stop is not None:
+            self._stop = min(max(stop, 0), len(self))
+        self._next = min(max(step, 1), len(self) + 1) - 1
+        self._c_iter = self._next
+        self._bContinue = self._next < self._stop
+
+    def window(self, start: float = -np.inf, stop: float = np.inf):
+        """Replays the frames whose simulation time lies within ``[start, stop]``
+
+        Args:
+            start (float, optional): First time [s]. Defaults to -inf.
+            stop (float, optional): Last time [s]. Defaults to inf.
+        """
+        times = self.frames.times
+        first = int(np.searchsorted(times, start, "left"))
+        last = int(np.searchsorted(times, stop, "right"))
+        self.seek(first + 1, last)
+
+    # ========================================================================
+    # STEPPING
+    # ========================================================================
+
+    def request_answer(self):
+        """Sends the next frame to the request"""
+        with PROFILER.section("simulator"):
+            frame = self.frames[self._next]
+        self.request.query = frame
+
+    def query_data(self) -> int:
+        """Replays a step
+
+        Returns:
+            int: Step of the frame, -1 once the replay is over
+        """
+        if self._next >= self._stop:
+            self._bContinue = False
+            return -1
+        self.request_answer()
+        self._next += 1
+        self._c_iter = self._next
+        self._bContinue = self._next < self._stop
+        return self._c_iter
+
+    def push_data(self):
+        """Recorded frames do not react to control"""
+        pass
+
+    # ========================================================================
+    # ATTRIBUTES
+    # ========================================================================
+
+    @property
+    def get_vehicle_data(self):
+        """Returns the query received from the recording"""
+        return self.request.get_vehicle_data()
+
+    @property
+    def simulation_step(self) -> int:
+        """Step of the last frame replayed"""
+        return self._c_iter
+
+    @property
+    def time(self) -> float:
+        """Recorded time of the last frame replayed"""
+        if not self._c_iter:
+            return np.nan
+        return float(self.frames.times[self._c_iter - 1])
+
+    @property
+    def do_next(self) -> bool:
+        """True while frames remain in the window"""
+        return self._bContinue
@@ -0,0 +1,182 @@
+"""
+Replay Sources
+==============
+This module gives indexed access to recorded simulator frames. Frames are SymuVia ``<INST>`` elements, as received from the simulator buffer:
+
+* ``FrameList``: Frames held in memory
+* ``XMLTrace``: Frames of a SymuVia XML trace, only their offsets are kept, the file is memory mapped
+* ``ColumnarTrace``: Frames rebuilt from a recording of ``ensemble.tools.recorder``
+* ``FrameArchive``: Frames of an archive of ``ensemble.tools.archive``
+
+Each source knows the simulation time of its frames, so windows can be selected without parsing them.
+
+Example:
+    Open a trace and read its first frame ::
+
+        >>> from ensemble.handler.replay.source import open_source
+        >>> source = open_source("path/to/trace.xml")
+        >>> source[0]
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+import re
+import mmap
+from typing import Sequence
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.handler.symuvia.xmlparser import frame_time
+from ensemble.tools.archive import FrameArchive
+from ensemble.tools.recorder import load_trajectories
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+INST = re.compile(rb"<INST\b[^>]*?/>|<INST\b.*?</INST>", re.S)
+
+TRAJ = (
+    '<TRAJ abs="{abscissa:.6f}" acc="{acceleration:.6f}" '
+    'dst="{distance:.6f}"{driven} id="{vehid}" ord="{ordinate:.6f}" '
+    'tron="{link}" type="{vehtype}" vit="{speed:.6f}" voie="{lane}" '
+    'z="{elevation:.6f}"/>'
+)
+
+FIELDS = (
+    "abscissa",
+    "acceleration",
+    "distance",
+    "vehid",
+    "ordinate",
+    "link",
+    "vehtype",
+    "speed",
+    "lane",
+    "elevation",
+    "driven",
+)
+
+
+class FrameList:
+    """Frames held in memory
+
+    Args:
+        frames (Sequence[bytes]): ``<INST>`` elements
+    """
+
+    def __init__(self, frames: Sequence[bytes]):
+        self.frames = tuple(frames)
+        self.times = np.array([frame_time(f) for f in self.frames], float)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __getitem__(self, index: int) -> bytes:
+        return self.frames[index]
+
+    def close(self):
+        pass
+
+
+class XMLTrace:
+    """Frames of a SymuVia XML trace. The trace is scanned once for the offsets and times of its ``<INST>`` elements.
+
+    Args:
+        path (str): Trace file
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        else:
+            self._map = b""
+        spans, times = [], []
+        for match in INST.finditer(self._map):
+            start, end = match.span()
+            spans.append((start, end))
+            times.append(frame_time(self._map[start : start + 256]))
+        self.spans = np.array(spans, np.int64).reshape(-1, 2)
+        self.times = np.array(times, float)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __getitem__(self, index: int) -> bytes:
+        start, end = self.spans[index]
+        return self._map[start:end]
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+
+class ColumnarTrace:
+    """Frames rebuilt from a trajectory recording, one frame per recorded step. Only the trajectories are rebuilt, creations and exits are left empty.
+
+    Args:
+        path (str): Folder of the recording
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        df = load_trajectories(path).sort_values("step", kind="stable")
+        self._columns = {c: df[c].to_numpy() for c in FIELDS}
+        steps = df["step"].to_numpy()
+        self.steps, self._starts = np.unique(steps, return_index=True)
+        self._ends = np.append(self._starts[1:], len(steps))
+        self.times = df["time"].to_numpy()[self._starts].astype(float)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __getitem__(self, index: int) -> bytes:
+        window = slice(self._starts[index], self._ends[index])
+        values = [self._columns[c][window].tolist() for c in FIELDS]
+        trajs = "".join(
+            TRAJ.format(
+                **{
+                    **dict(zip(FIELDS, row)),
+                    "driven": ' etat_pilotage="1"' if row[-1] else "",
+                }
+            )
+            for row in zip(*values)
+        )
+        time = self.times[index]
+        return (
+            f'<INST nbVeh="{len(values[0])}" val="{time:.2f}"><CREATIONS/>'
+            f"<SORTIES/><TRAJS>{trajs}</TRAJS><STREAMS/><LINKS/><SGTS/>"
+            "<FEUX/><ENTREES/><REGULATIONS/></INST>"
+        ).encode()
+
+    def close(self):
+        pass
+
+
+def open_source(source):
+    """Frame source of a recording
+
+    Args:
+        source: Path of a SymuVia XML trace, of a frame archive without extension, folder of a trajectory recording or sequence of ``<INST>`` frames
+
+    Returns:
+        Source giving indexed access to the frames and their ``times``
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if os.path.isdir(source):
+            return ColumnarTrace(str(source))
+        if os.path.exists(f"{source}.index"):
+            return FrameArchive(str(source))
+        return XMLTrace(str(source))
+    return FrameList(source)
@@ -29,6 +29,8 @@ from ensemble.tools.constants import DEFAULT_PATH_SYMUFLOW
 # ============================================================================
 
 from ensemble.tools.connector_configurator import ConnectorConfigurator
+from ensemble.component.region import RegionOfInterest
+from ensemble.tools.archive import FrameArchive
 from ensemble.tools.screen import log_verify
 import ensemble.tools.constants as CT
 
@@ -66,6 +68,24 @@ class SymuviaConfigurator(ConnectorConfigurator):
         step_launch_mode (str):
             Determine to way to launch the ``RunStepEx``. Options ``lite``/``full``
 
+        pipelined (bool):
+            Runs the next simulator step in background while the current one is processed, one step lag
+
+        fast_forward (bool):
+            Runs lite steps without parsing until a platoon vehicle is probed
+
+        fast_forward_until (float):
+            Simulation time ending the fast forward, 0 for none
+
+        probe_interval (int):
+            Steps between frames probed for platoon vehicles during fast forward
+
+        roi (RegionOfInterest):
+            Region of interest of the parsed vehicles, None for all
+
+        archive (FrameArchive):
+            Archive of the raw frames received, None to disable it
+
     Returns:
         configurator (Configurator):
             Configurator object with simulation parameters
@@ -78,6 +98,12 @@ class SymuviaConfigurator(ConnectorConfigurator):
     total_steps: int = TOTAL_SIMULATION_STEPS
     step_launch_mode: str = LAUNCH_MODE
     b_end: c_int = c_int()
+    pipelined: bool = False
+    fast_forward: bool = False
+    fast_forward_until: float = 0
+    probe_interval: int = CT.DCT_RUNTIME_PARAM["probe_interval"]
+    roi: RegionOfInterest = None
+    archive: FrameArchive = None
 
     def __init__(self, **kwargs) -> None:
         """Configurator class for containing specific simulator parameter
@@ -100,6 +126,24 @@ class SymuviaConfigurator(ConnectorConfigurator):
 
             step_launch_mode (str):
                 Determine to way to launch the ``RunStepEx``. Options ``lite``/``full``
+
+            pipelined (bool):
+                Runs the next simulator step in background while the current one is processed, one step lag
+
+            fast_forward (bool):
+                Runs lite steps without parsing until a platoon vehicle is probed
+
+            fast_forward_until (float):
+                Simulation time ending the fast forward, 0 for none
+
+            probe_interval (int):
+                Steps between frames probed for platoon vehicles during fast forward
+
+            roi (RegionOfInterest):
+                Region of interest of the parsed vehicles, None for all
+
+            archive (FrameArchive):
+                Archive of the raw frames received, None to disable it
         """
         log_verify(f"{self.__class__.__name__}: Initialization")
         for key, value in kwargs.items():
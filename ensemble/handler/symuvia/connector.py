@@ -20,6 +20,30 @@ Example:
     To increase change the flag that traces the flow:
 
         >>> simulator = Simulator(path, traceFlow = True)
+
+In pipelined mode the simulator step ``k + 1`` runs in a background thread while the frame of step ``k`` is parsed and controlled in Python, the native call releases the GIL. The step results are written in two alternating buffers. The contract is a one step lag: data pushed after receiving the frame ``k`` is taken into account by the simulator at step ``k + 2``. Closed-loop control needs the synchronous mode, where it is taken at step ``k + 1``.
+
+Example:
+    To overlap the simulator step with the processing of the previous frame ::
+
+        >>> simulator = SymuviaConnector(library_path=path, pipelined=True)
+
+In fast forward mode the simulator runs lite steps, no trajectory is requested nor parsed and the vehicle registry stays empty. Every ``probe_interval`` steps a full frame is requested and searched for platoon vehicle types, the connector switches to the full trajectory mode from the first frame holding one, or once ``fast_forward_until`` is reached.
+
+Example:
+    To skip the warm-up of a scenario until a truck enters ::
+
+        >>> simulator = SymuviaConnector(library_path=path, fast_forward=True)
+
+When an ``archive`` is set, every frame sent to the request is appended to it with its step and time, check ``ensemble.tools.archive``.
+
+Example:
+    To keep the raw frames of a run ::
+
+        >>> from ensemble.tools.archive import FrameArchive
+        >>> simulator = SymuviaConnector(
+        ...     library_path=path, archive=FrameArchive("output/run", "w")
+        ... )
 """
 # ============================================================================
 # STANDARD  IMPORTS
@@ -27,6 +51,7 @@ Example:
 
 
 from ctypes import cdll, create_string_buffer, c_int, byref, c_bool, c_double
+from concurrent.futures import ThreadPoolExecutor
 import click
 from pathlib import Path
 
@@ -42,20 +67,25 @@ from ensemble.tools.exceptions import (
 )
 
 from ensemble.tools.screen import log_verify, log_success, log_error
+from ensemble.tools.profiler import PROFILER
 
 from .stream import SimulatorRequest
+from .xmlparser import frame_time
 from .configurator import SymuviaConfigurator
 from .scenario import SymuviaScenario
 
 import ensemble.tools.constants as CT
 
-from ensemble.tools.constants import TIME_STEP
+from ensemble.tools.constants import TIME_STEP, BUFFER_STRING, DCT_PLT_CONST
 
 
 # ============================================================================
 # CLASS AND DEFINITIONS
 # ============================================================================
 
+# Platoon vehicle types as written in the trajectory frames
+PLT_TAGS = tuple(f'type="{t}"'.encode() for t in DCT_PLT_CONST["platoon_types"])
+
 
 class SymuviaConnector(SymuviaConfigurator, AbsConnector):
     """
@@ -107,6 +137,10 @@ class SymuviaConnector(SymuviaConfigurator, AbsConnector):
     ) -> None:
         SymuviaConfigurator.__init__(self, **kwargs)
         AbsConnector.__init__(self)
+        self._executor = None
+        self._pending = None
+        self._buffers = ()
+        self._forwarding = False
         self.load_simulator()
 
     # ========================================================================
@@ -142,6 +176,7 @@ class SymuviaConnector(SymuviaConfigurator, AbsConnector):
     def load_scenario(self, scenario: SymuviaScenario):
         """checks existance and load scenario into"""
         if isinstance(scenario, SymuviaScenario):
+            self.drain()
             try:
                 self.__library.SymLoadNetworkEx(scenario.filename("UTF8"))
                 self.performInitialize(scenario)
@@ -163,19 +198,105 @@ class SymuviaConnector(SymuviaConfigurator, AbsConnector):
         """
         self.simulation = SymuviaScenario(scenarioPath)
 
+    def run_step(self, buffer, b_end) -> tuple:
+        """Runs a single simulator step writing into the given buffer
+
+        Returns:
+            tuple: Continue flag, buffer and end flag of the step
+        """
+        if self.step_launch_mode == "lite":
+            flag = self.__library.SymRunNextStepLiteEx(
+                self.write_xml, byref(b_end)
+            )
+        else:
+            flag = self.__library.SymRunNextStepEx(
+                buffer, self.write_xml, byref(b_end)
+            )
+        return flag, buffer, b_end
+
+    def submit_step(self):
+        """Launches the next simulator step in background, in the buffer not being read"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(1, "symuvia")
+        if not self._buffers:
+            self._buffers = tuple(
+                (create_string_buffer(BUFFER_STRING), c_int()) for _ in range(2)
+            )
+        self._buffers = self._buffers[::-1]
+        self._pending = self._executor.submit(self.run_step, *self._buffers[0])
+
+    def drain(self):
+        """Waits for the step running in background if any, its frame is dropped. The worker thread is stopped, it is started again by the next pipelined step."""
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def request_answer(self):
         """
         Request simulator answer and maps the data locally
         """
-        if self.step_launch_mode == "lite":
-            self._bContinue = self.__library.SymRunNextStepLiteEx(
-                self.write_xml, byref(self.b_end)
+        if self._forwarding:
+            self.request_fast_forward()
+            return
+        if self.pipelined:
+            self.request_pipelined()
+            return
+        with PROFILER.section("simulator"):
+            if self.step_launch_mode == "lite":
+                self._bContinue = self.__library.SymRunNextStepLiteEx(
+                    self.write_xml, byref(self.b_end)
+                )
+                return
+            self._bContinue = self.__library.SymRunNextStepEx(
+                self.buffer_string, self.write_xml, byref(self.b_end)
             )
+        self.receive(self.buffer_string.value)
+
+    def receive(self, frame: bytes):
+        """Sends a frame to the request, the frame is archived first when an archive is set"""
+        if self.archive is not None:
+            with PROFILER.section("archive"):
+                step, time = self._c_iter + 1, frame_time(frame)
+                self.archive.append(frame, step, time)
+        self.request.query = frame
+
+    def request_pipelined(self):
+        """Takes the answer of the step running in background and launches the next one. The ``simulator`` section of the profiler then measures the wait for the step only."""
+        if self._pending is None:
+            self.submit_step()
+        with PROFILER.section("simulator"):
+            flag, buffer, b_end = self._pending.result()
+        self._pending = None
+        self._bContinue = flag
+        self.b_end.value = b_end.value
+        if flag:
+            self.submit_step()
+        if self.step_launch_mode != "lite":
+            self.receive(buffer.value)
+
+    def request_fast_forward(self):
+        """Advances a lite step, or probes a full frame every ``probe_interval`` steps. The frame is parsed only when the fast forward ends."""
+        if not hasattr(self.request, "vehicle_registry"):
+            self.request.create_vehicle_registry()
+        until = 0 < self.fast_forward_until <= self.time
+        if not until and (self._c_iter + 1) % self.probe_interval:
+            with PROFILER.section("simulator"):
+                self._bContinue = self.__library.SymRunNextStepLiteEx(
+                    self.write_xml, byref(self.b_end)
+                )
             return
-        self._bContinue = self.__library.SymRunNextStepEx(
-            self.buffer_string, self.write_xml, byref(self.b_end)
-        )
-        self.request.query = self.buffer_string.value
+        with PROFILER.section("simulator"):
+            self._bContinue = self.__library.SymRunNextStepEx(
+                self.buffer_string, self.write_xml, byref(self.b_end)
+            )
+        frame = self.buffer_string.value
+        if until or any(tag in frame for tag in PLT_TAGS):
+            self._forwarding = False
+            log_success(f"\t Full trajectory mode from step: {self._c_iter}")
+            self.receive(frame)
 
     def query_data(self) -> int:
         """Run simulation step by step
@@ -189,6 +310,7 @@ class SymuviaConnector(SymuviaConfigurator, AbsConnector):
             return self._c_iter
         except StopIteration:
             self._bContinue = False
+            self.drain()
             return -1
 
     def push_data(self):
@@ -209,10 +331,11 @@ class SymuviaConnector(SymuviaConfigurator, AbsConnector):
         """
         Perform simulation initialization
         """
-        self.request = SimulatorRequest()
+        self.request = SimulatorRequest(roi=self.roi)
         self._n_iter = iter(scenario.get_simulation_steps())
         self._c_iter = next(self._n_iter)
         self._bContinue = True
+        self._forwarding = self.fast_forward
 
     def performPreRoutine(self) -> None:
         """
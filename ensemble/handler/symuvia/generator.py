@@ -0,0 +1,417 @@
+"""
+**Generator Module**
+
+    This module writes SymuVia scenarios for parametric networks, so that the loading of scenarios and the runtime can be measured at realistic sizes. Two layouts are available:
+
+    * ``corridor``: Links in series between one entry and one exit
+    * ``grid``: Rows of eastbound links crossing columns of northbound links, with an entry and an exit at each end of a row or a column
+
+    Vehicles are created from lists of vehicles, whose entry instants follow a Poisson process of the demand of each entry and whose types are drawn from the shares of ``vehicle_types``. Scenarios written by this module validate against the SymuVia schema ``reseau.xsd``, check ``validate``.
+
+    Example:
+        Write a corridor of 50 links with 10 % platoon trucks ::
+
+            >>> from ensemble.handler.symuvia.generator import corridor, write_scenario
+            >>> tree = corridor(links=50, lanes=3, demand=3600, vehicle_types={"VL": 0.9, "PLT": 0.1})
+            >>> write_scenario(tree, "corridor_50.xml")
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from pathlib import Path
+from typing import Dict, Sequence, Union
+import numpy as np
+from lxml import etree
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.tools.exceptions import EnsembleAPILoadFileError
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+# Parameters of the vehicle types (w [m/s], kx [veh/m], vx [m/s])
+VEHICLE_PARAMETERS = {
+    "VL": {"w": "-5.8823", "kx": "0.17", "vx": "36"},
+    "PL": {"w": "-5.8823", "kx": "0.17", "vx": "25"},
+    "PLT": {"w": "-5.8823", "kx": "0.17", "vx": "25"},
+}
+ACCELERATIONS = (("1.5", "5.8"), ("1", "8"), ("0.5", "infini"))
+DEFAULT_TYPES = {"VL": 0.9, "PLT": 0.1}
+
+
+def _format_time(seconds: float) -> str:
+    """Time of day of the simulation, ``HOUR_FORMAT``"""
+    hours, seconds = divmod(int(seconds), 3600)
+    return f"{hours:02d}:{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+def _creations(
+    rng: np.random.Generator,
+    demand: float,
+    duration: float,
+    vehicle_types: Dict[str, float],
+    destinations: Sequence[str],
+) -> list:
+    """Entry instants, types and destinations of the vehicles of an entry
+
+    Args:
+        demand (float): Flow of the entry [veh/h]
+        duration (float): Simulated time [s]
+    """
+    count = rng.poisson(demand * duration / 3600)
+    instants = np.sort(rng.uniform(0, duration, count))
+    types, shares = zip(*vehicle_types.items())
+    shares = np.asarray(shares, float) / sum(shares)
+    drawn = rng.choice(len(types), count, p=shares)
+    targets = rng.integers(len(destinations), size=count)
+    return [
+        (instant, types[t], destinations[d])
+        for instant, t, d in zip(instants.tolist(), drawn, targets)
+    ]
+
+
+def _scenario(
+    name: str,
+    links: Sequence[tuple],
+    nodes: Dict[str, Sequence[tuple]],
+    entries: Dict[str, list],
+    exits: Sequence[str],
+    vehicle_types: Dict[str, float],
+    duration: float,
+    seed: int,
+) -> etree._ElementTree:
+    """Builds the XML tree of a scenario
+
+    Args:
+        name (str): Prefix of the simulation outputs
+        links (Sequence[tuple]): ``(id, upstream, downstream, start, end, lanes)`` of each link, ends as ``(x, y)``
+        nodes (Dict[str, Sequence[tuple]]): Allowed movements ``(incoming, outgoing)`` of each intersection
+        entries (Dict[str, list]): Vehicle creations of each entry
+        exits (Sequence[str]): Exit ids
+        vehicle_types (Dict[str, float]): Share of each vehicle type
+        duration (float): Simulated time [s]
+        seed (int): Seed of the simulator
+    """
+    E = etree.SubElement
+    xsi = "http://www.w3.org/2001/XMLSchema-instance"
+    root = etree.Element(
+        "ROOT_SYMUBRUIT",
+        {
+            f"{{{xsi}}}noNamespaceSchemaLocation": "reseau.xsd",
+            "version": "2.05",
+        },
+        nsmap={"xsi": xsi},
+    )
+
+    simulation = E(
+        E(root, "SIMULATIONS"),
+        "SIMULATION",
+        id="simID",
+        pasdetemps="1",
+        debut="00:00:00",
+        fin=_format_time(duration),
+        loipoursuite="exacte",
+        comportementflux="iti",
+        date="1985-01-17",
+        titre="",
+        proc_deceleration="false",
+        seed=str(seed),
+    )
+    E(
+        simulation,
+        "RESTITUTION",
+        trace_route="false",
+        trajectoires="true",
+        debug="false",
+        debug_matrice_OD="false",
+        debug_SAS="false",
+    )
+
+    trafic = E(
+        E(root, "TRAFICS"),
+        "TRAFIC",
+        id="trafID",
+        accbornee="true",
+        coeffrelax="0.55",
+        chgtvoie_ghost="false",
+    )
+    troncons = E(trafic, "TRONCONS")
+    for link in links:
+        E(troncons, "TRONCON", id=link[0])
+    types = E(trafic, "TYPES_DE_VEHICULE")
+    for vehtype in vehicle_types:
+        parameters = VEHICLE_PARAMETERS.get(
+            vehtype, VEHICLE_PARAMETERS["PLT"]
+        )
+        vtype = E(types, "TYPE_DE_VEHICULE", id=vehtype, **parameters)
+        plages = E(vtype, "ACCELERATION_PLAGES")
+        for ax, vit_sup in ACCELERATIONS:
+            E(plages, "ACCELERATION_PLAGE", ax=ax, vit_sup=vit_sup)
+    extremites = E(trafic, "EXTREMITES")
+    for entry, creations in entries.items():
+        extremite = E(
+            extremites,
+            "EXTREMITE",
+            id=entry,
+            typeCreationVehicule="listeVehicules",
+        )
+        vehicles = E(extremite, "CREATION_VEHICULES")
+        for instant, vehtype, destination in creations:
+            E(
+                vehicles,
+                "CREATION_VEHICULE",
+                typeVehicule=vehtype,
+                destination=destination,
+                instant=f"{instant:.2f}",
+            )
+    for extremite in exits:
+        E(extremites, "EXTREMITE", id=extremite)
+    if nodes:
+        internes = E(trafic, "CONNEXIONS_INTERNES")
+        for node in nodes:
+            E(internes, "CONNEXION_INTERNE", id=node)
+
+    reseau = E(E(root, "RESEAUX"), "RESEAU", id="resID")
+    troncons = E(reseau, "TRONCONS")
+    for linkid, upstream, downstream, start, end, lanes in links:
+        E(
+            troncons,
+            "TRONCON",
+            id=linkid,
+            id_eltamont=upstream,
+            id_eltaval=downstream,
+            extremite_amont="{:.1f} {:.1f}".format(*start),
+            extremite_aval="{:.1f} {:.1f}".format(*end),
+            largeur_voie="3",
+            nb_voie=str(lanes),
+        )
+    connexions = E(reseau, "CONNEXIONS")
+    extremites = E(connexions, "EXTREMITES")
+    for extremite in (*entries, *exits):
+        E(extremites, "EXTREMITE", id=extremite)
+    repartiteurs = E(connexions, "REPARTITEURS")
+    for node, movements in nodes.items():
+        autorises = E(
+            E(repartiteurs, "REPARTITEUR", id=node), "MOUVEMENTS_AUTORISES"
+        )
+        for incoming in dict.fromkeys(m[0] for m in movements):
+            autorise = E(
+                autorises, "MOUVEMENT_AUTORISE", id_troncon_amont=incoming
+            )
+            sorties = E(autorise, "MOUVEMENT_SORTIES")
+            for outgoing in (m[1] for m in movements if m[0] == incoming):
+                E(sorties, "MOUVEMENT_SORTIE", id_troncon_aval=outgoing)
+    E(connexions, "GIRATOIRES")
+    E(connexions, "CARREFOURSAFEUX")
+    E(reseau, "PARAMETRAGE_VEHICULES_GUIDES")
+
+    E(
+        E(root, "SCENARIOS"),
+        "SCENARIO",
+        id="defaultScenario",
+        simulation_id="simID",
+        trafic_id="trafID",
+        reseau_id="resID",
+        dirout="output",
+        prefout=name,
+    )
+    return etree.ElementTree(root)
+
+
+def corridor(
+    links: int = 10,
+    lanes: Union[int, Sequence[int]] = 2,
+    length: float = 1000.0,
+    demand: float = 1800.0,
+    vehicle_types: Dict[str, float] = DEFAULT_TYPES,
+    duration: float = 3600.0,
+    seed: int = 0,
+) -> etree._ElementTree:
+    """Scenario of links in series, from ``Ext_In`` to ``Ext_Out``
+
+    Args:
+        links (int, optional): Number of links. Defaults to 10.
+        lanes (int, Sequence[int], optional): Lanes of all links or of each link. Defaults to 2.
+        length (float, optional): Length of each link [m]. Defaults to 1000.
+        demand (float, optional): Flow of the entry [veh/h]. Defaults to 1800.
+        vehicle_types (Dict[str, float], optional): Share of each vehicle type. Defaults to ``DEFAULT_TYPES``.
+        duration (float, optional): Simulated time [s]. Defaults to 3600.
+        seed (int, optional): Seed of the creations and of the simulator. Defaults to 0.
+
+    Returns:
+        etree._ElementTree: Scenario
+    """
+    if isinstance(lanes, int):
+        lanes = (lanes,) * links
+    if len(lanes) != links:
+        raise ValueError("One lane count per link is expected")
+    ends = ["Ext_In", *(f"Node_{i:03d}" for i in range(1, links)), "Ext_Out"]
+    ids = [f"Link_{i:03d}" for i in range(links)]
+    network = [
+        (
+            ids[i],
+            ends[i],
+            ends[i + 1],
+            (i * length, 0),
+            ((i + 1) * length, 0),
+            n,
+        )
+        for i, n in enumerate(lanes)
+    ]
+    nodes = {ends[i]: ((ids[i - 1], ids[i]),) for i in range(1, links)}
+    rng = np.random.default_rng(seed)
+    entries = {
+        "Ext_In": _creations(rng, demand, duration, vehicle_types, ("Ext_Out",))
+    }
+    return _scenario(
+        f"corridor_{links}",
+        network,
+        nodes,
+        entries,
+        ("Ext_Out",),
+        vehicle_types,
+        duration,
+        seed,
+    )
+
+
+def grid(
+    rows: int = 3,
+    columns: int = 3,
+    lanes: int = 2,
+    length: float = 500.0,
+    demand: float = 900.0,
+    vehicle_types: Dict[str, float] = DEFAULT_TYPES,
+    duration: float = 3600.0,
+    seed: int = 0,
+) -> etree._ElementTree:
+    """Scenario of eastbound rows crossing northbound columns. Row ``i`` goes from ``West_i`` to ``East_i``, column ``j`` from ``South_j`` to ``North_j``, vehicles head to any exit reachable from their entry.
+
+    Args:
+        rows (int, optional): Number of rows. Defaults to 3.
+        columns (int, optional): Number of columns. Defaults to 3.
+        lanes (int, optional): Lanes of all links. Defaults to 2.
+        length (float, optional): Distance between intersections [m]. Defaults to 500.
+        demand (float, optional): Flow of each entry [veh/h]. Defaults to 900.
+        vehicle_types (Dict[str, float], optional): Share of each vehicle type. Defaults to ``DEFAULT_TYPES``.
+        duration (float, optional): Simulated time [s]. Defaults to 3600.
+        seed (int, optional): Seed of the creations and of the simulator. Defaults to 0.
+
+    Returns:
+        etree._ElementTree: Scenario
+    """
+
+    def node(i: int, j: int) -> str:
+        if j < 0:
+            return f"West_{i}"
+        if j == columns:
+            return f"East_{i}"
+        if i < 0:
+            return f"South_{j}"
+        if i == rows:
+            return f"North_{j}"
+        return f"Node_{i}_{j}"
+
+    network = []
+    movements = {node(i, j): [] for i in range(rows) for j in range(columns)}
+    for i in range(rows):
+        for j in range(-1, columns):
+            network.append(
+                (
+                    f"Row_{i}_{j + 1}",
+                    node(i, j),
+                    node(i, j + 1),
+                    ((j + 1) * length, (i + 1) * length),
+                    ((j + 2) * length, (i + 1) * length),
+                    lanes,
+                )
+            )
+    for j in range(columns):
+        for i in range(-1, rows):
+            network.append(
+                (
+                    f"Col_{j}_{i + 1}",
+                    node(i, j),
+                    node(i + 1, j),
+                    ((j + 1) * length, (i + 1) * length),
+                    ((j + 1) * length, (i + 2) * length),
+                    lanes,
+                )
+            )
+    for i in range(rows):
+        for j in range(columns):
+            incoming = (f"Row_{i}_{j}", f"Col_{j}_{i}")
+            outgoing = (f"Row_{i}_{j + 1}", f"Col_{j}_{i + 1}")
+            movements[node(i, j)] = [(a, b) for a in incoming for b in outgoing]
+
+    east = [f"East_{i}" for i in range(rows)]
+    north = [f"North_{j}" for j in range(columns)]
+    rng = np.random.default_rng(seed)
+    entries = {}
+    for i in range(rows):
+        reachable = (*east[i:], *north)
+        entries[f"West_{i}"] = _creations(
+            rng, demand, duration, vehicle_types, reachable
+        )
+    for j in range(columns):
+        reachable = (*east, *north[j:])
+        entries[f"South_{j}"] = _creations(
+            rng, demand, duration, vehicle_types, reachable
+        )
+    return _scenario(
+        f"grid_{rows}x{columns}",
+        network,
+        movements,
+        entries,
+        (*east, *north),
+        vehicle_types,
+        duration,
+        seed,
+    )
+
+
+def write_scenario(tree: etree._ElementTree, path: str) -> Path:
+    """Writes a scenario, the schema location is kept relative to the file
+
+    Args:
+        tree (etree._ElementTree): Scenario
+        path (str): Scenario file
+
+    Returns:
+        Path: Scenario file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tree.write(
+        str(path), pretty_print=True, xml_declaration=True, encoding="UTF-8"
+    )
+    return path
+
+
+def validate(tree: Union[etree._ElementTree, str], schema: str) -> bool:
+    """Validates a scenario against the SymuVia schema
+
+    Args:
+        tree (etree._ElementTree, str): Scenario or scenario file
+        schema (str): Path of ``reseau.xsd``
+
+    Returns:
+        bool: True when the scenario is valid
+
+    Raises:
+        EnsembleAPILoadFileError: When the scenario is not valid, with the first error
+    """
+    if not isinstance(tree, etree._ElementTree):
+        tree = etree.parse(str(tree))
+    xsd = etree.XMLSchema(etree.parse(str(schema)))
+    if not xsd.validate(tree):
+        raise EnsembleAPILoadFileError(
+            "\tScenario does not match the schema", str(xsd.error_log.last_error)
+        )
+    return True
@@ -24,6 +24,7 @@ from ensemble.tools.exceptions import (
 )
 
 from ensemble.tools import constants as ct
+from ensemble.tools.screen import log_warning
 
 
 # ============================================================================
@@ -54,6 +55,11 @@ class SymuviaScenario(Scenario):
                 raise EnsembleAPILoadFileError(
                     f"\tProvided files do not match expected input. Provide an XML file"
                 )
+            if len(find_xml(existing_files)) > 1:
+                log_warning(
+                    f"\tSeveral XML files provided, only {xml_path} is simulated.",
+                    "\tUse `ensemble batch` to run all of them.",
+                )
             try:
                 platooncsv_path = find_csv(existing_files)[0]
             except IndexError:
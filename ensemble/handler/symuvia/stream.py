@@ -21,6 +21,7 @@ from ensemble.metaclass.stream import DataQuery
 import ensemble.tools.constants as ct
 from ensemble.handler.symuvia.xmlparser import XMLTrajectory
 from ensemble.component.vehiclelist import VehicleList
+from ensemble.tools.profiler import PROFILER
 
 # ============================================================================
 # CLASS AND DEFINITIONS
@@ -34,8 +35,15 @@ response = defaultdict(lambda: False)
 
 
 class SimulatorRequest(DataQuery):
-    def __init__(self, **kwargs):
+    """Request of the SymuVia stream. When a region of interest is given only the vehicles inside it are parsed, check ``ensemble.component.region``.
+
+    Args:
+        roi (RegionOfInterest, optional): Region of interest. Defaults to None.
+    """
+
+    def __init__(self, roi=None, **kwargs):
         super().__init__(**kwargs)
+        self.roi = roi
         self.datatraj = XMLTrajectory(b"")
 
     # =========================================================================
@@ -49,9 +57,16 @@ class SimulatorRequest(DataQuery):
 
     @query.setter
     def query(self, response: bytes):
-        self.datatraj = XMLTrajectory(response)
-        self.dispatch()
-        self.update_vehicle_registry()
+        PROFILER.count("parse_bytes", len(response))
+        with PROFILER.section("parse"):
+            self.datatraj = XMLTrajectory(response, self.roi)
+        with PROFILER.section("registry"):
+            self.dispatch()
+            self.update_vehicle_registry()
+        if self.roi is not None:
+            PROFILER.count("outside", self.datatraj.outside)
+        if PROFILER.enabled:
+            PROFILER.count("queued", sum(self.events.queued.values()))
 
     @property
     def current_time(self) -> float:
@@ -61,6 +76,16 @@ class SimulatorRequest(DataQuery):
     def current_nbveh(self) -> int:
         return self.datatraj.nbveh
 
+    @property
+    def events(self):
+        """Vehicle creations, exits and entry queues of the current frame, check ``ensemble.component.events``"""
+        return self.datatraj.events
+
+    @property
+    def current_outside(self) -> int:
+        """Vehicles of the current frame out of the region of interest"""
+        return self.datatraj.outside
+
     @property
     def data_query(self):
         """Direct parsing from the string buffer
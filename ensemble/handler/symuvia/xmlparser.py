@@ -2,6 +2,8 @@
 Symuvia XML Parser
 ==================
 A parser for trajectories from symuvia. 
+
+When a region of interest is given, the ``TRAJ`` elements are filtered on their raw values before any conversion. Vehicles out of the region are counted in ``outside`` but never converted, the per field properties still read the whole frame.
 """
 
 # ============================================================================
@@ -9,12 +11,15 @@ A parser for trajectories from symuvia.
 # ============================================================================
 import re
 from functools import cached_property
+from itertools import compress
+import numpy as np
 
 # ============================================================================
 # INTERNAL IMPORTS
 # ============================================================================
 
 from ensemble.tools.constants import FIELD_FORMAT, FIELD_DATA
+from ensemble.component.events import Creation, Exit, Queue, StepEvents
 
 # ============================================================================
 # CLASS AND DEFINITIONS
@@ -42,10 +47,25 @@ PATTERN = {
     ),
     "inst": re.compile(r'val="(.*?)"'),
     "nbveh": re.compile(r'nbVeh="(.*?)"'),
+    "creation": re.compile(r"<CREATION ([^>]*?)/>"),
+    "sortie": re.compile(r"<SORTIE ([^>]*?)/>"),
+    "entree": re.compile(r"<ENTREE ([^>]*?)/>"),
+    "attr": re.compile(r'(\w+)="(.*?)"'),
 }
 
 CAV_TYPE = tuple(value for key, value in FIELD_FORMAT.items())
 
+# Positions of the raw `traj` values
+TRAJ_ABS, TRAJ_ORD, TRAJ_TRON, TRAJ_TYPE = 0, 5, 6, 7
+
+INST_TIME = re.compile(rb'\bval="([^"]*)"')
+
+
+def frame_time(frame: bytes) -> float:
+    """Simulation time of a raw frame read from its header only, nan when missing"""
+    match = INST_TIME.search(frame, 0, 256)
+    return float(match.group(1)) if match else np.nan
+
 
 class XMLTrajectory:
     """Model object for a trajectory, it can be created from a xml and contains trajectories for a set of vehicles."""
@@ -63,8 +83,21 @@ class XMLTrajectory:
         "vehtype": "type",
     }
 
-    def __init__(self, xml: bytes):
+    def __init__(self, xml: bytes, roi=None):
         self._xml = xml.decode("UTF8")
+        self.roi = roi
+        self._total = 0
+
+    @classmethod
+    def from_archive(cls, archive, step: int, roi=None):
+        """Trajectory of an archived frame
+
+        Args:
+            archive (FrameArchive): Archive of raw frames
+            step (int): Step of the frame
+            roi (RegionOfInterest, optional): Region of interest. Defaults to None.
+        """
+        return cls(archive.get(step), roi)
 
     def __getattr__(self, name):
         if name == "aliases":
@@ -200,17 +233,41 @@ class XMLTrajectory:
         """
         return tuple(map(float, PATTERN.get("z").findall(self._xml)))
 
+    @cached_property
+    def rows(self) -> tuple:
+        """Raw `traj` values of the vehicles in the region of interest, no conversion is performed
+
+        Returns:
+            tuple: raw `traj` values
+        """
+        rows = PATTERN.get("traj").findall(self._xml)
+        self._total = len(rows)
+        if self.roi is None or not rows:
+            return tuple(rows)
+        x = y = None
+        if self.roi.positional:
+            n = len(rows)
+            x = np.fromiter((float(r[TRAJ_ABS]) for r in rows), float, n)
+            y = np.fromiter((float(r[TRAJ_ORD]) for r in rows), float, n)
+        keep = self.roi.mask(
+            [r[TRAJ_TRON] for r in rows], [r[TRAJ_TYPE] for r in rows], x, y
+        )
+        return tuple(compress(rows, keep))
+
+    @property
+    def outside(self) -> int:
+        """Number of vehicles left out by the region of interest"""
+        rows = self.rows
+        return self._total - len(rows)
+
     @cached_property
     def traj(self):
-        """Trajectory cached values for all vehicles in network
+        """Trajectory cached values for vehicles in the region of interest, all vehicles by default
 
         Returns:
             tuple: cached `traj` values
         """
-        return tuple(
-            XMLTrajectory._typeconvert(x)
-            for x in PATTERN.get("traj").findall(self._xml)
-        )
+        return tuple(XMLTrajectory._typeconvert(x) for x in self.rows)
 
     @cached_property
     def inst(self):
@@ -230,6 +287,40 @@ class XMLTrajectory:
         """
         return int(PATTERN.get("nbveh").findall(self._xml)[0])
 
+    def _elements(self, name: str) -> list:
+        """Attributes of the `name` elements of the frame"""
+        attr = PATTERN.get("attr")
+        return [
+            dict(attr.findall(x)) for x in PATTERN.get(name).findall(self._xml)
+        ]
+
+    @cached_property
+    def events(self) -> StepEvents:
+        """Vehicle creations, exits and entry queues of the frame
+
+        Returns:
+            StepEvents: typed events
+        """
+        return StepEvents(
+            tuple(
+                Creation(
+                    int(x["id"]),
+                    x.get("type", ""),
+                    x.get("entree", ""),
+                    x.get("sortie", ""),
+                )
+                for x in self._elements("creation")
+            ),
+            tuple(
+                Exit(int(x["id"]), x.get("sortie", ""))
+                for x in self._elements("sortie")
+            ),
+            tuple(
+                Queue(x.get("id", ""), int(x.get("nb_veh_en_attente", 0)))
+                for x in self._elements("entree")
+            ),
+        )
+
     @cached_property
     def todict(self):
         """Converts to dictionary any of the data in the"""
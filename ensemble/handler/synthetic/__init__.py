@@ -0,0 +1 @@
+from ensemble.handler.synthetic.connector import SyntheticConnector
@@ -0,0 +1,183 @@
+"""
+Synthetic Connector
+===================
+This module implements a connector streaming the frames of a ``StreamGenerator`` instead of running a simulator. The parsing, the vehicle registry and the tactical layer are then loaded with any number of vehicles, without the native library.
+
+Frames are sent to the SymuVia request, or to the Vissim request as attribute tuples when ``stream`` is ``"vissim"``.
+
+The scenario is the set of generator parameters, given as a dictionary or as a JSON file, check ``ensemble.handler.synthetic.generator``. A ``stream`` key in the scenario selects the format of the frames.
+
+Example:
+    Stream 600 steps of 20 000 vehicles ::
+
+        >>> from ensemble.handler.synthetic import SyntheticConnector
+        >>> connector = SyntheticConnector(total_steps=600)
+        >>> connector.load_scenario({"links": 100, "lanes": 4, "density": 50})
+        >>> while connector.do_next:
+        ...     connector.query_data()
+
+    Or from the command line ::
+
+        ensemble -p synthetic launch -s path/to/parameters.json
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import json
+from typing import Union
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.metaclass.connector import AbsConnector
+from ensemble.handler.symuvia.stream import SimulatorRequest
+from ensemble.handler.vissim.stream import SimulatorRequest as VissimRequest
+from ensemble.handler.synthetic.generator import StreamGenerator
+from ensemble.tools.exceptions import EnsembleAPILoadFileError
+from ensemble.tools.screen import log_verify
+from ensemble.tools.profiler import PROFILER
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+REQUESTS = {"symuvia": SimulatorRequest, "vissim": VissimRequest}
+
+
+class SyntheticConnector(AbsConnector):
+    """Connector streaming synthetic frames
+
+    Args:
+        parameters (dict, optional): Parameters of the generator. Defaults to None.
+        stream (str, optional): Format of the frames, "symuvia" or "vissim". Defaults to "symuvia".
+        total_steps (int, optional): Steps streamed, 0 for no limit. Defaults to 0.
+        roi (RegionOfInterest, optional): Region of interest of the SymuVia request. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        parameters: dict = None,
+        stream: str = "symuvia",
+        total_steps: int = 0,
+        roi=None,
+    ):
+        if stream not in REQUESTS:
+            raise ValueError(f"Unknown synthetic stream: {stream}")
+        self.parameters = dict(parameters or {})
+        self.stream = stream
+        self.total_steps = total_steps
+        self.roi = roi
+        self.library_path = ""
+        self.generator = None
+        self.request = self._request()
+        self._c_iter = 0
+        self._bContinue = False
+
+    def _request(self):
+        if self.stream == "symuvia":
+            return REQUESTS["symuvia"](roi=self.roi)
+        return REQUESTS["vissim"]()
+
+    # ========================================================================
+    # LOADING METHODS
+    # ========================================================================
+
+    def load_simulator(self):
+        """Nothing to load, frames come from the generator"""
+        pass
+
+    def register_simulation(self, scenarioPath: Union[str, dict]):
+        """Registers the generator parameters
+
+        Args:
+            scenarioPath (str, dict): Parameters or path of a JSON file holding them
+        """
+        if isinstance(scenarioPath, dict):
+            parameters = dict(scenarioPath)
+        else:
+            with open(scenarioPath) as f:
+                parameters = json.load(f)
+        stream = parameters.pop("stream", self.stream)
+        if stream not in REQUESTS:
+            raise ValueError(f"Unknown synthetic stream: {stream}")
+        self.stream = stream
+        self.parameters = parameters
+
+    def load_scenario(self, scenario: Union[str, dict] = None):
+        """Creates the generator and resets the request
+
+        Args:
+            scenario (str, dict, optional): Parameters replacing ``parameters``, or path of a JSON file holding them. Defaults to None.
+        """
+        try:
+            if scenario is not None:
+                self.register_simulation(scenario)
+            self.generator = StreamGenerator(**self.parameters)
+        except (OSError, ValueError, TypeError):
+            raise EnsembleAPILoadFileError(
+                "\t Synthetic scenario could not be loaded", str(scenario)
+            )
+        self.performInitialize()
+        log_verify(
+            f"\t Synthetic scenario loaded: {len(self.generator)} vehicles"
+        )
+
+    def performInitialize(self):
+        """Resets the request and the step counter"""
+        self.request = self._request()
+        self._c_iter = 0
+        self._bContinue = True
+
+    # ========================================================================
+    # STEPPING
+    # ========================================================================
+
+    def request_answer(self):
+        """Advances the generator and sends its frame to the request"""
+        with PROFILER.section("simulator"):
+            self.generator.advance()
+            if self.stream == "symuvia":
+                frame = self.generator.frame()
+            else:
+                frame = self.generator.rows()
+                self.request.sim_sec = self.generator.time
+        self.request.query = frame
+
+    def query_data(self) -> int:
+        """Streams a step
+
+        Returns:
+            int: Step of the frame
+        """
+        self.request_answer()
+        self._c_iter += 1
+        self._bContinue = (
+            not self.total_steps or self._c_iter < self.total_steps
+        )
+        return self._c_iter
+
+    def push_data(self):
+        """Synthetic vehicles do not react to control"""
+        pass
+
+    # ========================================================================
+    # ATTRIBUTES
+    # ========================================================================
+
+    @property
+    def get_vehicle_data(self):
+        """Returns the query of the last frame"""
+        return self.request.get_vehicle_data()
+
+    @property
+    def simulation_step(self) -> int:
+        """Step of the last frame streamed"""
+        return self._c_iter
+
+    @property
+    def do_next(self) -> bool:
+        """True until ``total_steps`` frames are streamed"""
+        return self._bContinue
@@ -0,0 +1,300 @@
+"""
+Stream Generator
+================
+This module generates synthetic traffic on a corridor of links laid end to end, each with the same number of lanes. Vehicles enter the first link following a demand per lane, drive along their lane with the Intelligent Driver Model and leave at the end of the last link.
+
+The state is held in NumPy arrays and advanced for all vehicles at once, so networks of tens of thousands of vehicles are stepped without a simulator. Each step is emitted as:
+
+* A SymuVia ``<INST>`` frame with creations, exits, trajectories and entry queues, check ``frame``
+* Vissim tuples in the order of ``ensemble.handler.vissim.stream.ATTRIBUTES``, check ``rows``
+
+A share of the vehicles entering are platoon trucks, ``PLT`` in SymuVia frames and ``201`` in Vissim rows.
+
+Example:
+    Generate 1000 frames of a loaded corridor ::
+
+        >>> from ensemble.handler.synthetic.generator import StreamGenerator
+        >>> generator = StreamGenerator(links=20, lanes=3, density=40, seed=0)
+        >>> for _ in range(1000):
+        ...     generator.advance()
+        ...     frame = generator.frame()
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import numpy as np
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+# Vehicle classes: (SymuVia type, Vissim type, length [m], desired speed [m/s])
+CLASSES = (
+    ("VL", "100", 4.5, 30.0),
+    ("PLT", "201", 12.0, 25.0),
+)
+SYMUVIA_TYPES, VISSIM_TYPES, LENGTHS, SPEEDS = map(np.array, zip(*CLASSES))
+
+TRAJ = (
+    '<TRAJ abs="%.2f" acc="%.2f" dst="%.2f" id="%d" ord="%.2f" '
+    'tron="%s" type="%s" vit="%.2f" voie="%d" z="0.00"/>'
+)
+CREATION = '<CREATION entree="Ext_In" id="%d" sortie="Ext_Out" type="%s"/>'
+SORTIE = '<SORTIE id="%d" sortie="Ext_Out"/>'
+
+
+class StreamGenerator:
+    """Synthetic traffic on a corridor
+
+    Args:
+        links (int, optional): Number of links. Defaults to 10.
+        lanes (int, optional): Number of lanes of each link. Defaults to 2.
+        length (float, optional): Length of each link [m]. Defaults to 1000.
+        demand (float, optional): Flow entering each lane [veh/h]. Defaults to 1200.
+        truck_share (float, optional): Share of platoon trucks in the demand and the initial vehicles. Defaults to 0.1.
+        density (float, optional): Initial vehicles per kilometer and lane. Defaults to 0.
+        sampling_time (float, optional): Time step [s]. Defaults to 1.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+        lane_width (float, optional): Width of the lanes [m]. Defaults to 3.5.
+        time_headway (float, optional): Desired time headway [s]. Defaults to 1.5.
+        min_gap (float, optional): Standstill gap [m]. Defaults to 2.
+        max_acceleration (float, optional): Maximum acceleration [m/s2]. Defaults to 1.5.
+        comfort_deceleration (float, optional): Comfortable deceleration [m/s2]. Defaults to 2.
+    """
+
+    def __init__(
+        self,
+        links: int = 10,
+        lanes: int = 2,
+        length: float = 1000.0,
+        demand: float = 1200.0,
+        truck_share: float = 0.1,
+        density: float = 0.0,
+        sampling_time: float = 1.0,
+        seed: int = None,
+        lane_width: float = 3.5,
+        time_headway: float = 1.5,
+        min_gap: float = 2.0,
+        max_acceleration: float = 1.5,
+        comfort_deceleration: float = 2.0,
+    ):
+        self.links = links
+        self.lanes = lanes
+        self.length = length
+        self.demand = demand
+        self.truck_share = truck_share
+        self.sampling_time = sampling_time
+        self.lane_width = lane_width
+        self.time_headway = time_headway
+        self.min_gap = min_gap
+        self.max_acceleration = max_acceleration
+        self.comfort_deceleration = comfort_deceleration
+        self.rng = np.random.default_rng(seed)
+        self.link_names = np.array([f"Link_{i:03d}" for i in range(links)])
+        self.link_numbers = np.array([str(i + 1) for i in range(links)])
+        self.time = 0.0
+        self.step = 0
+        self._next_id = 0
+        self.queues = np.zeros(lanes, np.int64)
+        self.vehid = np.empty(0, np.int64)
+        self.vclass = np.empty(0, np.int8)
+        self.lane = np.empty(0, np.int64)
+        self.position = np.empty(0, float)  # Along the corridor [m]
+        self.speed = np.empty(0, float)
+        self.acceleration = np.empty(0, float)
+        self.desired_speed = np.empty(0, float)
+        self.created = np.empty(0, np.int64)
+        self.exited = np.empty(0, np.int64)
+        if density > 0:
+            self._fill(density)
+
+    def __len__(self) -> int:
+        return len(self.vehid)
+
+    # ========================================================================
+    # DYNAMICS
+    # ========================================================================
+
+    def _draw(self, count: int):
+        """Classes and desired speeds of new vehicles"""
+        vclass = (self.rng.random(count) < self.truck_share).astype(np.int8)
+        speeds = SPEEDS[vclass] * self.rng.uniform(0.9, 1.1, count)
+        return vclass, speeds
+
+    def _add(self, lane, position, speed, vclass, desired_speed):
+        """Appends vehicles to the state, ids in order of creation"""
+        count = len(lane)
+        vehid = np.arange(self._next_id, self._next_id + count)
+        self._next_id += count
+        self.vehid = np.concatenate((self.vehid, vehid))
+        self.vclass = np.concatenate((self.vclass, vclass))
+        self.lane = np.concatenate((self.lane, lane))
+        self.position = np.concatenate((self.position, position))
+        self.speed = np.concatenate((self.speed, speed))
+        self.acceleration = np.concatenate(
+            (self.acceleration, np.zeros(count))
+        )
+        self.desired_speed = np.concatenate(
+            (self.desired_speed, desired_speed)
+        )
+        return vehid
+
+    def _fill(self, density: float):
+        """Places vehicles evenly on every lane, downstream vehicles first as if they entered earlier"""
+        spacing = 1000.0 / density
+        slots = np.arange(self.links * self.length - spacing, 0, -spacing)
+        count = len(slots) * self.lanes
+        lane = np.tile(np.arange(1, self.lanes + 1), len(slots))
+        position = np.repeat(slots, self.lanes)
+        vclass, desired = self._draw(count)
+        # Equilibrium speed of the spacing
+        gap = spacing - LENGTHS[vclass] - self.min_gap
+        speed = np.clip(gap / self.time_headway, 0, desired)
+        self._add(lane, position, speed, vclass, desired)
+
+    def _leaders(self):
+        """Gap to the leader and leader speed of every vehicle, infinite gap when free"""
+        order = np.lexsort((self.position, self.lane))
+        lane = self.lane[order]
+        position = self.position[order]
+        lengths = LENGTHS[self.vclass[order]]
+        gap = np.full(len(order), np.inf)
+        leader_speed = self.speed[order]
+        same = lane[1:] == lane[:-1]
+        gap[:-1][same] = (position[1:] - lengths[1:] - position[:-1])[same]
+        leader_speed[:-1][same] = self.speed[order][1:][same]
+        result = np.empty((2, len(order)))
+        result[0, order], result[1, order] = gap, leader_speed
+        return result
+
+    def advance(self):
+        """Advances the traffic by one time step"""
+        dt = self.sampling_time
+        self.step += 1
+        self.time = self.step * dt
+        if len(self):
+            gap, leader_speed = self._leaders()
+            v = self.speed
+            a, b = self.max_acceleration, self.comfort_deceleration
+            desired_gap = self.min_gap + np.maximum(
+                0,
+                v * self.time_headway
+                + v * (v - leader_speed) / (2 * np.sqrt(a * b)),
+            )
+            acceleration = a * (
+                1
+                - (v / self.desired_speed) ** 4
+                - (desired_gap / np.maximum(gap, 0.1)) ** 2
+            )
+            speed = np.maximum(v + acceleration * dt, 0)
+            # Never reach the current rear of the leader
+            speed = np.minimum(speed, np.maximum(gap - 1.0, 0) / dt)
+            self.acceleration = (speed - v) / dt
+            self.speed = speed
+            self.position = self.position + speed * dt
+        self._exit()
+        self._enter()
+
+    def _exit(self):
+        """Removes the vehicles beyond the end of the corridor"""
+        inside = self.position < self.links * self.length
+        self.exited = self.vehid[~inside]
+        if len(self.exited):
+            for name in (
+                "vehid",
+                "vclass",
+                "lane",
+                "position",
+                "speed",
+                "acceleration",
+                "desired_speed",
+            ):
+                setattr(self, name, getattr(self, name)[inside])
+
+    def _enter(self):
+        """Draws the arrivals of each lane and inserts the queued vehicles where the entry is free"""
+        rate = self.demand * self.sampling_time / 3600
+        self.queues += self.rng.poisson(rate, self.lanes)
+        entry = np.full(self.lanes, np.inf)
+        np.minimum.at(entry, self.lane - 1, self.position)
+        free = entry > LENGTHS.max() + self.min_gap
+        lanes = np.flatnonzero(free & (self.queues > 0))
+        if not len(lanes):
+            self.created = np.empty(0, np.int64)
+            return
+        self.queues[lanes] -= 1
+        vclass, desired = self._draw(len(lanes))
+        # Speed of the headway to the last vehicle of the lane
+        headway = (entry[lanes] - self.min_gap) / self.time_headway
+        speed = np.clip(headway, 0, desired)
+        self.created = self._add(
+            lanes + 1, np.zeros(len(lanes)), speed, vclass, desired
+        )
+
+    # ========================================================================
+    # OUTPUTS
+    # ========================================================================
+
+    def _columns(self):
+        """Link index, distance on the link and ordinate of every vehicle"""
+        link = np.minimum(
+            (self.position // self.length).astype(np.int64), self.links - 1
+        )
+        distance = self.position - link * self.length
+        ordinate = (self.lane - 0.5) * self.lane_width  # Lane centers
+        return link, distance, ordinate
+
+    def frame(self) -> bytes:
+        """SymuVia ``<INST>`` frame of the current step"""
+        link, distance, ordinate = self._columns()
+        types = SYMUVIA_TYPES
+        created = np.isin(self.vehid, self.created, assume_unique=True)
+        creations = "".join(
+            CREATION % row
+            for row in zip(
+                self.vehid[created].tolist(),
+                types[self.vclass[created]].tolist(),
+            )
+        )
+        exits = "".join(SORTIE % i for i in self.exited.tolist())
+        trajs = "".join(
+            TRAJ % row
+            for row in zip(
+                self.position.tolist(),
+                self.acceleration.tolist(),
+                distance.tolist(),
+                self.vehid.tolist(),
+                ordinate.tolist(),
+                self.link_names[link].tolist(),
+                types[self.vclass].tolist(),
+                self.speed.tolist(),
+                self.lane.tolist(),
+            )
+        )
+        return (
+            f'<INST nbVeh="{len(self)}" val="{self.time:.2f}">'
+            f"<CREATIONS>{creations}</CREATIONS><SORTIES>{exits}</SORTIES>"
+            f"<TRAJS>{trajs}</TRAJS><STREAMS/><LINKS/><SGTS/><FEUX/>"
+            f'<ENTREES><ENTREE id="Ext_In" nb_veh_en_attente="'
+            f'{int(self.queues.sum())}"/></ENTREES><REGULATIONS/></INST>'
+        ).encode()
+
+    def rows(self) -> tuple:
+        """Vissim tuples of the current step, speeds in [km/h]"""
+        link, distance, ordinate = self._columns()
+        types = VISSIM_TYPES
+        return tuple(
+            zip(
+                self.position.tolist(),
+                self.acceleration.tolist(),
+                distance.tolist(),
+                self.vehid.tolist(),
+                ordinate.tolist(),
+                self.link_numbers[link].tolist(),
+                types[self.vclass].tolist(),
+                (self.speed * 3.6).tolist(),
+                self.lane.tolist(),
+            )
+        )
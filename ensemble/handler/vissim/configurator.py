@@ -36,12 +36,24 @@ class VissimConfigurator(ConnectorConfigurator):
         library_path (str):
             Absolute path towards the simulator library
 
+        fast_forward (bool):
+            Runs continuously without querying vehicles until a platoon vehicle is probed
+
+        fast_forward_until (float):
+            Simulation time ending the fast forward, 0 for none
+
+        probe_interval (int):
+            Steps between probes for platoon vehicles during fast forward
+
     Returns:
         configurator (Configurator):
             Configurator object with simulation parameters
     """
 
     library_path: str = CT.DCT_DEFAULT_PATHS[("vissim", platform.system())]
+    fast_forward: bool = False
+    fast_forward_until: float = 0
+    probe_interval: int = CT.DCT_RUNTIME_PARAM["probe_interval"]
 
     def __init__(self, **kwargs) -> None:
         """Configurator class for containing specific simulator parameter
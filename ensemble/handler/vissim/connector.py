@@ -1,5 +1,7 @@
 """
     This module contains objects for modeling a simplified connector to handle vissim
+
+    In fast forward mode the vehicles are not queried. The simulation runs continuously up to the next probe, ``probe_interval`` steps ahead, and the steps in between only advance the step counter. At each probe the vehicle types are queried, the connector switches to single steps and full queries when a platoon vehicle is found or once ``fast_forward_until`` is reached.
 """
 
 # ============================================================================
@@ -11,7 +13,7 @@
 # INTERNAL IMPORTS
 # ============================================================================
 
-from ensemble.handler.vissim.stream import SimulatorRequest
+from ensemble.handler.vissim.stream import SimulatorRequest, ATTRIBUTES
 from ensemble.handler.vissim.configurator import VissimConfigurator
 from ensemble.handler.vissim.scenario import VissimScenario
 
@@ -37,6 +39,8 @@ import ensemble.tools.constants as CT
 # CLASS AND DEFINITIONS
 # ============================================================================
 
+PLT_TYPES = CT.DCT_PLT_CONST["platoon_types"]
+
 try:
     import win32com.client as com
     from pywintypes import com_error
@@ -54,6 +58,8 @@ class VissimConnector(AbsConnector, VissimConfigurator):
     def __init__(self, **kwargs) -> None:
         AbsConnector.__init__(self)
         VissimConfigurator.__init__(self, **kwargs)
+        self._forwarding = False
+        self._resume_at = 0
         self.load_simulator()
 
     def load_simulator(self) -> None:
@@ -117,25 +123,9 @@ class VissimConnector(AbsConnector, VissimConfigurator):
         """
         Request simulator answer and maps the data locally
         """
-        vehsAttributesNamesVissim = (
-            "CoordFrontX",
-            "Acceleration",
-            "Pos",
-            "No",
-            "CoordFrontY",
-            "Lane\\Link\\No",
-            "VehType",
-            "Speed",
-            "Lane\\Index",
+        self.request.query = self.__library.Net.Vehicles.GetMultipleAttributes(
+            ATTRIBUTES
         )
-        vehsAttributes = self.__library.Net.Vehicles.GetMultipleAttributes(
-            vehsAttributesNamesVissim
-        )
-        vehData = [
-            dict(zip(vehsAttributesNamesVissim, item))
-            for item in vehsAttributes
-        ]
-        self.request.query = vehData  # List[Dicts]
         self.request.sim_sec = self.__library.Simulation.AttValue(
             "SimSec"
         )  # self.sim_sec
@@ -148,6 +138,32 @@ class VissimConnector(AbsConnector, VissimConfigurator):
         """
         self.__library.Simulation.RunSingleStep()
 
+    def fast_forward_step(self):
+        """Advances a step without querying vehicles. At each probe the vehicle types are checked, then the simulation runs continuously until the next probe."""
+        if not hasattr(self.request, "vehicle_registry"):
+            self.request.create_vehicle_registry()
+        if self._c_iter < self._resume_at:
+            return  # Already simulated by the continuous run
+
+        simulation = self.__library.Simulation
+        sim_sec = simulation.AttValue("SimSec")
+        types = self.__library.Net.Vehicles.GetMultipleAttributes(("VehType",))
+        until = 0 < self.fast_forward_until <= sim_sec
+        if until or any(str(t[0]) in PLT_TYPES for t in types):
+            self._forwarding = False
+            log_success(f"\t Full vehicle query from step: {self._c_iter}")
+            self.request_answer()
+            self.run_single_step()
+            return
+
+        break_at = sim_sec + self.probe_interval / self.sim_res
+        if self.fast_forward_until > 0:
+            break_at = min(break_at, self.fast_forward_until)
+        simulation.SetAttValue("SimBreakAt", break_at)
+        simulation.RunContinuous()
+        steps = round((break_at - sim_sec) * self.sim_res)
+        self._resume_at = self._c_iter + steps * self.sim_res
+
     def query_data(self) -> int:
         """Run simulation step by step
 
@@ -156,6 +172,10 @@ class VissimConnector(AbsConnector, VissimConfigurator):
           To test query, you can use click.echo(self.get_vehicle_data()) after request_answer()
         """
         try:
+            if self._forwarding:
+                self.fast_forward_step()
+                self._c_iter = next(self._n_iter)
+                return self._c_iter
             self.request_answer()
             self.run_single_step()
             self._c_iter = next(self._n_iter)
@@ -186,6 +206,8 @@ class VissimConnector(AbsConnector, VissimConfigurator):
         self._n_iter = iter(self.get_simulation_steps())
         self._c_iter = next(self._n_iter)
         self._bContinue = True
+        self._forwarding = self.fast_forward
+        self._resume_at = self._c_iter
 
     def performPreRoutine(self) -> None:
         """
@@ -2,14 +2,17 @@
 Vissim Stream
 ================
 This module is able to receive the stream of data comming from the Vissim platform and define a parser for a specific vehicle data suitable to perform platooning activities.
+
+The response of ``GetMultipleAttributes`` is converted once per frame into typed columns, one NumPy array per field of ``FIELD_DATA_VISSIM``. Vehicle dictionaries and lookups by vehicle id are built from the columns on first use and cached until the next frame.
 """
 
 # ============================================================================
 # STANDARD  IMPORTS
 # ============================================================================
 
-from typing import Union, Dict, List, Tuple
-from collections import defaultdict
+from typing import Union, Dict, List, Tuple, Sequence, Mapping
+from functools import cached_property
+import numpy as np
 
 # ============================================================================
 # INTERNAL IMPORTS
@@ -18,6 +21,7 @@ from collections import defaultdict
 from ensemble.metaclass.stream import DataQuery
 import ensemble.tools.constants as ct
 from ensemble.component.vehiclelist import VehicleList
+from ensemble.tools.profiler import PROFILER
 
 # ============================================================================
 # CLASS AND DEFINITIONS
@@ -27,14 +31,95 @@ vtypes = Union[float, int, str]
 vdata = Tuple[vtypes]
 vmaps = Dict[str, vtypes]
 vlists = List[vmaps]
-response = defaultdict(lambda: False)
 simresponse = List[List]
 
+ATTRIBUTES = (
+    "CoordFrontX",
+    "Acceleration",
+    "Pos",
+    "No",
+    "CoordFrontY",
+    "Lane\\Link\\No",
+    "VehType",
+    "Speed",
+    "Lane\\Index",
+)
+
+DEFAULTS = {"@z": 0.0, "@etat_pilotage": False}
+
+
+def _column(attribute: str, values: Sequence) -> np.ndarray:
+    """Typed column of an attribute, converted as in ``FIELD_FORMAT_VISSIM``. Types are applied to the whole column, other converters, e.g. units, value by value."""
+    convert = ct.FIELD_FORMAT_VISSIM[attribute]
+    if convert is str:
+        column = np.empty(len(values), dtype=object)
+        column[:] = [str(v) for v in values]
+        return column
+    if convert is bool:
+        return np.fromiter((bool(v) for v in values), bool, len(values))
+    if isinstance(convert, type):
+        return np.asarray(values, dtype=convert)
+    return np.array([convert(v) for v in values], dtype=float)
+
+
+class VissimFrame:
+    """Vehicles of a Vissim response as typed columns
+
+    Args:
+        rows (Sequence): One tuple of values per vehicle, as returned by ``GetMultipleAttributes``
+        attributes (Sequence[str], optional): Vissim attributes of the values. Defaults to ``ATTRIBUTES``.
+    """
+
+    def __init__(
+        self, rows: Sequence = (), attributes: Sequence[str] = ATTRIBUTES
+    ):
+        self.nbveh = len(rows)
+        values = tuple(zip(*rows)) if rows else ((),) * len(attributes)
+        self.columns = {
+            ct.FIELD_DATA_VISSIM[a]: _column(a, v)
+            for a, v in zip(attributes, values)
+        }
+        for attribute, default in DEFAULTS.items():
+            field = ct.FIELD_DATA_VISSIM[attribute]
+            if field not in self.columns:
+                self.columns[field] = np.full(
+                    self.nbveh, default, dtype=type(default)
+                )
+
+    @classmethod
+    def from_dicts(cls, data: Sequence[Mapping]):
+        """Frame from vehicle dictionaries with Vissim attributes as keys"""
+        if not data:
+            return cls()
+        attributes = tuple(data[0])
+        rows = tuple(tuple(d.get(a) for a in attributes) for d in data)
+        return cls(rows, attributes)
+
+    @cached_property
+    def records(self) -> vlists:
+        """Vehicle dictionaries, values as Python scalars"""
+        keys = sorted(self.columns)
+        values = [self.columns[k].tolist() for k in keys]
+        return [dict(zip(keys, row)) for row in zip(*values)]
+
+    @cached_property
+    def index(self) -> Dict[int, int]:
+        """Row of each vehicle id"""
+        vehids = self.columns["vehid"].tolist()
+        return {vehid: i for i, vehid in enumerate(vehids)}
+
+    def get(self, field: str) -> vdata:
+        """Values of a field for all vehicles, None for an unknown field"""
+        if field not in self.columns:
+            return (None,) * self.nbveh
+        return tuple(self.columns[field].tolist())
+
 
 class SimulatorRequest(DataQuery):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        # initialize extra things here!
+        self.frame = VissimFrame()
+        self._str_response = None
 
     # =========================================================================
     # MEMORY HANDLING
@@ -42,14 +127,18 @@ class SimulatorRequest(DataQuery):
 
     @property
     def query(self):
-        """String response from the simulator"""
+        """Response from the simulator"""
         return self._str_response
 
     @query.setter
     def query(self, response):
+        """Response from the simulator, either the tuples of ``GetMultipleAttributes`` for ``ATTRIBUTES`` or vehicle dictionaries with Vissim attributes as keys"""
         self._str_response = response
-        self.update_vehicle_registry()
-        self.dispatch()
+        with PROFILER.section("parse"):
+            self.frame = SimulatorRequest.parse(response)
+        with PROFILER.section("registry"):
+            self.update_vehicle_registry()
+            self.dispatch()
 
     @property
     def current_time(self) -> float:
@@ -60,13 +149,35 @@ class SimulatorRequest(DataQuery):
     @property
     def current_nbveh(self) -> int:
         """Number of vehicles in the network"""
-        # TODO: What is self._str_response?
-        return len(self._str_response)
+        return self.frame.nbveh
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Typed columns of the current frame, keys in ``FIELD_DATA_VISSIM`` values"""
+        return self.frame.columns
 
     # =========================================================================
     # METHODS
     # =========================================================================
 
+    @staticmethod
+    def parse(response) -> VissimFrame:
+        """Converts a response of the simulator into a frame
+
+        Args:
+            response: Tuples of values for ``ATTRIBUTES``, a vehicle dictionary or a list of them
+
+        Returns:
+            VissimFrame: Typed columns of the response
+        """
+        if response is None:
+            return VissimFrame()
+        if isinstance(response, Mapping):
+            return VissimFrame.from_dicts((response,))
+        if response and isinstance(response[0], Mapping):
+            return VissimFrame.from_dicts(response)
+        return VissimFrame(response)
+
     def create_vehicle_registry(self):
         """Creates a vehicle registry for all vehicles in simulation"""
         self.vehicle_registry = VehicleList(self)
@@ -81,18 +192,50 @@ class SimulatorRequest(DataQuery):
     def get_vehicle_data(self) -> list:
         """Extracts vehicles information from simulators response
 
+        Return:
+            listdict (list): List of dictionaries, cached for the current frame
+
+        """
+        return self.frame.records
+
+    def get_vehicles_property(self, property: str) -> vdata:
+        """Extracts a specific property and returns a tuple containing this
+        property for all vehicles in the current frame
+
         Args:
-            response (list): List of list with parameters
+            property (str):
+                one of the following options abscissa, acceleration, distance, elevation, lane, link, ordinate, speed, vehid, vehtype,
 
-        Return:
-            listdict (list): List of dictionaries
+        Returns:
+            values (tuple):
+                tuple with corresponding values e.g (0,1), (0,),(None,)
+        """
+        return self.frame.get(property)
+
+    def get_vehicle_properties(self, vehid: int) -> dict:
+        """Return all properties for a given vehicle id
+
+        Returns:
+            vehdata (dict): Dictionary with all vehicle properties
+        """
+        row = self.frame.index.get(vehid)
+        return {} if row is None else dict(self.frame.records[row])
+
+    def vehicles_in_link(self, link: str, lane: int = 1) -> vdata:
+        """Returns a tuple containing vehicle ids traveling on the same
+        (link,lane) at current state
+
+        Args:
+            link (str): link name
+            lane (int): lane number
+
+        Returns:
+            vehs (tuple): set of vehicles in link/lane
 
         """
-        if self.query is not None:
-            if isinstance(self.query, list):
-                return [SimulatorRequest.transform(d) for d in self.query]
-            return [SimulatorRequest.transform(self.query)]
-        return []
+        columns = self.frame.columns
+        mask = (columns["link"] == link) & (columns["lane"] == lane)
+        return tuple(columns["vehid"][mask].tolist())
 
     def is_vehicle_driven(self, vehid: int) -> bool:
         """Returns true if the vehicle state is exposed to a driven state
@@ -147,14 +290,4 @@ class SimulatorRequest(DataQuery):
             >>> },
 
         """
-        for key, val in veh_data.items():
-            response[ct.FIELD_DATA_VISSIM[key]] = ct.FIELD_FORMAT_VISSIM[key](
-                val
-            )
-        lkey = "@etat_pilotage"
-        response[ct.FIELD_DATA_VISSIM[lkey]] = ct.FIELD_FORMAT_VISSIM[lkey](
-            veh_data.get(lkey)
-        )
-        lkey = "@z"
-        response[ct.FIELD_DATA_VISSIM[lkey]] = 0
-        return dict(response)
+        return SimulatorRequest.parse(veh_data).records[0]
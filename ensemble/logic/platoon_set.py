@@ -12,6 +12,8 @@ from collections.abc import Sequence, Set
 from itertools import chain
 from bisect import bisect_left
 from itertools import count
+from dataclasses import dataclass
+from heapq import heappush, heappop
 
 # ============================================================================
 # INTERNAL IMPORTS
@@ -28,6 +30,54 @@ from ensemble.tools.constants import DCT_PLT_CONST
 MAXTRKS = DCT_PLT_CONST["max_platoon_length"]
 MAXNDST = DCT_PLT_CONST["max_connection_distance"]
 
+# Platoon lifecycle events
+CREATED = "created"
+MERGED = "merged"
+SPLIT = "split"
+DISSOLVED = "dissolved"
+
+
+@dataclass(frozen=True)
+class PlatoonEvent:
+    """Platoon lifecycle event
+
+    Args:
+        kind (str): One of ``created``, ``merged``, ``split``, ``dissolved``
+        platoonid (int): Platoon id affected by the event
+        members (tuple): Vehicle ids of the platoon after the event
+        source (int): Platoon id merged into or split from ``platoonid``. Defaults to -1.
+    """
+
+    kind: str
+    platoonid: int
+    members: tuple = ()
+    source: int = -1
+
+
+class PlatoonIdAllocator:
+    """Allocates platoon ids. Released ids are reused, lowest first, so that ids stay bounded by the number of live platoons."""
+
+    def __init__(self):
+        self._next = 0
+        self._free = []
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(live={len(self)})"
+
+    def __len__(self):
+        return self._next - len(self._free)
+
+    def allocate(self) -> int:
+        """Returns a free platoon id"""
+        if self._free:
+            return heappop(self._free)
+        self._next += 1
+        return self._next - 1
+
+    def release(self, platoonid: int) -> None:
+        """Releases a platoon id for reuse"""
+        heappush(self._free, platoonid)
+
 
 class PlatoonSet(SortedFrozenSet):
     """
@@ -52,6 +102,20 @@ class PlatoonSet(SortedFrozenSet):
         self.platoonid = id if id >= 0 else next(self.__class__.pid)
         self.update_pid()
 
+    @classmethod
+    def from_ordered(cls, items, id: int):
+        """Creates a platoon set from items already sorted by key. No sorting nor id consumption is performed.
+
+        Args:
+            items (Iterable): Items sorted from tail to head
+            id (int): Platoon id
+        """
+        platoon = cls.__new__(cls)
+        platoon._items = tuple(items)
+        platoon.platoonid = id
+        platoon.update_pid()
+        return platoon
+
     def __contains__(self, item):
         try:
             self.index(item)
@@ -111,6 +111,7 @@ class Platooning(AbsState):
 
     Note:
         Transition: `Platooning` to `Splitting`
+        Transition: `Platooning` to `Cutin`
     """
 
     def next_state(self, vehicle):
@@ -118,6 +119,7 @@ class Platooning(AbsState):
 
         Note:
             Transition: `Platooning` to `Splitting`
+            Transition: `Platooning` to `Cutin`
 
         Args:
             truck (vehicle): Platoon vehicle containing information of the ego vehicle.
@@ -125,33 +127,79 @@ class Platooning(AbsState):
         """
         if vehicle.platoon_split():
             return Splitting()
+        elif vehicle.cutin():
+            return Cutin()
         else:
             return self
 
 
 class Cutin(AbsState):
-    """The state which declares the vehicle in a platoon functionality
+    """The state which declares a vehicle in a platoon with an intruder in front
 
     Note:
         Transition: `Cutin` to `Splitting`
+        Transition: `Cutin` to `Platooning`
     """
 
     def next_state(self, vehicle):
         """Determines the switching condition for the state:
 
         Note:
-            Transition: `Platooning` to `Splitting`
+            Transition: `Cutin` to `Splitting`
+            Transition: `Cutin` to `Platooning`
 
         Args:
             truck (vehicle): Platoon vehicle containing information of the ego vehicle.
 
         """
-        if vehicle.cutin():
+        if vehicle.platoon_split():
             return Splitting()
+        elif not vehicle.cutin():
+            return Platooning()
         else:
             return self
 
 
+# Transition table: ordered rules per state, the first rule whose predicates
+# all hold gives the next state. Predicates are solved by the tactical layer:
+#
+# * joinable: leader is reachable and accepts a new member
+# * cancel: join request is cancelled
+# * confirm: gap to leader reached its reference
+# * split: vehicle requests to split
+# * rejoin: split vehicle may rejoin the platoon
+# * leave: split vehicle leaves the platoon
+# * intruder: a non platoon vehicle cut in front of the vehicle
+# * clear: the intruder left the gap towards the leader
+
+STATES = (StandAlone, Joining, Platooning, Splitting, Cutin)
+
+# States held for long periods, re-evaluated only on changes of their inputs
+STABLE = (StandAlone, Platooning)
+
+TRANSITIONS = {
+    StandAlone: (
+        (("joinable", "confirm"), Platooning),
+        (("joinable",), Joining),
+    ),
+    Joining: (
+        (("cancel",), StandAlone),
+        (("confirm",), Platooning),
+    ),
+    Platooning: (
+        (("split",), Splitting),
+        (("intruder",), Cutin),
+    ),
+    Splitting: (
+        (("rejoin",), Platooning),
+        (("leave",), StandAlone),
+    ),
+    Cutin: (
+        (("split",), Splitting),
+        (("clear",), Platooning),
+    ),
+}
+
 # class BackSplit(AbsState):
 #     """
 #     The state which declares the vehicle splitting from platoon
@@ -7,8 +7,8 @@ This module describes classes and objects to perform a runtime of a single scena
 # STANDARD  IMPORTS
 # ============================================================================
 
-from itertools import chain
-import click
+from time import perf_counter
+from typing import Callable
 
 # ============================================================================
 # INTERNAL IMPORTS
@@ -25,7 +25,10 @@ from .runtime_states import (
     PostRoutine,
     Terminate,
 )
+from .scheduler import MultiRateScheduler
 from ensemble.tools.screen import log_success
+from ensemble.tools.constants import DCT_RUNTIME_PARAM
+from ensemble.tools.profiler import PROFILER
 
 # ============================================================================
 # CLASS AND DEFINITIONS
@@ -37,40 +40,144 @@ RUNTIME_SEQ = ["preroutine", "query", "control", "push", "postroutine"]
 END_SEQ = [
     "terminate",
 ]
+PHASES = {
+    "compliance": Compliance,
+    "connect": Connect,
+    "initialize": Initialize,
+    "preroutine": PreRoutine,
+    "query": Query,
+    "control": Control,
+    "push": Push,
+    "postroutine": PostRoutine,
+    "terminate": Terminate,
+}
+
+LOG_INTERVAL = DCT_RUNTIME_PARAM["log_interval"]
+
+
+def count_step(configurator):
+    """Counts vehicles and platoons of the current step into the profiler"""
+    request = getattr(configurator.connector, "request", None)
+    vehicles = getattr(request, "vehicle_registry", None)
+    if vehicles is not None:
+        PROFILER.count("vehicles", len(vehicles))
+    platoons = getattr(configurator, "platoon_registry", None)
+    if platoons is not None:
+        PROFILER.count("platoons", platoons.nplatoons)
 
 
 class RuntimeDevice:
     """This class defines the runtime device describing a series of
     cyclic states required to be run:
 
+    The device owns a multi-rate scheduler that runs the tactical and operational layers at the sampling times declared in the simulation parameters.
+
+    The phases of a step are compiled once into a pipeline of bound ``run`` methods of the runtime states. Callables can be hooked before or after a phase, or around the whole step, they receive the configurator and may return ``False`` to terminate the simulation. The step counter is logged at most once every ``log_interval`` seconds.
+
+    When ``PROFILER`` is enabled at compilation, each phase and the full step are timed and the number of vehicles and platoons is counted after each step, check ``ensemble.tools.profiler``.
+
+    Example:
+        Log the number of vehicles after each query ::
+
+            >>> device = RuntimeDevice(configurator)
+            >>> device.add_hook(lambda c: print(len(c.vehicle_registry)), "post", "query")
+            >>> with device:
+            ...     pass
     """
 
     def __init__(self, configurator):
         self.state = Compliance()  # Initial state
         self.configurator = configurator
         self.cycles = configurator.total_steps
+        self.scheduler = MultiRateScheduler(configurator.simulation_parameters)
+        configurator.scheduler = self.scheduler
+        self.log_interval = configurator.simulation_parameters.get(
+            "log_interval", LOG_INTERVAL
+        )
+        self.states = {event: state() for event, state in PHASES.items()}
+        self.hooks = {"pre": {}, "post": {}}
+        self.step = 0
 
     def __enter__(self) -> None:
         """Implementation of the state machine"""
-        full_seq = chain(START_SEQ, self.cycles * RUNTIME_SEQ, END_SEQ)
-
-        ccycle = 0
-        for event in full_seq:
-            self.next_state(event)
-            # Step counted on PreRoutine
-            if isinstance(self.state, PostRoutine):
-                ccycle = ccycle + 1
-                log_success(f"Step: {ccycle}")
-            if isinstance(self.state, Terminate):
-                break
-
-        self.next_state(event)  # Run Terminate sequence
-
+        if self.start():
+            self.loop(self.compile())
+        self.terminate()
         return self
 
     def __exit__(self, type, value, traceback) -> bool:
         return False
 
+    def add_hook(self, hook: Callable, when: str = "post", phase: str = ""):
+        """Adds a callable to run before or after a phase
+
+        Args:
+            hook (Callable): Function of the configurator, returns ``False`` to terminate
+            when (str, optional): "pre" or "post". Defaults to "post".
+            phase (str, optional): One of ``RUNTIME_SEQ``, empty for the whole step. Defaults to "".
+        """
+        if when not in self.hooks or phase not in ("", *RUNTIME_SEQ):
+            raise ValueError(f"Unknown hook position: {when} {phase}")
+        self.hooks[when].setdefault(phase, []).append(hook)
+
+    def compile(self) -> tuple:
+        """Binds the phases of a step and their hooks
+
+        Returns:
+            tuple: Pairs (state, callable) in execution order
+        """
+        pre, post = self.hooks["pre"], self.hooks["post"]
+        profile = PROFILER.enabled
+        pipeline = [(self.states["preroutine"], h) for h in pre.get("", ())]
+        for event in RUNTIME_SEQ:
+            state = self.states[event]
+            run = state.run
+            if profile:
+                run = PROFILER.wrap(f"phase.{event}", run)
+            pipeline.extend((state, h) for h in pre.get(event, ()))
+            pipeline.append((state, run))
+            pipeline.extend((state, h) for h in post.get(event, ()))
+        pipeline.extend((state, h) for h in post.get("", ()))
+        if profile:
+            pipeline.append((state, count_step))
+        return tuple(pipeline)
+
+    def start(self) -> bool:
+        """Runs the start sequence, returns False when the simulation cannot start"""
+        for event in START_SEQ:
+            self.state = self.states[event]
+            if not self.state.run(self.configurator):
+                return False
+        return True
+
+    def loop(self, pipeline: tuple):
+        """Runs the compiled step pipeline for all cycles"""
+        configurator = self.configurator
+        section = PROFILER.section("step")
+        last, logged = perf_counter(), 0
+        for self.step in range(1, self.cycles + 1):
+            stop = False
+            with section:
+                for state, call in pipeline:
+                    self.state = state
+                    if call(configurator) is False:
+                        stop = True
+                        break
+            if stop:
+                break
+            now = perf_counter()
+            if now - last >= self.log_interval:
+                log_success(f"Step: {self.step}")
+                last, logged = now, self.step
+        if self.step != logged:
+            log_success(f"Step: {self.step}")
+
+    def terminate(self):
+        """Runs the end sequence"""
+        for event in END_SEQ:
+            self.state = self.states[event]
+            self.state.run(self.configurator)
+
     def next_state(self, event: str):
         """Action to consider on event:
 
@@ -13,6 +13,8 @@ The states are defined as:
 * **Control**: Perform decision tasks for the platoon 
 * **Push**: Push updated information to the simulator for platoon vehicles 
 * **Postroutine**: Performs tasks after the information has been pushed. 
+
+Each state performs its phase in ``run``, which returns ``False`` when the simulation has to terminate. ``next_state`` switches states on string events and calls ``run``, while ``RuntimeDevice`` binds the ``run`` methods once into a step pipeline.
 """
 
 # ============================================================================
@@ -55,14 +57,18 @@ class Compliance(AbsState):
         :return: Connect object in case of switch
         :rtype: Connect
         """
+        if event != "connect":
+            return self
+        return Connect() if self.run(configurator) else Terminate()
+
+    def run(self, configurator) -> bool:
+        """Checks the scenario files, returns False when the simulation cannot start"""
         try:
             # REVIEW: This logic is too simplistic. Double check conditions for continuing
-            if event == "connect" and self.perform_check(configurator):
-                return Connect()
-            return self
+            return bool(self.perform_check(configurator))
         except:
             log_error("Something happened with the files")
-            return Terminate()
+            return False
 
     def perform_check(self, configurator):
         """This function triggers the check validation for the files raises errors in case files are not found
@@ -80,10 +86,7 @@ class Connect(AbsState):
 
     def next_state(self, event: str, configurator) -> AbsState:
 
-        try:
-            configurator.load_socket()
-        except EnsembleAPILoadLibraryError:
-            log_warning("\tLibrary could not be loaded.\n\tEnding simulation")
+        if not self.run(configurator):
             return Terminate()
 
         if event == "initialize":
@@ -91,6 +94,15 @@ class Connect(AbsState):
 
         return self
 
+    def run(self, configurator) -> bool:
+        """Loads the simulator library"""
+        try:
+            configurator.load_socket()
+        except EnsembleAPILoadLibraryError:
+            log_warning("\tLibrary could not be loaded.\n\tEnding simulation")
+            return False
+        return True
+
 
 class Initialize(AbsState):
     """
@@ -99,17 +111,20 @@ class Initialize(AbsState):
 
     def next_state(self, event: str, configurator) -> AbsState:
 
+        if event != "preroutine":
+            return self
+
+        return PreRoutine() if self.run(configurator) else Terminate()
+
+    def run(self, configurator) -> bool:
+        """Loads the scenario into the simulator"""
         try:
             configurator.load_scenario()
         except EnsembleAPILoadFileError:
             log_warning("\tScenario could not be loaded.\n\tEnding simulation")
-            return Terminate()
-
-        if event == "preroutine":
-            log_in_terminal("Start of Runtime ⏱", fg="magenta")
-            return PreRoutine()
-
-        return self
+            return False
+        log_in_terminal("Start of Runtime ⏱", fg="magenta")
+        return True
 
 
 class PreRoutine(AbsState):
@@ -119,10 +134,15 @@ class PreRoutine(AbsState):
 
     def next_state(self, event: str, configurator) -> AbsState:
         if event == "query":
+            self.run(configurator)
             return Query()
 
         return self
 
+    def run(self, configurator) -> bool:
+        """No task before querying the simulator"""
+        return True
+
 
 class Query(AbsState):
     """
@@ -134,55 +154,63 @@ class Query(AbsState):
         # TODO: call simulator step by step.
 
         if event == "control":
-
-            # Retrieves data
-            configurator.query_data()  # Retreives data + update_registry
-
-            if configurator.verbose:
-                log_verify("Vehicle registry:")
-                log_in_terminal(
-                    configurator.vehicle_registry.pretty_print(
-                        [
-                            "leadid",
-                            "followid",
-                            "vehtype",
-                            "abscissa",
-                            "ordinate",
-                            "acceleration",
-                            "speed",
-                            "link",
-                            "ttd",
-                        ]
-                    ),
-                )
-
-            # Updates platoon registry
-            configurator.update_platoon_registry()
-
-            if configurator.verbose:
-                log_verify("Platoon Registry:")
-                log_in_terminal(
-                    configurator.platoon_registry.pretty_print(
-                        [
-                            "state",
-                            "link",
-                            "platoon",
-                            "comv2x",
-                            "acceleration",
-                            "speed",
-                            "driven",
-                            "ttd",
-                            "positionid",
-                        ]
-                    ),
-                )
-                log_in_terminal(
-                    f"Number of platoons: {configurator.platoon_registry.nplatoons}"
-                )
+            self.run(configurator)
             return Control()
 
         return self
 
+    def run(self, configurator) -> bool:
+        """Retrieves data and updates the vehicle and platoon registries"""
+
+        # Retrieves data
+        configurator.query_data()  # Retreives data + update_registry
+
+        if configurator.verbose:
+            log_verify("Vehicle registry:")
+            log_in_terminal(
+                configurator.vehicle_registry.pretty_print(
+                    [
+                        "leadid",
+                        "followid",
+                        "vehtype",
+                        "abscissa",
+                        "ordinate",
+                        "acceleration",
+                        "speed",
+                        "link",
+                        "ttd",
+                    ]
+                ),
+            )
+
+        # Updates platoon registry
+        configurator.update_platoon_registry()
+
+        if configurator.verbose and hasattr(configurator, "platoon_registry"):
+            log_verify("Platoon Registry:")
+            log_in_terminal(
+                configurator.platoon_registry.pretty_print(
+                    [
+                        "state",
+                        "link",
+                        "platoon",
+                        "comv2x",
+                        "acceleration",
+                        "speed",
+                        "driven",
+                        "ttd",
+                        "positionid",
+                    ]
+                ),
+            )
+            log_in_terminal(
+                f"Number of platoons: {configurator.platoon_registry.nplatoons}"
+            )
+            log_in_terminal(
+                f"Skipped coordinators: {configurator.platoon_registry.skipped}"
+            )
+        return True
+
 
 class Control(AbsState):
     """
@@ -191,12 +219,15 @@ class Control(AbsState):
 
     def next_state(self, event: str, configurator) -> AbsState:
         if event == "push":
-            # configurator.platoon_registry.apply_cacc(
-            #     configurator.connector.time
-            # )
+            self.run(configurator)
             return Push()
         return self
 
+    def run(self, configurator) -> bool:
+        """Applies the operational layer at its sampling time"""
+        configurator.update_operational_layer()
+        return True
+
 
 class Push(AbsState):
     """
@@ -205,10 +236,15 @@ class Push(AbsState):
 
     def next_state(self, event: str, configurator) -> AbsState:
         if event == "postroutine":
+            self.run(configurator)
             return PostRoutine()
+        return self
+
+    def run(self, configurator) -> bool:
+        """Pushes data to the simulator"""
         # TODO: Add methods
         # configurator.push_data()
-        return self
+        return True
 
 
 class PostRoutine(AbsState):
@@ -217,15 +253,21 @@ class PostRoutine(AbsState):
     """
 
     def next_state(self, event: str, configurator) -> AbsState:
-        if event == "preroutine" and configurator.connector.do_next:
+        do_next = self.run(configurator)
+        if event == "preroutine" and do_next:
             return PreRoutine()
         elif event == "terminate":
             return Terminate()
-        elif not configurator.connector.do_next:
+        elif not do_next:
             return Terminate()
 
         return self
 
+    def run(self, configurator) -> bool:
+        """Computes step indicators, returns False when the simulator has no next step"""
+        configurator.update_safety_monitor()
+        return configurator.connector.do_next
+
 
 class Terminate(AbsState):
     """
@@ -233,8 +275,20 @@ class Terminate(AbsState):
     """
 
     def next_state(self, event: str, configurator) -> AbsState:
-        log_in_terminal("End of Runtime ⏱", fg="magenta")
+        self.run(configurator)
         return self
 
+    def run(self, configurator) -> bool:
+        """Releases resources and logs the simulation indicators"""
+        configurator.close_operational_layer()
+        configurator.close_connector()
+        monitor = getattr(configurator, "platoon_registry", None)
+        monitor = getattr(monitor, "monitor", None)
+        if monitor is not None and len(monitor):
+            log_verify("Safety indicators per platoon:")
+            log_in_terminal(monitor.summary().to_string())
+        log_in_terminal("End of Runtime ⏱", fg="magenta")
+        return False
+
 
 # End of our states.
@@ -0,0 +1,124 @@
+"""
+Multi-rate Scheduler
+====================
+This module implements a scheduler to run the layers of a simulation at their own sampling rate.
+
+The layers are defined as:
+
+* **simulator**: Traffic simulator step, ``sampling_time``
+* **operational**: Operational control step, ``sampling_time_operational``
+* **tactical**: Tactical decision step, ``sampling_time_tactical``
+
+A layer is run when it is due, between two ticks its last output is held. The operational layer is run by the ``Control`` phase, all its steps within a simulator step are computed in a single batch. The tactical layer is solved by the platoon registry update of the ``Query`` phase, platoon states are held in between.
+
+Example:
+    Run the tactical layer only when it is due ::
+
+        >>> from ensemble.logic.scheduler import MultiRateScheduler
+        >>> scheduler = MultiRateScheduler()
+        >>> scheduler.run("tactical", 0.0, lambda: "decision")
+        'decision'
+        >>> scheduler.is_due("tactical", 1.0)
+        False
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.tools.constants import DCT_RUNTIME_PARAM
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+LAYER_PERIODS = {
+    "simulator": "sampling_time",
+    "operational": "sampling_time_operational",
+    "tactical": "sampling_time_tactical",
+}
+
+EPS = 1e-9  # Tolerance on float time comparisons
+
+
+@dataclass
+class LayerClock:
+    """Clock keeping track of the executions of a single layer
+
+    Args:
+        name (str): Layer name
+        period (float): Sampling time of the layer [s]
+    """
+
+    name: str
+    period: float
+    last_tick: float = None
+    ticks: int = 0
+    value: Any = None
+
+    def is_due(self, time: float) -> bool:
+        """True if the layer has to run at ``time``"""
+        if self.last_tick is None:
+            return True
+        return time - self.last_tick >= self.period - EPS
+
+    def tick(self, time: float, value: Any = None) -> None:
+        """Registers an execution of the layer at ``time`` with its output"""
+        self.last_tick, self.value = time, value
+        self.ticks += 1
+
+    def hold(self) -> Any:
+        """Last output of the layer (zero order hold)"""
+        return self.value
+
+
+class MultiRateScheduler:
+    """This class schedules the runtime layers according to their declared sampling times.
+
+    Args:
+        parameters (dict): Runtime parameters, check ``DCT_RUNTIME_PARAM``
+    """
+
+    def __init__(self, parameters: Dict = DCT_RUNTIME_PARAM):
+        self.clocks = {
+            layer: LayerClock(layer, float(parameters[key]))
+            for layer, key in LAYER_PERIODS.items()
+        }
+
+    def __repr__(self):
+        periods = ", ".join(f"{k}={v.period}" for k, v in self.clocks.items())
+        return f"{self.__class__.__name__}({periods})"
+
+    def __getitem__(self, layer: str) -> LayerClock:
+        return self.clocks[layer]
+
+    def is_due(self, layer: str, time: float) -> bool:
+        """True if ``layer`` has to run at ``time``"""
+        return self.clocks[layer].is_due(time)
+
+    def tick(self, layer: str, time: float, value: Any = None) -> None:
+        """Registers an execution of ``layer`` at ``time``"""
+        self.clocks[layer].tick(time, value)
+
+    def run(self, layer: str, time: float, callback: Callable, *args, **kwargs):
+        """Executes ``callback`` if the layer is due, otherwise holds the last output.
+
+        Args:
+            layer (str): Layer name
+            time (float): Current time [s]
+            callback (Callable): Layer task
+
+        Returns:
+            Output of the layer at ``time``
+        """
+        clock = self.clocks[layer]
+        if clock.is_due(time):
+            clock.tick(time, callback(*args, **kwargs))
+        return clock.hold()
@@ -0,0 +1,239 @@
+"""
+Frame Archive
+=============
+This module stores raw simulator frames in an append-only archive made of two files:
+
+* ``<path>.frames``: Frames compressed one by one and concatenated
+* ``<path>.index``: Fixed width records ``(step, offset, size, length, time)``, one per frame, after a 16 bytes header holding the codec
+
+A frame is found by its position in the index, or by its step. Steps are expected to increase, contiguous steps are found directly and others with a binary search. Only the requested frame is read and decompressed, so any step of a long simulation is reached in constant time.
+
+Codecs are ``zlib``, ``lzma`` or ``none``.
+
+Example:
+    Archive the frames of a simulation and read one back ::
+
+        >>> from ensemble.tools.archive import FrameArchive
+        >>> with FrameArchive("output/run", "w") as archive:
+        ...     archive.append(frame, step=1, time=1.0)
+        >>> archive = FrameArchive("output/run")
+        >>> archive.get(43200)
+        >>> for frame in archive.range(100, 200):
+        ...     pass
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+import zlib
+import lzma
+from typing import Iterator
+import numpy as np
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+MAGIC = b"ENSFRM1\0"
+HEADER = 16
+
+RECORD = np.dtype(
+    [
+        ("step", "<i8"),
+        ("offset", "<u8"),
+        ("size", "<u4"),
+        ("length", "<u4"),
+        ("time", "<f8"),
+    ]
+)
+
+CODECS = {
+    "none": (lambda data, level: data, lambda data: data),
+    "zlib": (
+        lambda data, level: zlib.compress(
+            data, 6 if level is None else level
+        ),
+        zlib.decompress,
+    ),
+    "lzma": (
+        lambda data, level: lzma.compress(
+            data, preset=6 if level is None else level
+        ),
+        lzma.decompress,
+    ),
+}
+
+
+class FrameArchive:
+    """Append-only archive of raw frames
+
+    Args:
+        path (str): Path of the archive without extension
+        mode (str, optional): "r" to read, "w" to create, "a" to append. Defaults to "r".
+        codec (str, optional): Compression of new archives, one of ``CODECS``. Defaults to "zlib".
+        level (int, optional): Compression level, None for the codec default. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "r",
+        codec: str = "zlib",
+        level: int = None,
+    ):
+        if mode not in ("r", "w", "a"):
+            raise ValueError(f"Unknown archive mode: {mode}")
+        if codec not in CODECS:
+            raise ValueError(f"Unknown archive codec: {codec}")
+        self.path = str(path)
+        self.mode = mode
+        self.level = level
+        index = f"{self.path}.index"
+        if mode == "w" or (mode == "a" and not os.path.exists(index)):
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            with open(index, "wb") as f:
+                f.write(MAGIC)
+                f.write(codec.encode().ljust(HEADER - len(MAGIC), b"\0"))
+            open(f"{self.path}.frames", "wb").close()
+        with open(index, "rb") as f:
+            header = f.read(HEADER)
+        if header[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a frame archive: {self.path}")
+        self.codec = header[len(MAGIC) :].rstrip(b"\0").decode()
+        self._compress, self._decompress = CODECS[self.codec]
+        self._records = []
+        self._index = self._load_index()
+        self._last = int(self._index["step"][-1]) if len(self._index) else -1
+        self._frames = open(f"{self.path}.frames", "rb")
+        self._writer = None
+        if mode != "r":
+            self._writer = open(f"{self.path}.frames", "ab")
+            self._index_writer = open(index, "ab")
+            self._offset = self._writer.seek(0, os.SEEK_END)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return len(self._index) + len(self._records)
+
+    def __iter__(self) -> Iterator[bytes]:
+        for position in range(len(self)):
+            yield self[position]
+
+    def __getitem__(self, position: int) -> bytes:
+        """Frame at a position of the archive"""
+        return self._read(self.index[position])
+
+    def _load_index(self) -> np.ndarray:
+        """Records written in the index file"""
+        with open(f"{self.path}.index", "rb") as f:
+            f.seek(HEADER)
+            data = f.read()
+        count = len(data) // RECORD.itemsize
+        return np.frombuffer(data[: count * RECORD.itemsize], RECORD)
+
+    def _read(self, record) -> bytes:
+        if self._writer is not None:
+            self._writer.flush()
+        self._frames.seek(int(record["offset"]))
+        return self._decompress(self._frames.read(int(record["size"])))
+
+    @property
+    def index(self) -> np.ndarray:
+        """Records of the frames, in order of appending"""
+        if self._records:
+            records = np.array(self._records, RECORD)
+            self._index = np.concatenate((self._index, records))
+            self._records = []
+        return self._index
+
+    @property
+    def steps(self) -> np.ndarray:
+        """Step of each frame"""
+        return self.index["step"]
+
+    @property
+    def times(self) -> np.ndarray:
+        """Simulation time of each frame, nan when unknown"""
+        return self.index["time"]
+
+    def append(self, frame: bytes, step: int = None, time: float = np.nan):
+        """Adds a frame at the end of the archive
+
+        Args:
+            frame (bytes): Raw frame
+            step (int, optional): Step of the frame, None for the step following the last one. Defaults to None.
+            time (float, optional): Simulation time of the frame [s]. Defaults to nan.
+        """
+        if self._writer is None:
+            raise ValueError("Archive opened for reading")
+        step = self._last + 1 if step is None else int(step)
+        data = self._compress(bytes(frame), self.level)
+        record = (step, self._offset, len(data), len(frame), time)
+        self._writer.write(data)
+        self._index_writer.write(np.array([record], RECORD).tobytes())
+        self._records.append(record)
+        self._offset += len(data)
+        self._last = step
+
+    def position(self, step: int) -> int:
+        """Position of the frame of a step
+
+        Args:
+            step (int): Step of the frame
+
+        Returns:
+            int: Position in the archive
+        """
+        steps = self.steps
+        if not len(steps):
+            raise KeyError(step)
+        position = step - int(steps[0])
+        if 0 <= position < len(steps) and steps[position] == step:
+            return position  # Contiguous steps
+        position = int(np.searchsorted(steps, step))
+        if position < len(steps) and steps[position] == step:
+            return position
+        raise KeyError(step)
+
+    def get(self, step: int) -> bytes:
+        """Frame of a step, ``KeyError`` when it is not archived"""
+        return self[self.position(step)]
+
+    def range(self, start: int = None, stop: int = None) -> Iterator[bytes]:
+        """Frames whose step lies within ``[start, stop)``
+
+        Args:
+            start (int, optional): First step, None for the first frame. Defaults to None.
+            stop (int, optional): Step after the last one, None for the end. Defaults to None.
+        """
+        steps = self.steps
+        first = 0 if start is None else int(np.searchsorted(steps, start))
+        last = len(steps)
+        if stop is not None:
+            last = int(np.searchsorted(steps, stop))
+        for position in range(first, last):
+            yield self[position]
+
+    def flush(self):
+        """Writes the buffered frames and records to disk"""
+        if self._writer is not None:
+            self._writer.flush()
+            self._index_writer.flush()
+
+    def close(self):
+        """Closes the archive files"""
+        if self._writer is not None:
+            self._writer.close()
+            self._index_writer.close()
+            self._writer = None
+        self._frames.close()
@@ -0,0 +1,200 @@
+"""
+Benchmark
+=========
+This module times benchmark cases at increasing problem sizes, saves the results as JSON and compares them against a stored baseline.
+
+A case is a function of the size ``n`` registered with ``case``. It prepares its data and returns the callable to time, so that only the callable is measured. The callable is run ``number`` times per repeat, ``number`` being raised until a repeat lasts ``min_time``, and the fastest repeat gives the time per call. Cases whose setup raises ``OSError``, typically a missing native library, are recorded as skipped.
+
+Example:
+    Register a case and compare the results with a baseline ::
+
+        >>> from ensemble.tools.benchmark import case, run_cases, compare_results, load_results
+        >>> @case("sort", sizes=(100, 10_000))
+        ... def sort(n):
+        ...     data = np.random.random(n)
+        ...     return lambda: np.sort(data)
+        >>> results = run_cases()
+        >>> compare_results(results, load_results("baseline.json"))
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import gc
+import json
+import platform
+import statistics
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Sequence
+import numpy as np
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+SIZES = (10, 100, 1_000, 10_000)
+
+CASES: Dict[str, tuple] = {}
+
+
+def case(name: str, sizes: Sequence[int] = SIZES) -> Callable:
+    """Registers a benchmark case
+
+    Args:
+        name (str): Name of the case
+        sizes (Sequence[int], optional): Problem sizes of the case. Defaults to ``SIZES``.
+    """
+
+    def register(setup: Callable) -> Callable:
+        CASES[name] = (setup, tuple(sizes))
+        return setup
+
+    return register
+
+
+def _timed(function: Callable, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return time.perf_counter() - start
+
+
+def measure(
+    function: Callable, repeat: int = 5, min_time: float = 0.05
+) -> dict:
+    """Times a callable
+
+    Args:
+        function (Callable): Callable without arguments
+        repeat (int, optional): Number of repeats. Defaults to 5.
+        min_time (float, optional): Minimum duration of a repeat [s]. Defaults to 0.05.
+
+    Returns:
+        dict: Calls per repeat and fastest, median time per call [s]
+    """
+    number = 1
+    while True:
+        elapsed = _timed(function, number)
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        times = [elapsed] + [
+            _timed(function, number) for _ in range(repeat - 1)
+        ]
+    finally:
+        if enabled:
+            gc.enable()
+    times = [t / number for t in times]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": min(times),
+        "median": statistics.median(times),
+    }
+
+
+def run_cases(
+    names: Iterable[str] = None,
+    sizes: Sequence[int] = None,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    log: Callable = None,
+) -> dict:
+    """Runs the registered cases
+
+    Args:
+        names (Iterable[str], optional): Cases to run, None for all. Defaults to None.
+        sizes (Sequence[int], optional): Sizes replacing those of the cases. Defaults to None.
+        repeat (int, optional): Number of repeats. Defaults to 5.
+        min_time (float, optional): Minimum duration of a repeat [s]. Defaults to 0.05.
+        log (Callable, optional): Called with the key and result of each measure. Defaults to None.
+
+    Returns:
+        dict: Description of the machine and results per ``case/n`` key
+    """
+    results = {}
+    for name in names or CASES:
+        setup, default = CASES[name]
+        for n in sizes or default:
+            key = f"{name}/{n}"
+            try:
+                function = setup(n)
+            except OSError as error:
+                result = {"case": name, "n": n, "skipped": str(error)}
+            else:
+                result = {
+                    "case": name,
+                    "n": n,
+                    **measure(function, repeat, min_time),
+                }
+            results[key] = result
+            if log is not None:
+                log(key, result)
+    return {"machine": machine(), "results": results}
+
+
+def machine() -> dict:
+    """Description of the machine and of the interpreter"""
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+
+
+def save_results(results: dict, path: str):
+    """Saves results as JSON"""
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> dict:
+    """Loads results saved as JSON"""
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_results(
+    results: dict, baseline: dict, tolerance: float = 0.25
+) -> List[dict]:
+    """Compares the fastest times with a baseline
+
+    Args:
+        results (dict): Results of ``run_cases``
+        baseline (dict): Results taken as reference
+        tolerance (float, optional): Relative slowdown accepted. Defaults to 0.25.
+
+    Returns:
+        List[dict]: Key, times and ratio of each result measured in both, with ``regression`` True when slower than tolerated
+    """
+    rows = []
+    reference = baseline["results"]
+    for key, result in results["results"].items():
+        if "min" not in result or "min" not in reference.get(key, {}):
+            continue
+        ratio = result["min"] / reference[key]["min"]
+        rows.append(
+            {
+                "key": key,
+                "baseline": reference[key]["min"],
+                "time": result["min"],
+                "ratio": ratio,
+                "regression": ratio > 1 + tolerance,
+            }
+        )
+    return rows
+
+
+def format_time(seconds: float) -> str:
+    """Time with a readable unit"""
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
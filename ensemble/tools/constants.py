@@ -341,6 +341,18 @@ DCT_RUNTIME_PARAM = {
     "sampling_time_operational": 1 / 10,  # [s] step
     "sampling_time_tactical": 60,  # [s] time interval
     "horizon_tactical": 3600,
+    "operational_workers": 0,  # Worker processes, 0 runs serially
+    "tactical": True,  # Builds the platoon registry and solves the tactical layer
+    "operational": True,  # Applies the operational layer in the control phase
+    "safety_monitor": False,  # Aggregates surrogate safety indicators
+    "log_interval": 1.0,  # Minimum wall time between step logs [s]
+    "pipelined": False,  # Simulator step runs in background, one step lag
+    "closed_loop": False,  # Control is pushed to the simulator, no lag allowed
+    "fast_forward": False,  # Steps without parsing until a platoon vehicle enters
+    "fast_forward_until": 0,  # [s] Time ending the fast forward, 0 for none
+    "probe_interval": 10,  # [steps] Steps between probes during fast forward
+    "region_of_interest": None,  # Parsed vehicles, check component.region
+    "memory_interval": 100,  # [steps] Steps between memory samples
 }
 
 # Vehicles Parameters
@@ -377,6 +389,11 @@ DCT_PLT_CONST = {
     "max_gap_error": 0.1,  # maximum distance gap error
     "time_gap": 1.4,  # regular time gap between vehicles,
     "cruise_speed": 25,  # set_point cruise_speed
+    "max_released_coordinators": 100,  # released coordinators kept
+    "max_platoon_events": 1000,  # platoon lifecycle events kept
+    "hysteresis_gap": 0.5,  # gap change forcing a state re-evaluation [m]
+    "hysteresis_speed": 0.5,  # speed change forcing a re-evaluation [m/s]
+    "reevaluation_period": 10,  # updates before a forced re-evaluation
 }
 
 # =============================================================================
@@ -0,0 +1,234 @@
+"""
+Memory Probe
+============
+This module attributes the memory of a long simulation. Every ``interval`` steps a sample records:
+
+* **traced**, **peak**: Memory allocated by Python as traced by ``tracemalloc`` [bytes]
+* **vehicles**, **platoon_vehicles**, **coordinators**, **platoon_sets**: Live objects of the core types, platoon vehicles included in vehicles. They are found by the garbage collector, so that objects kept alive outside of the registries are counted
+* **history**: Bytes of the state, control and reference histories of the live coordinators
+* **monitor**: Bytes of the histograms of the safety monitor
+* **registry**, **released**, **subscribers**: Vehicles of the registry, vehicles in its free list and subscribers of the request
+* **platoons**, **free_coordinators**: Platoon sets and released coordinators of the platoon registry
+
+The ``tracemalloc`` snapshot of a sample is compared with the one of the first sample, the lines whose allocations grew the most are kept as growth sources. Samples scan all objects, so ``interval`` is meant to be large on long runs.
+
+The report is written as ``<prefix>.json``, holding the timeline and the growth sources, and ``<prefix>.csv`` holding the timeline.
+
+Example:
+    Sample memory every 500 steps of a simulation ::
+
+        >>> from ensemble.tools.memory import MemoryProbe
+        >>> with MemoryProbe("ensemble_memory", interval=500) as probe:
+        ...     device = RuntimeDevice(configurator)
+        ...     device.add_hook(probe)
+        ...     with device:
+        ...         pass
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import gc
+import csv
+import json
+import tracemalloc
+from typing import Dict, List, Optional
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.component.vehicle import Vehicle
+from ensemble.component.platoon_vehicle import PlatoonVehicle
+from ensemble.control.tactical.vehcoordinator import VehGapCoordinator
+from ensemble.logic.platoon_set import PlatoonSet
+from ensemble.tools.screen import log_success
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+CORE_TYPES = {
+    "vehicles": Vehicle,
+    "platoon_vehicles": PlatoonVehicle,
+    "coordinators": VehGapCoordinator,
+    "platoon_sets": PlatoonSet,
+}
+HISTORIES = ("_history_state", "_history_control", "_history_reference")
+FIELDS = (
+    "step",
+    "time",
+    "traced",
+    "peak",
+    *CORE_TYPES,
+    "history",
+    "monitor",
+    "registry",
+    "released",
+    "subscribers",
+    "platoons",
+    "free_coordinators",
+)
+IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def count_objects() -> Dict[str, int]:
+    """Live objects of ``CORE_TYPES`` and bytes of the coordinator histories"""
+    counts = dict.fromkeys(CORE_TYPES, 0)
+    counts["history"] = 0
+    for obj in gc.get_objects():
+        for name, kind in CORE_TYPES.items():
+            if isinstance(obj, kind):
+                counts[name] += 1
+        if isinstance(obj, VehGapCoordinator):
+            counts["history"] += sum(
+                getattr(obj, attr).nbytes
+                for attr in HISTORIES
+                if hasattr(obj, attr)
+            )
+    return counts
+
+
+def _registries(configurator) -> dict:
+    """Sizes of the registries of a running simulation"""
+    request = getattr(configurator.connector, "request", None)
+    vehicles = getattr(request, "vehicle_registry", None)
+    platoons = getattr(configurator, "platoon_registry", None)
+    monitor = getattr(platoons, "monitor", None)
+    channels = getattr(request, "_channels", {})
+    histograms = getattr(monitor, "_hist", {}).values()
+    return {
+        "monitor": sum(h.nbytes for h in histograms),
+        "registry": len(vehicles) if vehicles is not None else 0,
+        "released": len(getattr(vehicles, "_free", ())),
+        "subscribers": sum(len(s) for s in channels.values()),
+        "platoons": len(getattr(platoons, "platoon_sets", ())),
+        "free_coordinators": len(getattr(platoons, "free_gcs", ())),
+    }
+
+
+class MemoryProbe:
+    """Step hook sampling memory every ``interval`` steps. Meant to run after the steps of ``RuntimeDevice``, ``tracemalloc`` is started on enter when it is not already tracing.
+
+    Args:
+        prefix (str, optional): Path prefix of the report. Defaults to "ensemble_memory".
+        interval (int, optional): Steps between samples. Defaults to 100.
+        top (int, optional): Growth sources kept in the report. Defaults to 10.
+        frames (int, optional): Frames of the traceback stored per allocation. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        prefix: str = "ensemble_memory",
+        interval: int = 100,
+        top: int = 10,
+        frames: int = 1,
+    ):
+        self.prefix = prefix
+        self.interval = max(int(interval), 1)
+        self.top = top
+        self.frames = frames
+        self.samples: List[dict] = []
+        self.growth: List[dict] = []
+        self._step = 0
+        self._started = False
+        self._first: Optional[tracemalloc.Snapshot] = None
+        self._configurator = None
+
+    def __enter__(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        return False
+
+    def __call__(self, configurator):
+        self._step += 1
+        self._configurator = configurator
+        if self._step % self.interval == 0:
+            self.sample(configurator)
+
+    def sample(self, configurator) -> dict:
+        """Records a sample of the current step
+
+        Args:
+            configurator (Configurator): Configurator of the running simulation
+
+        Returns:
+            dict: Sample, keys in ``FIELDS``
+        """
+        traced, peak = tracemalloc.get_traced_memory()
+        sample = {
+            "step": self._step,
+            "time": configurator.simulation_time,
+            "traced": traced,
+            "peak": peak,
+            **count_objects(),
+            **_registries(configurator),
+        }
+        self.samples.append(sample)
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED)
+            if self._first is None:
+                self._first = snapshot
+            else:
+                self.growth = self.compare(snapshot)
+        return sample
+
+    def compare(self, snapshot: tracemalloc.Snapshot) -> List[dict]:
+        """Lines whose allocations grew the most since the first sample"""
+        stats = snapshot.compare_to(self._first, "lineno")
+        stats = sorted(stats, key=lambda s: s.size_diff, reverse=True)
+        return [
+            {
+                "source": str(stat.traceback[0]),
+                "size": stat.size,
+                "size_diff": stat.size_diff,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[: self.top]
+            if stat.size_diff > 0
+        ]
+
+    def to_dict(self) -> dict:
+        """Timeline and growth sources"""
+        return {
+            "interval": self.interval,
+            "timeline": self.samples,
+            "growth": self.growth,
+        }
+
+    def to_json(self, path: str):
+        """Exports the timeline and growth sources into a JSON file"""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def to_csv(self, path: str):
+        """Exports the timeline into a CSV file"""
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS, restval="")
+            writer.writeheader()
+            writer.writerows(self.samples)
+
+    def close(self):
+        """Samples the last step if needed, exports the report and stops ``tracemalloc`` if started here"""
+        last = self.samples[-1]["step"] if self.samples else 0
+        if self._configurator is not None and last != self._step:
+            self.sample(self._configurator)
+        self._configurator = None
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+        if not self.samples:
+            return
+        self.to_json(f"{self.prefix}.json")
+        self.to_csv(f"{self.prefix}.csv")
+        log_success("Memory report exported:", f"\t{self.prefix}.[json|csv]")
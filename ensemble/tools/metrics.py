@@ -0,0 +1,228 @@
+"""
+Metrics Exporter
+================
+This module serves live metrics of a running simulation over a local HTTP endpoint in the Prometheus text format (OpenMetrics when requested by the scraper):
+
+* **ensemble_step**: Current simulator step
+* **ensemble_simulated_seconds**: Simulated time [s]
+* **ensemble_wall_seconds**: Wall-clock time since the exporter started [s]
+* **ensemble_realtime_ratio**: Simulated time over wall-clock time
+* **ensemble_vehicles**: Vehicles in the vehicle registry
+* **ensemble_platoons**: Live platoons in the platoon registry
+* **ensemble_rss_bytes**: Resident memory of the process [bytes]
+* **ensemble_phase_seconds**: Latency summary of the runtime phases, taken from ``PROFILER``
+
+The simulation thread only replaces a snapshot tuple at each step, it never takes a lock nor waits for the server. Metrics are formatted in the server thread when scraped.
+
+Example:
+    Serve the metrics while running a simulation ::
+
+        >>> from ensemble.tools.metrics import MetricsExporter
+        >>> with MetricsExporter(port=9108) as exporter:
+        ...     device = RuntimeDevice(configurator)
+        ...     device.add_hook(exporter.publish)
+        ...     with device:
+        ...         pass
+
+    Then scrape it with ``curl http://127.0.0.1:9108/metrics``
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+import sys
+import threading
+from time import perf_counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.tools.profiler import PROFILER, QUANTILES
+from ensemble.tools.screen import log_success
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+GAUGES = (
+    ("ensemble_step", "Current simulator step"),
+    ("ensemble_simulated_seconds", "Simulated time"),
+    ("ensemble_wall_seconds", "Wall-clock time since the exporter started"),
+    ("ensemble_realtime_ratio", "Simulated time over wall-clock time"),
+    ("ensemble_vehicles", "Vehicles in the vehicle registry"),
+    ("ensemble_platoons", "Live platoons in the platoon registry"),
+    ("ensemble_rss_bytes", "Resident memory of the process"),
+)
+
+
+def _format(value: float) -> str:
+    """Sample value in the exposition format"""
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def rss_bytes() -> int:
+    """Resident memory of the current process, the peak value is used when the current one is not available"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return 0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves the metrics of the exporter attached to the server"""
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        openmetrics = "application/openmetrics-text" in self.headers.get(
+            "Accept", ""
+        )
+        body = self.server.exporter.render(openmetrics).encode()
+        self.send_response(200)
+        kind = OPENMETRICS if openmetrics else PROMETHEUS
+        self.send_header("Content-Type", kind)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsExporter:
+    """Metrics endpoint served from a daemon thread
+
+    Args:
+        host (str, optional): Interface to bind. Defaults to "127.0.0.1".
+        port (int, optional): Port to bind, 0 picks a free port. Defaults to 9108.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9108):
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+        self._profiling = False
+        self._start = perf_counter()
+        self._snapshot = (0, 0.0, 0.0, 0, 0)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+        return False
+
+    def start(self):
+        """Starts serving, phase latencies are recorded by ``PROFILER`` while serving"""
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.exporter = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics", daemon=True
+        )
+        self._thread.start()
+        self._profiling = PROFILER.enabled
+        PROFILER.enable()
+        self._start = perf_counter()
+        log_success("Metrics served at:", f"\t{self.url}")
+
+    def stop(self):
+        """Stops serving"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        if not self._profiling:
+            PROFILER.disable()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def publish(self, configurator):
+        """Takes the values of the current step, meant to be hooked after each step of ``RuntimeDevice``
+
+        Args:
+            configurator (Configurator): Configurator of the running simulation
+        """
+        connector = configurator.connector
+        request = getattr(connector, "request", None)
+        vehicles = getattr(request, "vehicle_registry", None)
+        platoons = getattr(configurator, "platoon_registry", None)
+        self._snapshot = (
+            connector.simulation_step,
+            configurator.simulation_time,
+            perf_counter() - self._start,
+            len(vehicles) if vehicles is not None else 0,
+            platoons.nplatoons if platoons is not None else 0,
+        )
+
+    def values(self) -> dict:
+        """Current value of the gauges"""
+        step, simulated, wall, vehicles, platoons = self._snapshot
+        return {
+            "ensemble_step": step,
+            "ensemble_simulated_seconds": simulated,
+            "ensemble_wall_seconds": wall,
+            "ensemble_realtime_ratio": simulated / wall if wall else 0.0,
+            "ensemble_vehicles": vehicles,
+            "ensemble_platoons": platoons,
+            "ensemble_rss_bytes": rss_bytes(),
+        }
+
+    def render(self, openmetrics: bool = False) -> str:
+        """Formats the metrics in the Prometheus text format
+
+        Args:
+            openmetrics (bool, optional): Follows the OpenMetrics format. Defaults to False.
+
+        Returns:
+            str: Exposition text
+        """
+        values = self.values()
+        lines = []
+        for name, description in GAUGES:
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {_format(values[name])}")
+
+        name = "ensemble_phase_seconds"
+        lines.append(f"# HELP {name} Wall time of the runtime phases")
+        lines.append(f"# TYPE {name} summary")
+        for timer, (wall, _) in tuple(PROFILER.timers.items()):
+            if not timer.startswith("phase."):
+                continue
+            label = f'phase="{timer[len("phase."):]}"'
+            for q in QUANTILES:
+                value = _format(wall.percentile(q))
+                lines.append(f'{name}{{{label},quantile="{q / 100}"}} {value}')
+            lines.append(f"{name}_sum{{{label}}} {_format(wall.total)}")
+            lines.append(f"{name}_count{{{label}}} {wall.count}")
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,281 @@
+"""
+Profiler
+========
+This module records where the time of a simulation step goes. Sections of code are timed in wall and CPU time into fixed log-scale histograms and quantities such as the number of vehicles or the parsed bytes are kept as counters. Recording is constant time and memory per sample, so it can stay enabled on long runs.
+
+A single profiler ``PROFILER`` is shared by the runtime and the hot paths of the API. It is disabled by default, sections then cost a single attribute check.
+
+Example:
+    Time a block of code and export the statistics ::
+
+        >>> from ensemble.tools.profiler import PROFILER
+        >>> PROFILER.enable()
+        >>> with PROFILER.section("parse"):
+        ...     parse()
+        >>> PROFILER.count("vehicles", 120)
+        >>> PROFILER.to_json("profile.json")
+
+    Profile a full run, including a ``cProfile`` dump ::
+
+        >>> from ensemble.tools.profiler import profile_run
+        >>> with profile_run("ensemble_profile"):
+        ...     launch_simulation(configurator)
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import csv
+import json
+import math
+import cProfile
+from time import perf_counter, process_time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.tools.screen import log_success
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+DECADES = (-7, 3)  # Histogram range 100ns to 1000s
+PER_DECADE = 10  # Bins per decade
+QUANTILES = (50, 95, 99)
+FIELDS = ("name", "kind", "count", "total", "mean", "min", "max") + tuple(
+    f"p{q}" for q in QUANTILES
+)
+
+
+class Histogram:
+    """Log-scale histogram of positive samples with exact count, total, min and max"""
+
+    __slots__ = ("count", "total", "min", "max", "bins")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.bins = [0] * ((DECADES[1] - DECADES[0]) * PER_DECADE)
+
+    def add(self, value: float):
+        """Adds a sample"""
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value > 0:
+            k = int((math.log10(value) - DECADES[0]) * PER_DECADE)
+            k = min(max(k, 0), len(self.bins) - 1)
+        else:
+            k = 0
+        self.bins[k] += 1
+
+    def edge(self, k: float) -> float:
+        """Value at the (fractional) bin position ``k``"""
+        return 10 ** (DECADES[0] + k / PER_DECADE)
+
+    def percentile(self, q: float) -> float:
+        """Percentile interpolated within the bins, bounded by min and max"""
+        if not self.count:
+            return math.nan
+        target, cumul = q / 100 * self.count, 0
+        for k, n in enumerate(self.bins):
+            if n and cumul + n >= target:
+                value = self.edge(k + (target - cumul) / n)
+                return min(max(value, self.min), self.max)
+            cumul += n
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Statistics of the samples"""
+        stats = {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else math.nan,
+            "min": self.min if self.count else math.nan,
+            "max": self.max if self.count else math.nan,
+        }
+        stats.update({f"p{q}": self.percentile(q) for q in QUANTILES})
+        return stats
+
+
+class Counter:
+    """Running statistics of a counted quantity"""
+
+    __slots__ = ("count", "total", "min", "max", "last")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.last = 0
+
+    def add(self, value: float):
+        """Adds an observation"""
+        self.count += 1
+        self.total += value
+        self.last = value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def to_dict(self) -> dict:
+        """Statistics of the observations"""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else math.nan,
+            "min": self.min if self.count else math.nan,
+            "max": self.max if self.count else math.nan,
+            "last": self.last,
+        }
+
+
+class _Section:
+    """Context timing a block into a profiler"""
+
+    __slots__ = ("wall", "cpu", "t0", "c0")
+
+    def __init__(self, wall: Histogram, cpu: Histogram):
+        self.wall = wall
+        self.cpu = cpu
+
+    def __enter__(self):
+        self.t0 = perf_counter()
+        self.c0 = process_time()
+        return self
+
+    def __exit__(self, *args):
+        self.wall.add(perf_counter() - self.t0)
+        self.cpu.add(process_time() - self.c0)
+        return False
+
+
+class Profiler:
+    """Wall and CPU time histograms per section plus counters
+
+    Args:
+        enabled (bool, optional): Records samples. Defaults to False.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.timers: Dict[str, tuple] = {}
+        self.counters: Dict[str, Counter] = {}
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Drops all recorded samples"""
+        self.timers.clear()
+        self.counters.clear()
+
+    def timer(self, name: str) -> tuple:
+        """Wall and CPU histograms of a section, created on first use"""
+        if name not in self.timers:
+            self.timers[name] = (Histogram(), Histogram())
+        return self.timers[name]
+
+    def section(self, name: str):
+        """Context timing a block of code, no-op when disabled. A new context is returned at each call, so that a section can be nested or entered from several threads."""
+        if not self.enabled:
+            return nullcontext()
+        return _Section(*self.timer(name))
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """Binds ``func`` into a callable timed as section ``name``. Intended to be built once, e.g. when compiling a pipeline."""
+        wall, cpu = self.timer(name)
+
+        def timed(*args, **kwargs):
+            t0, c0 = perf_counter(), process_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                wall.add(perf_counter() - t0)
+                cpu.add(process_time() - c0)
+
+        return timed
+
+    def count(self, name: str, value: float = 1):
+        """Adds an observation to a counter, no-op when disabled"""
+        if not self.enabled:
+            return
+        counter = self.counters.get(name)
+        if counter is None:
+            counter = self.counters[name] = Counter()
+        counter.add(value)
+
+    def to_dict(self) -> dict:
+        """Statistics of all sections and counters"""
+        return {
+            "timers": {
+                name: {"wall": wall.to_dict(), "cpu": cpu.to_dict()}
+                for name, (wall, cpu) in self.timers.items()
+            },
+            "counters": {
+                name: counter.to_dict()
+                for name, counter in self.counters.items()
+            },
+        }
+
+    def rows(self):
+        """Flat rows of statistics, one per section time kind and counter"""
+        for name, (wall, cpu) in self.timers.items():
+            yield {"name": name, "kind": "wall", **wall.to_dict()}
+            yield {"name": name, "kind": "cpu", **cpu.to_dict()}
+        for name, counter in self.counters.items():
+            stats = counter.to_dict()
+            stats.pop("last")
+            yield {"name": name, "kind": "counter", **stats}
+
+    def to_json(self, path: str):
+        """Exports the statistics into a JSON file"""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def to_csv(self, path: str):
+        """Exports the statistics into a CSV file"""
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS, restval="")
+            writer.writeheader()
+            writer.writerows(self.rows())
+
+
+PROFILER = Profiler()
+
+
+@contextmanager
+def profile_run(prefix: str = "ensemble_profile"):
+    """Profiles a run: enables ``PROFILER`` and ``cProfile``, then exports ``<prefix>.json``, ``<prefix>.csv`` and ``<prefix>.pstats``
+
+    Args:
+        prefix (str, optional): Path prefix of the exported files. Defaults to "ensemble_profile".
+    """
+    PROFILER.reset()
+    PROFILER.enable()
+    stats = cProfile.Profile()
+    stats.enable()
+    try:
+        yield PROFILER
+    finally:
+        stats.disable()
+        PROFILER.disable()
+        stats.dump_stats(f"{prefix}.pstats")
+        PROFILER.to_json(f"{prefix}.json")
+        PROFILER.to_csv(f"{prefix}.csv")
+        log_success("Profile exported:", f"\t{prefix}.[json|csv|pstats]")
@@ -0,0 +1,368 @@
+"""
+Trajectory Recorder
+===================
+This module records vehicle trajectories of a running simulation into chunked columnar files, a lighter alternative to the XML trace of the simulator. Each row is a vehicle at a step:
+
+* **step**, **time**: Frame counter of the recorder and simulation time [s]
+* **vehid**, **vehtype**, **link**, **lane**, **abscissa**, **ordinate**, **elevation**, **distance**, **speed**, **acceleration**, **driven**: Vehicle data of the frame
+* **platoonid**, **state**, **positionid**: Platoon of the vehicle in the platoon registry, ``-1`` and ``""`` for vehicles out of it
+
+The recorder subscribes to a ``SimulatorRequest``, at each frame it only keeps a reference to the vehicle data and a snapshot of the platoon columns. The frame is dispatched before the platoon registry is updated, so ``RecordingHook`` defers the snapshot to a hook after the query phase and each row holds the platoons of its own step. Chunks of ``chunk_rows`` rows are handed to a writer thread through a bounded queue, conversion and compression happen there. When the queue is full the simulation waits for the writer, so memory stays bounded.
+
+Chunks are written as Parquet files when ``pyarrow`` is installed, as compressed ``.npz`` files otherwise.
+
+Example:
+    Record a simulation and read it back ::
+
+        >>> from ensemble.tools.recorder import RecordingHook, load_trajectories
+        >>> with RecordingHook("output/run") as recording:
+        ...     device = RuntimeDevice(configurator)
+        ...     device.add_hook(recording, "pre", "query")
+        ...     device.add_hook(recording.snapshot, "post", "query")
+        ...     with device:
+        ...         pass
+        >>> df = load_trajectories("output/run")
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+import glob
+import queue
+import threading
+from collections.abc import Mapping
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.logic.subscriber import Subscriber
+from ensemble.tools.screen import log_success
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+COLUMNS = {
+    "step": np.int64,
+    "time": np.float64,
+    "vehid": np.int64,
+    "vehtype": str,
+    "link": str,
+    "lane": np.int64,
+    "abscissa": np.float64,
+    "ordinate": np.float64,
+    "elevation": np.float64,
+    "distance": np.float64,
+    "speed": np.float64,
+    "acceleration": np.float64,
+    "driven": bool,
+    "platoonid": np.int64,
+    "state": str,
+    "positionid": np.int64,
+}
+
+VEHICLE_COLUMNS = tuple(COLUMNS)[2:-3]
+FORMATS = ("parquet", "npz")
+
+_CLOSE = None  # Sentinel stopping the writer
+
+
+def _column(name: str, values) -> np.ndarray:
+    """Typed column, missing values of numeric columns are set to 0"""
+    dtype = COLUMNS[name]
+    if isinstance(values, np.ndarray):
+        return values.astype(dtype)
+    if dtype is str:
+        return np.array([("" if v is None else str(v)) for v in values], str)
+    if dtype is bool:
+        return np.array([bool(v) for v in values], bool)
+    return np.array([0 if v is None else v for v in values], dtype)
+
+
+def _vehicle_columns(data) -> Dict[str, list]:
+    """Vehicle columns of a frame, either typed columns or vehicle dictionaries"""
+    if isinstance(data, Mapping):
+        n = len(data["vehid"])
+        return {
+            c: data[c] if c in data else (None,) * n for c in VEHICLE_COLUMNS
+        }
+    return {c: [v.get(c) for v in data] for c in VEHICLE_COLUMNS}
+
+
+def build_chunk(frames: List[tuple]) -> Dict[str, np.ndarray]:
+    """Typed columns of a chunk
+
+    Args:
+        frames (List[tuple]): Frames ``(step, time, data, platoons)`` where ``data`` is the vehicle data and ``platoons`` maps vehicle ids to ``(platoonid, state, positionid)``
+
+    Returns:
+        dict: One array per column of ``COLUMNS``
+    """
+    parts = {c: [] for c in COLUMNS}
+    for step, time, data, platoons in frames:
+        columns = _vehicle_columns(data)
+        n = len(columns["vehid"])
+        parts["step"].append(np.full(n, step, np.int64))
+        parts["time"].append(np.full(n, time, np.float64))
+        for c in VEHICLE_COLUMNS:
+            parts[c].append(_column(c, columns[c]))
+        if not platoons:
+            parts["platoonid"].append(np.full(n, -1, np.int64))
+            parts["state"].append(np.full(n, "", str))
+            parts["positionid"].append(np.full(n, -1, np.int64))
+            continue
+        plt = [platoons.get(v, (-1, "", -1)) for v in parts["vehid"][-1]]
+        for i, c in enumerate(("platoonid", "state", "positionid")):
+            parts[c].append(_column(c, [p[i] for p in plt]))
+    return {
+        c: np.concatenate(v) if v else _column(c, ())
+        for c, v in parts.items()
+    }
+
+
+def write_chunk(columns: Dict[str, np.ndarray], path: str, fmt: str) -> str:
+    """Writes the columns of a chunk
+
+    Args:
+        columns (dict): Typed columns
+        path (str): Path of the chunk without extension
+        fmt (str): "parquet" or "npz"
+
+    Returns:
+        str: Path of the file
+    """
+    if fmt == "parquet":
+        path = f"{path}.parquet"
+        pq.write_table(pa.table(columns), path)
+        return path
+    path = f"{path}.npz"
+    np.savez_compressed(path, **columns)
+    return path
+
+
+def load_trajectories(path: str) -> pd.DataFrame:
+    """Reads the chunks of a recording
+
+    Args:
+        path (str): Folder of the recording
+
+    Returns:
+        pd.DataFrame: One row per vehicle and step, columns in ``COLUMNS``
+    """
+    frames = []
+    for chunk in sorted(glob.glob(os.path.join(path, "chunk-*"))):
+        if chunk.endswith(".parquet"):
+            frames.append(pq.read_table(chunk).to_pandas())
+        elif chunk.endswith(".npz"):
+            with np.load(chunk, allow_pickle=False) as data:
+                frames.append(pd.DataFrame({c: data[c] for c in COLUMNS}))
+    if not frames:
+        return pd.DataFrame(
+            {c: _column(c, ()) for c in COLUMNS}, columns=list(COLUMNS)
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+class TrajectoryRecorder(Subscriber):
+    """Subscriber recording the frames of a request
+
+    Args:
+        request (DataQuery): Request publishing the frames
+        path (str): Folder of the recording, created if needed
+        platoon_registry (GlobalGapCoordinator, optional): Registry providing the platoon columns. Defaults to None.
+        chunk_rows (int, optional): Rows per chunk. Defaults to 100000.
+        queue_size (int, optional): Chunks waiting for the writer before the simulation waits. Defaults to 4.
+        fmt (str, optional): "parquet", "npz" or "auto" for Parquet when ``pyarrow`` is installed. Defaults to "auto".
+        deferred (bool, optional): Leaves the platoon columns of a frame to ``snapshot`` instead of taking them when the frame is received. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        request,
+        path: str,
+        platoon_registry=None,
+        chunk_rows: int = 100_000,
+        queue_size: int = 4,
+        fmt: str = "auto",
+        deferred: bool = False,
+    ):
+        if fmt == "auto":
+            fmt = "npz" if pa is None else "parquet"
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown recording format: {fmt}")
+        if fmt == "parquet" and pa is None:
+            raise ImportError("Parquet recording requires pyarrow")
+        super().__init__(request)
+        self.path = path
+        self.platoon_registry = platoon_registry
+        self.chunk_rows = chunk_rows
+        self.fmt = fmt
+        self.deferred = deferred
+        self.files = []
+        self.rows = 0
+        self._step = 0
+        self._chunks = 0
+        self._frames = []
+        self._pending = 0
+        self._error = None
+        self._queue = queue.Queue(maxsize=queue_size)
+        os.makedirs(path, exist_ok=True)
+        self._writer = threading.Thread(
+            target=self._write, name="recorder", daemon=True
+        )
+        self._writer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        return False
+
+    def update(self):
+        """Keeps the frame of the request, meant to be called by its dispatch"""
+        super().update()
+        if self._pending >= self.chunk_rows:
+            self.flush()
+        request = self._publisher
+        data = getattr(request, "columns", None)
+        if data is None:
+            data = request.get_vehicle_data()
+        platoons = None if self.deferred else self._platoons()
+        self._frames.append([self._step, self._time(), data, platoons])
+        self._step += 1
+        if isinstance(data, Mapping):
+            self._pending += len(data["vehid"])
+        else:
+            self._pending += len(data)
+
+    def snapshot(self):
+        """Sets the platoon columns of the last frame, meant to be called once the platoon registry is updated"""
+        if self._frames:
+            self._frames[-1][3] = self._platoons()
+
+    def follow(self, request):
+        """Records the frames of another request, e.g. once a new scenario is loaded"""
+        self._publisher.detach(self, self._channel)
+        self._publisher = request
+        request.attach(self, self._channel)
+
+    def _time(self) -> float:
+        try:
+            return float(self._publisher.current_time)
+        except (AttributeError, IndexError, TypeError, ValueError):
+            return np.nan
+
+    def _platoons(self) -> dict:
+        """Platoon columns of the vehicles in the registry"""
+        if self.platoon_registry is None:
+            return {}
+        return {
+            vgc.vehid: (
+                int(vgc.platoonid),
+                type(vgc.status).__name__,
+                int(vgc.positionid),
+            )
+            for vgc in self.platoon_registry.vgcs()
+        }
+
+    def flush(self):
+        """Hands the frames kept so far to the writer"""
+        if self._error is not None:
+            raise self._error
+        if not self._frames:
+            return
+        self._queue.put((self._chunks, self._frames))
+        self._chunks += 1
+        self.rows += self._pending
+        self._frames, self._pending = [], 0
+
+    def close(self):
+        """Writes the remaining frames and stops the writer"""
+        if not self._writer.is_alive():
+            return
+        self.flush()
+        self._queue.put(_CLOSE)
+        self._writer.join()
+        self._publisher.detach(self, self._channel)
+        if self._error is not None:
+            raise self._error
+        log_success(
+            f"Recorded {self.rows} rows in {len(self.files)} chunk(s):",
+            f"\t{self.path}",
+        )
+
+    def _write(self):
+        """Writer thread, converts and writes chunks in order"""
+        while True:
+            item = self._queue.get()
+            if item is _CLOSE:
+                return
+            if self._error is not None:
+                continue
+            index, frames = item
+            try:
+                path = os.path.join(self.path, f"chunk-{index:05d}")
+                columns = build_chunk(frames)
+                self.files.append(write_chunk(columns, path, self.fmt))
+            except Exception as error:
+                self._error = error
+
+
+class RecordingHook:
+    """Step hook attaching a ``TrajectoryRecorder`` to the request of a running simulation. Meant to run before the query phase of ``RuntimeDevice``, the request is created when the simulation starts. Its ``snapshot`` is meant to run after the query phase, once the platoon registry is updated.
+
+    Args:
+        path (str): Folder of the recording
+        **kwargs: Arguments of ``TrajectoryRecorder``
+    """
+
+    def __init__(self, path: str, **kwargs):
+        self.path = path
+        self.kwargs = kwargs
+        self.recorder: Optional[TrajectoryRecorder] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        return False
+
+    def __call__(self, configurator):
+        request = configurator.connector.request
+        if self.recorder is None:
+            self.recorder = TrajectoryRecorder(
+                request, self.path, deferred=True, **self.kwargs
+            )
+        elif self.recorder._publisher is not request:
+            self.recorder.follow(request)
+        self.recorder.platoon_registry = getattr(
+            configurator, "platoon_registry", None
+        )
+
+    def snapshot(self, configurator):
+        """Snapshots the platoon columns of the frame of the step"""
+        if self.recorder is None:
+            return
+        self.recorder.platoon_registry = getattr(
+            configurator, "platoon_registry", None
+        )
+        self.recorder.snapshot()
+
+    def close(self):
+        """Closes the recorder"""
+        if self.recorder is not None:
+            self.recorder.close()
@@ -0,0 +1,86 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.batch`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+import shutil
+from lxml import etree
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.batch import COLUMNS, expand, plan, seeded_copy, run_batch
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+MOCKS = os.path.join(os.getcwd(), "tests", "mocks", "symuvia")
+
+
+@pytest.fixture
+def scenarios(tmp_path):
+    for name in ("bottleneck_1truck.xml", "bottleneck_3trucks.xml"):
+        shutil.copy(os.path.join(MOCKS, name), tmp_path / name)
+    return tmp_path
+
+
+def test_expand_patterns(scenarios):
+    files = expand(
+        [
+            str(scenarios / "*.xml"),
+            str(scenarios / "bottleneck_1truck.xml"),
+            "missing.xml",
+        ]
+    )
+    assert [os.path.basename(f) for f in files] == [
+        "bottleneck_1truck.xml",
+        "bottleneck_3trucks.xml",
+        "missing.xml",
+    ]
+
+
+def test_plan_scenarios_and_seeds(scenarios):
+    runs = plan([str(scenarios / "*.xml")], seeds=(1, 2, 3))
+    assert [r.index for r in runs] == list(range(6))
+    assert [r.seed for r in runs] == [1, 2, 3, 1, 2, 3]
+    assert len({r.scenario for r in runs}) == 2
+    assert [r.seed for r in plan([str(scenarios / "*.xml")], ())] == [None] * 2
+
+
+def test_seeded_copy(scenarios):
+    scenario = str(scenarios / "bottleneck_1truck.xml")
+    copy = seeded_copy(scenario, 42)
+    assert os.path.dirname(copy) == str(scenarios)
+    root = etree.parse(copy).getroot()
+    assert [s.get("seed") for s in root.iter("SIMULATION")] == ["42"]
+    assert etree.parse(scenario).getroot().find(".//SIMULATION").get("seed") == "1"
+    os.remove(copy)
+
+
+def test_batch_reports_failed_runs(scenarios):
+    summary = run_batch(
+        [str(scenarios / "*.xml")],
+        seeds=(1, 2),
+        library_path=str(scenarios / "libSymuFlow.so"),
+        workers=1,
+    )
+    assert tuple(summary.columns) == COLUMNS
+    assert len(summary) == 4
+    assert summary["status"].str.startswith("failed").all()
+    assert (summary["steps"] == 0).all()
+    assert sorted(os.listdir(scenarios)) == [
+        "bottleneck_1truck.xml",
+        "bottleneck_3trucks.xml",
+    ]
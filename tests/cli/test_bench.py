@@ -0,0 +1,72 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.bench`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import json
+import platform
+import pytest
+from click.testing import CliRunner
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble import cli
+from ensemble.bench import DENSITY, run_bench, workload
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def test_workload_holds_the_fleet():
+    parameters = workload(1000, links=5, lanes=2)
+    lane_km = parameters["links"] * parameters["lanes"] * parameters["length"]
+    assert lane_km / 1000 * DENSITY == pytest.approx(1000)
+
+
+def test_bench_query_only():
+    report = run_bench(200, steps=5, truck_share=0, layers=())
+    assert report["steps"] == 5
+    assert report["simulated"] == 5
+    assert report["wall"] > 0
+    assert report["vehicle_steps"] >= 4 * 200 * 0.9
+    assert report["vehicle_rate"] > 0
+    assert "phase.query" in report["phases"].index
+    assert report["phases"].loc["phase.query", "share"] <= 1
+
+
+def test_bench_unknown_layers():
+    with pytest.raises(ValueError):
+        run_bench(10, steps=2, layers=("strategic",))
+    with pytest.raises(ValueError):
+        run_bench(10, steps=2, layers=("operational",))
+
+
+@pytest.mark.skipif(platform.system() == "Linux", reason="Not .so available")
+def test_bench_all_layers():
+    report = run_bench(200, steps=5, layers=("tactical", "operational"))
+    assert "phase.control" in report["phases"].index
+    assert "operational" in report["phases"].index
+
+
+def test_cli_bench(tmp_path):
+    output = str(tmp_path / "bench.json")
+    args = ["-p", "synthetic", "bench", "-n", "100", "--steps", "3"]
+    args += ["--truck-share", "0"]
+    result = CliRunner().invoke(cli.main, args + ["--no-layer", "-o", output])
+    assert result.exit_code == 0
+    assert "Vehicle-steps per second" in result.output
+    with open(output) as f:
+        report = json.load(f)
+    assert report["steps"] == 3
+    assert "phase.query" in report["phases"]
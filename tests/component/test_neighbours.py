@@ -0,0 +1,115 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.component.neighbours`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import pytest
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.component.neighbours import NeighbourTable, SIDES
+from ensemble.logic.publisher import Publisher
+from ensemble.logic.platoon_states import Platooning, Cutin, Splitting
+from ensemble.component.vehicle import Vehicle
+from ensemble.control.tactical.vehcoordinator import VehGapCoordinator
+from ensemble.control.tactical.solver import solve_states
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+@pytest.fixture
+def traffic():
+    rng = np.random.default_rng(7)
+    n = 300
+    return {
+        "vehid": np.arange(n),
+        "link": rng.choice(["LinkA", "LinkB", "LinkC"], n),
+        "lane": rng.integers(1, 4, n),
+        "distance": rng.permutation(n) * 0.8,
+        "speed": rng.random(n) * 30.0,
+    }
+
+
+def closest(data, i, offset, downstream):
+    """Brute force neighbour search, positions are unique"""
+    d = data["distance"]
+    candidates = [
+        j
+        for j in range(len(d))
+        if data["link"][j] == data["link"][i]
+        and data["lane"][j] == data["lane"][i] + offset
+        and (d[j] > d[i] if downstream else d[j] < d[i])
+    ]
+    if not candidates:
+        return -1
+    return min(candidates, key=lambda j: abs(d[j] - d[i]))
+
+
+def test_neighbours_match_brute_force(traffic):
+    table = NeighbourTable.build(**traffic)
+    d, v = traffic["distance"], traffic["speed"]
+    for i in range(len(table)):
+        for side, offset in SIDES.items():
+            for key, downstream in (("leader", True), ("follower", False)):
+                key = f"{side}{key}"
+                j = closest(traffic, i, offset, downstream)
+                assert table.index[key][i] == j
+                if j < 0:
+                    assert np.isnan(table.gap[key][i])
+                    continue
+                assert table.gap[key][i] == abs(d[j] - d[i])
+                assert table.dv[key][i] == v[j] - v[i]
+
+
+def test_neighbours_row():
+    table = NeighbourTable.build(
+        [10, 11, 12, 13],
+        ["LinkA"] * 4,
+        [1, 1, 2, 1],
+        [100.0, 150.0, 120.0, 50.0],
+        [20.0, 25.0, 30.0, 20.0],
+    )
+    row = table.row(10)
+    assert row["leader"] == {"vehid": 11, "gap": 50.0, "dv": 5.0}
+    assert row["follower"]["vehid"] == 13
+    assert row["left_leader"] == {"vehid": 12, "gap": 20.0, "dv": 10.0}
+    assert row["left_follower"]["vehid"] is None
+    assert row["right_leader"]["vehid"] is None
+    assert table.row(12)["right_follower"]["vehid"] == 10
+    assert len(NeighbourTable.build([], [], [], [], [])) == 0
+
+
+def test_intruder_drives_cutin():
+    publisher = Publisher()
+    vgcs = []
+    for vehid, x in ((1, 200.0), (2, 150.0)):
+        veh = Vehicle(publisher, vehid=vehid, vehtype="PLT", speed=25.0)
+        veh.distance = x
+        vgcs.append(VehGapCoordinator(veh))
+    head, ego = vgcs
+    ego.leader = head
+    ego.status = Platooning()
+    ego.dx_ref = ego.dx
+
+    ego.intruder = True
+    assert ego.dirty
+    assert type(solve_states([ego])[0]) is Cutin
+    ego.status = Cutin()
+    assert solve_states([ego])[0] is ego.status
+    ego.intruder = False
+    assert type(solve_states([ego])[0]) is Platooning
+    ego.ego.split_request = True
+    assert type(solve_states([ego])[0]) is Splitting
@@ -0,0 +1,55 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.component.region`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.component.region import RegionOfInterest
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def test_region_links_types_bbox():
+    link = ["A", "A", "B", "C"]
+    vehtype = ["VL", "PLT", "VL", "PLT"]
+    x = np.array([0.0, 10.0, 20.0, 30.0])
+    y = np.zeros(4)
+    assert RegionOfInterest().mask(link, vehtype, x, y).all()
+    roi = RegionOfInterest(links={"A", "B"})
+    assert roi.mask(link, vehtype).tolist() == [True, True, True, False]
+    roi = RegionOfInterest(links={"A", "B"}, types={"PLT"})
+    assert roi.mask(link, vehtype).tolist() == [False, True, False, False]
+    roi = RegionOfInterest(bbox=(5, -1, 25, 1))
+    assert roi.mask(link, vehtype, x, y).tolist() == [False, True, True, False]
+
+
+def test_region_radius_matches_brute_force():
+    rng = np.random.default_rng(7)
+    n = 2000
+    x = rng.uniform(0, 5000, n)
+    y = rng.uniform(0, 200, n)
+    vehtype = np.where(rng.random(n) < 0.02, "PLT", "VL").tolist()
+    link = ["L"] * n
+    roi = RegionOfInterest(radius=100)
+    result = roi.mask(link, vehtype, x, y)
+
+    truck = np.array([t == "PLT" for t in vehtype])
+    dist = np.hypot(x[:, None] - x[truck], y[:, None] - y[truck])
+    expected = truck | (dist <= 100).any(axis=1)
+    assert (result == expected).all()
+    assert 0 < result.sum() < n
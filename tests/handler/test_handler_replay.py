@@ -0,0 +1,124 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.handler.replay`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import platform
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.configurator import Configurator
+from ensemble.handler.replay import ReplayConnector
+from ensemble.handler.replay.source import XMLTrace, open_source
+from ensemble.logic import RuntimeDevice
+from ensemble.tools.exceptions import EnsembleAPILoadFileError
+from ensemble.tools.recorder import TrajectoryRecorder
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def frame(time, trajs=()):
+    traj = "".join(
+        f'<TRAJ abs="{x}" acc="0.00" dst="{x}" id="{i}" ord="0.00" tron="LinkA" type="VL" vit="25.00" voie="1" z="0.00"/>'
+        for i, x in trajs
+    )
+    return (
+        f'<INST nbVeh="{len(trajs)}" val="{time:.2f}"><CREATIONS/><SORTIES/>'
+        f"<TRAJS>{traj}</TRAJS><STREAMS/><LINKS/><SGTS/><FEUX/><ENTREES/>"
+        "<REGULATIONS/></INST>"
+    ).encode()
+
+
+FRAMES = [frame(t, ((0, 25.0 * t + 30), (1, 25.0 * t))) for t in range(1, 7)]
+
+
+@pytest.fixture
+def trace(tmp_path):
+    path = tmp_path / "trace.xml"
+    path.write_bytes(
+        b'<?xml version="1.0" encoding="UTF-8"?><OUT><IN/><SIMULATION>'
+        b"<INSTANTS>" + b"".join(FRAMES) + b'<INST nbVeh="0" val="7.00"/>'
+        b"</INSTANTS></SIMULATION></OUT>"
+    )
+    return path
+
+
+def test_xml_trace_index(trace):
+    source = open_source(str(trace))
+    assert isinstance(source, XMLTrace)
+    assert len(source) == 7
+    assert source.times.tolist() == [1, 2, 3, 4, 5, 6, 7]
+    assert source[2] == FRAMES[2]
+    source.close()
+
+
+def test_replay_seek_and_window():
+    connector = ReplayConnector(source=FRAMES)
+    connector.load_scenario()
+    assert connector.query_data() == 1
+    assert connector.request.current_time == 1.0
+    assert connector.request.get_vehicles_property("vehid") == (0, 1)
+
+    connector.seek(5)
+    assert [connector.query_data() for _ in range(3)] == [5, 6, -1]
+    assert not connector.do_next
+    assert connector.time == 6.0
+
+    connector.window(2, 3.5)
+    steps = []
+    while connector.do_next:
+        steps.append(connector.query_data())
+    assert steps == [2, 3]
+    assert connector.request.current_time == 3.0
+
+
+def test_replay_columnar_recording(tmp_path):
+    connector = ReplayConnector(source=FRAMES)
+    connector.load_scenario()
+    with TrajectoryRecorder(connector.request, str(tmp_path), fmt="npz"):
+        while connector.do_next:
+            connector.query_data()
+    expected = connector.request.get_vehicle_data()
+
+    replay = ReplayConnector(source=tmp_path)
+    replay.load_scenario()
+    assert len(replay) == 6
+    replay.seek(6)
+    replay.query_data()
+    assert replay.request.current_time == 6.0
+    assert replay.request.get_vehicle_data() == expected
+
+
+def test_replay_missing_recording(tmp_path):
+    with pytest.raises(EnsembleAPILoadFileError):
+        ReplayConnector(source=str(tmp_path / "missing.xml")).load_scenario()
+
+
+@pytest.mark.skipif(platform.system() == "Linux", reason="Not .so available")
+def test_replay_runtime(trace):
+    configurator = Configurator(info=False, simulation_platform="replay")
+    configurator.update_values(scenario_files=(str(trace),), sim_steps=100)
+    seen = []
+    device = RuntimeDevice(configurator)
+    device.add_hook(
+        lambda c: seen.append(
+            (c.simulation_time, len(c.connector.request.vehicle_registry))
+        )
+    )
+    with device:
+        pass
+    assert device.step == 7  # The last frame ends the replay
+    assert seen == [(t, 2) for t in range(1, 7)]
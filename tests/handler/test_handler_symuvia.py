@@ -9,6 +9,7 @@
 import os
 import unittest
 import platform
+from types import SimpleNamespace
 import pytest
 
 # ============================================================================
@@ -20,7 +21,9 @@ from ensemble.handler.symuvia import (
     SymuviaConnector,
     SymuviaScenario,
 )
+import ensemble.handler.symuvia.connector as symuvia_connector
 import ensemble.tools.constants as CT
+from ensemble.tools.archive import FrameArchive
 
 # ============================================================================
 # TESTS AND DEFINITIONS
@@ -47,3 +50,128 @@ def test_connector_constructor(symuvia_library_path):
     assert connector.trace_flow == CT.TRACE_FLOW
     assert connector.total_steps == CT.TOTAL_SIMULATION_STEPS
     assert connector.step_launch_mode == CT.LAUNCH_MODE
+
+
+class FakeSymuFlow:
+    """Simulator library answering empty frames for a given number of steps"""
+
+    def __init__(self, steps, truck=None):
+        self.steps = steps
+        self.truck = truck  # Step of the platoon vehicle creation
+        self.calls = 0
+        self.lite = 0
+
+    def SymLoadNetworkEx(self, filename):
+        return 1
+
+    def SymRunNextStepLiteEx(self, write_xml, b_end):
+        self.calls += 1
+        self.lite += 1
+        return self.calls < self.steps
+
+    def SymRunNextStepEx(self, buffer, write_xml, b_end):
+        self.calls += 1
+        creation = ""
+        if self.truck is not None and self.calls >= self.truck:
+            creation = '<CREATION entree="Ext_In" id="0" sortie="Ext_Out" type="PLT"/>'
+        buffer.value = (
+            f'<INST nbVeh="0" val="{self.calls}.00"><CREATIONS>{creation}'
+            "</CREATIONS><SORTIES/><TRAJS/><STREAMS/><LINKS/><SGTS/><FEUX/>"
+            "<ENTREES/><REGULATIONS/></INST>"
+        ).encode()
+        return self.calls < self.steps
+
+
+@pytest.fixture
+def fake_connector(monkeypatch):
+    def connector(pipelined=False, steps=5, truck=None, **kwargs):
+        library = FakeSymuFlow(steps, truck)
+        monkeypatch.setattr(
+            symuvia_connector, "cdll", SimpleNamespace(LoadLibrary=lambda p: library)
+        )
+        connector = SymuviaConnector(
+            library_path="libSymuFlow",
+            step_launch_mode="traj",
+            pipelined=pipelined,
+            **kwargs,
+        )
+        scenario = os.path.join(
+            os.getcwd(), "tests", "mocks", "symuvia", "bottleneck_1truck.xml"
+        )
+        connector.load_scenario(SymuviaScenario.create_input(scenario))
+        return connector, library
+
+    return connector
+
+
+def run_frames(connector):
+    frames = []
+    while connector.do_next:
+        connector.query_data()
+        request = connector.request
+        frames.append(request.current_time if request.query else None)
+    return frames
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_connector_frames(fake_connector, pipelined):
+    connector, library = fake_connector(pipelined)
+    assert run_frames(connector) == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert library.calls == 5
+
+
+def test_connector_pipelined_lag(fake_connector):
+    connector, library = fake_connector(True)
+    connector.query_data()
+    connector._pending.result()
+    # Next step already ran in the other buffer, current frame is kept
+    assert library.calls == 2
+    assert connector.request.current_time == 1.0
+    connector.query_data()
+    assert connector.request.current_time == 2.0
+    connector.drain()
+    assert library.calls == 3
+    assert connector._executor is None
+
+
+def test_connector_pipelined_restarts_worker(fake_connector):
+    connector, library = fake_connector(True)
+    connector.query_data()
+    connector.drain()
+    assert connector._executor is None
+    assert run_frames(connector) == [3.0, 4.0, 5.0]  # Step 2 dropped
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_connector_fast_forward(fake_connector, pipelined):
+    connector, library = fake_connector(
+        pipelined, steps=20, truck=7, fast_forward=True, probe_interval=4
+    )
+    frames = run_frames(connector)
+    # Lite steps until the probe of step 8 finds the truck
+    assert library.lite == 6
+    assert frames[:7] == [None] * 7
+    assert frames[7:] == [float(t) for t in range(8, 21)]
+
+
+def test_connector_fast_forward_until(fake_connector):
+    connector, library = fake_connector(
+        steps=20, fast_forward=True, fast_forward_until=12, probe_interval=4
+    )
+    frames = run_frames(connector)
+    assert library.lite == 9
+    assert frames[:12] == [None] * 12
+    assert frames[12:] == [float(t) for t in range(13, 21)]
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_connector_archive(fake_connector, pipelined, tmp_path):
+    archive = FrameArchive(str(tmp_path / "run"), "w")
+    connector, library = fake_connector(pipelined, archive=archive)
+    run_frames(connector)
+    connector.drain()
+    archive.close()
+    archive = FrameArchive(str(tmp_path / "run"))
+    assert archive.steps.tolist() == [1, 2, 3, 4, 5]
+    assert archive.times.tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert archive.get(5).decode() == connector.request.query
@@ -0,0 +1,115 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.handler.synthetic`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import json
+import platform
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.configurator import Configurator
+from ensemble.handler.symuvia.xmlparser import XMLTrajectory
+from ensemble.handler.synthetic import SyntheticConnector
+from ensemble.handler.synthetic.generator import StreamGenerator
+from ensemble.logic import RuntimeDevice
+from ensemble.tools.exceptions import EnsembleAPILoadFileError
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def test_generator_initial_density():
+    generator = StreamGenerator(links=4, lanes=3, density=50, seed=0)
+    assert len(generator) == 4 * 3 * 50 - 3
+    trajectory = XMLTrajectory(generator.frame())
+    assert len(trajectory.todict) == len(generator)
+    assert {t["lane"] for t in trajectory.todict} == {1, 2, 3}
+    assert {t["vehtype"] for t in trajectory.todict} == {"VL", "PLT"}
+
+
+def test_generator_flow():
+    generator = StreamGenerator(
+        links=2, lanes=2, length=500, demand=1800, truck_share=0.5, seed=1
+    )
+    created, exited = set(), set()
+    for _ in range(300):
+        generator.advance()
+        gap, _ = generator._leaders()
+        assert (gap > 0).all()  # No collision
+        events = XMLTrajectory(generator.frame()).events
+        created.update(c.vehid for c in events.creations)
+        exited.update(e.vehid for e in events.exits)
+    assert created and exited and exited < created
+    assert set(generator.vehid.tolist()) == created - exited
+    assert generator.time == 300.0
+
+
+def test_generator_vissim_rows():
+    generator = StreamGenerator(links=1, lanes=1, density=10, seed=0)
+    generator.advance()
+    rows = generator.rows()
+    assert len(rows) == len(generator)
+    assert {r[6] for r in rows} <= {"100", "201"}
+    assert rows[0][7] == pytest.approx(generator.speed[0] * 3.6)
+
+
+@pytest.mark.parametrize("stream", ["symuvia", "vissim"])
+def test_connector_steps(stream, tmp_path):
+    scenario = tmp_path / "synthetic.json"
+    scenario.write_text(
+        json.dumps(
+            {
+                "links": 2,
+                "lanes": 2,
+                "density": 20,
+                "truck_share": 0,  # Platoon trucks need the truck library
+                "stream": stream,
+            }
+        )
+    )
+    connector = SyntheticConnector(total_steps=5)
+    connector.load_scenario(str(scenario))
+    assert connector.stream == stream
+    steps = []
+    while connector.do_next:
+        steps.append(connector.query_data())
+    assert steps == [1, 2, 3, 4, 5]
+    assert connector.request.current_time == 5.0
+    assert connector.request.current_nbveh == len(connector.generator)
+
+
+def test_connector_bad_scenario():
+    with pytest.raises(EnsembleAPILoadFileError):
+        SyntheticConnector().load_scenario({"link": 2})
+
+
+@pytest.mark.skipif(platform.system() == "Linux", reason="Not .so available")
+def test_synthetic_runtime(tmp_path):
+    scenario = tmp_path / "synthetic.json"
+    scenario.write_text(json.dumps({"links": 2, "lanes": 2, "density": 20}))
+    configurator = Configurator(info=False, simulation_platform="synthetic")
+    configurator.update_values(scenario_files=(str(scenario),), sim_steps=10)
+    seen = []
+    device = RuntimeDevice(configurator)
+    device.add_hook(
+        lambda c: seen.append(
+            (len(c.vehicle_registry), len(c.connector.generator))
+        )
+    )
+    with device:
+        pass
+    assert len(seen) == 9  # The last step ends the stream
+    assert all(registry == generator for registry, generator in seen)
@@ -0,0 +1,45 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.logic.platoon_set`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.logic.platoon_set import PlatoonIdAllocator
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+@pytest.fixture
+def allocator():
+    return PlatoonIdAllocator()
+
+
+def test_allocate_sequential_ids(allocator):
+    assert [allocator.allocate() for _ in range(3)] == [0, 1, 2]
+    assert len(allocator) == 3
+
+
+def test_reuse_released_ids(allocator):
+    for _ in range(4):
+        allocator.allocate()
+    allocator.release(2)
+    allocator.release(0)
+    assert len(allocator) == 2
+    assert allocator.allocate() == 0
+    assert allocator.allocate() == 2
+    assert allocator.allocate() == 4
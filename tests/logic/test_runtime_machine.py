@@ -0,0 +1,133 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.logic.runtime_machine`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+import ensemble.logic.runtime_states as runtime_states
+from ensemble.logic.runtime_machine import RuntimeDevice, RUNTIME_SEQ
+from ensemble.logic.runtime_states import Terminate
+from ensemble.tools.constants import DCT_RUNTIME_PARAM
+from ensemble.tools.profiler import PROFILER
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+class Connector:
+    def __init__(self, steps):
+        self.steps = steps
+        self.simulation_step = 0
+
+    @property
+    def do_next(self):
+        return self.simulation_step < self.steps
+
+
+class RecordingConfigurator:
+    """Configurator recording the tasks called by the runtime states"""
+
+    verbose = False
+
+    def __init__(self, total_steps, simulator_steps):
+        self.total_steps = total_steps
+        self.simulation_parameters = dict(DCT_RUNTIME_PARAM)
+        self.connector = Connector(simulator_steps)
+        self.calls = []
+
+    def __getattr__(self, name):
+        if name.startswith(("load_", "update_", "close_")):
+            return lambda: self.calls.append(name)
+        raise AttributeError(name)
+
+    def query_data(self):
+        self.connector.simulation_step += 1
+        self.calls.append("query_data")
+
+
+@pytest.fixture(autouse=True)
+def compliant(monkeypatch):
+    monkeypatch.setattr(
+        runtime_states, "check_scenario_consistency", lambda c: True
+    )
+
+
+def test_pipeline_runs_phases_in_order():
+    configurator = RecordingConfigurator(3, 10)
+    device = RuntimeDevice(configurator)
+    device.add_hook(lambda c: c.calls.append("step"), "pre")
+    device.add_hook(lambda c: c.calls.append("queried"), "post", "query")
+    with device:
+        pass
+    step = [
+        "step",
+        "query_data",
+        "update_platoon_registry",
+        "queried",
+        "update_operational_layer",
+        "update_safety_monitor",
+    ]
+    assert configurator.calls == (
+        ["load_socket", "load_scenario"]
+        + 3 * step
+        + ["close_operational_layer", "close_connector"]
+    )
+    assert device.step == 3
+    assert isinstance(device.state, Terminate)
+
+
+def test_pipeline_stops_with_simulator():
+    configurator = RecordingConfigurator(10, 2)
+    stop = RecordingConfigurator(10, 10)
+    with RuntimeDevice(configurator) as device:
+        assert device.step == 2
+    device = RuntimeDevice(stop)
+    device.add_hook(lambda c: c.connector.simulation_step < 4, "post")
+    with device:
+        assert device.step == 4
+    with pytest.raises(ValueError):
+        device.add_hook(print, "post", "unknown")
+
+
+def test_string_events_match_pipeline():
+    configurator = RecordingConfigurator(2, 10)
+    device = RuntimeDevice(configurator)
+    for event in ["compliance", "connect", "initialize"] + 2 * RUNTIME_SEQ:
+        device.next_state(event)
+    device.next_state("terminate")
+    device.next_state("terminate")
+    expected = RecordingConfigurator(2, 10)
+    with RuntimeDevice(expected):
+        pass
+    assert configurator.calls == expected.calls
+
+
+
+def test_profiled_pipeline():
+    configurator = RecordingConfigurator(5, 10)
+    PROFILER.reset()
+    PROFILER.enable()
+    try:
+        with RuntimeDevice(configurator):
+            pass
+    finally:
+        PROFILER.disable()
+    stats = PROFILER.to_dict()["timers"]
+    assert stats["step"]["wall"]["count"] == 5
+    for event in RUNTIME_SEQ:
+        assert stats[f"phase.{event}"]["wall"]["count"] == 5
+    PROFILER.reset()
@@ -0,0 +1,72 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.logic.scheduler`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from types import SimpleNamespace
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.configurator import Configurator
+from ensemble.logic.runtime_states import Control
+from ensemble.logic.scheduler import MultiRateScheduler
+from ensemble.tools.constants import DCT_RUNTIME_PARAM
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+@pytest.fixture
+def scheduler():
+    return MultiRateScheduler(DCT_RUNTIME_PARAM)
+
+
+def test_declared_periods(scheduler):
+    assert scheduler["simulator"].period == DCT_RUNTIME_PARAM["sampling_time"]
+    assert scheduler["tactical"].period == 60
+    assert scheduler["operational"].period == pytest.approx(0.1)
+
+
+def test_tactical_runs_at_its_rate(scheduler):
+    calls = []
+    for t in range(180):
+        scheduler.run("tactical", float(t), calls.append, t)
+    assert calls == [0, 60, 120]
+    assert scheduler["tactical"].ticks == 3
+
+
+def test_hold_between_ticks(scheduler):
+    scheduler.run("tactical", 0.0, lambda: 1.0)
+    assert scheduler.run("tactical", 30.0, lambda: 2.0) == 1.0
+    assert scheduler["tactical"].hold() == 1.0
+
+
+def test_control_runs_operational_layer():
+    calls = []
+    registry = SimpleNamespace(
+        apply_cacc=lambda time, step: calls.append((time, step))
+    )
+    configurator = Configurator()
+    configurator.connector = SimpleNamespace(simulation_step=0)
+    configurator.scheduler = MultiRateScheduler(
+        {**DCT_RUNTIME_PARAM, "sampling_time_operational": 2}
+    )
+    control = Control()
+    assert control.run(configurator)  # No platoon registry yet
+    configurator.platoon_registry = registry
+    for step in range(1, 6):
+        configurator.connector.simulation_step = step
+        assert control.run(configurator)
+    assert calls == [(1, 2), (3, 2), (5, 2)]
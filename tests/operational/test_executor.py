@@ -0,0 +1,126 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.control.operational.executor`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.logic.publisher import Publisher
+from ensemble.logic.platoon_states import StandAlone, Platooning
+from ensemble.component.vehicle import Vehicle
+from ensemble.component.dynamics import RegularDynamics
+from ensemble.control.operational import CACC
+from ensemble.control.operational.executor import (
+    OperationalExecutor,
+    partition,
+    balance,
+)
+from ensemble.control.tactical.vehcoordinator import VehGapCoordinator
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+class LinearController(CACC):
+    """Pure python controller replacing the compiled library"""
+
+    def __init__(self):
+        self._path_library = ""
+
+    def load_library(self, path_library):
+        pass
+
+    def single_call_control(self, leader, ego, r_ego, t, T):
+        spacing = leader["x"] - ego["x"] - r_ego["g_cacc"] * ego["v"]
+        return 0.1 * spacing + 0.5 * (r_ego["v"] - ego["v"]) + 0.1 * leader["a"]
+
+
+def create_coordinators(platoons: int = 3, size: int = 3):
+    """Platoons of vehicles on a single link, processed downstream first"""
+    publisher = Publisher()
+    vgcs = []
+    for p in range(platoons):
+        head = None
+        for i in range(size):
+            vehid = p * size + i
+            x = 1000.0 * (platoons - p) - 30.0 * i
+            veh = Vehicle(
+                publisher,
+                dynamics=RegularDynamics(vehid, x, 20.0 + i, 0.0),
+                vehid=vehid,
+                vehtype="PLT",
+                link="LinkA",
+                speed=20.0 + i,
+                acceleration=0.0,
+            )
+            veh.distance = x
+            vgc = VehGapCoordinator(veh)
+            if head is not None:
+                vgc.leader = vgcs[-1]
+                vgc.leader_data = {"id": vgcs[-1].vehid}
+            head = vgc
+            vgc.init_reference()
+            state = Platooning() if vgc.leader is not vgc else StandAlone()
+            vgc.reference.create_time_gap_hwy(state)
+            vgcs.append(vgc)
+    return vgcs
+
+
+def evolve(vgcs, executor, nsteps: int = 3):
+    for t in range(nsteps):
+        if executor is None:
+            controller = LinearController()
+            for vgc in vgcs:
+                vgc.evolve_control(controller, float(t), 0.1)
+        else:
+            executor(vgcs, float(t), 0.1)
+    return vgcs
+
+
+def assert_identical(lhs, rhs):
+    for a, b in zip(lhs, rhs):
+        assert np.array_equal(a.history_state, b.history_state)
+        assert np.array_equal(a.history_control, b.history_control)
+        assert np.array_equal(a.history_reference, b.history_reference)
+        assert a._ctr_ego_data == b._ctr_ego_data
+        assert a._ctr_lead_data == b._ctr_lead_data
+
+
+def test_partition_follows_leaders():
+    vgcs = create_coordinators(3, 3)
+    groups = partition(vgcs)
+    assert [[vgc.vehid for vgc in g] for g in groups] == [
+        [0, 1, 2],
+        [3, 4, 5],
+        [6, 7, 8],
+    ]
+    assert balance([3, 1, 2, 2], 2) == [[0, 1], [2, 3]]
+
+
+def test_serial_executor_matches_controller():
+    reference = evolve(create_coordinators(), None)
+    with OperationalExecutor(LinearController()) as executor:
+        result = evolve(create_coordinators(), executor)
+    assert reference[0].history_state.shape == (31, 3)
+    assert_identical(reference, result)
+
+
+def test_parallel_executor_is_bitwise_identical():
+    with OperationalExecutor(LinearController()) as executor:
+        serial = evolve(create_coordinators(), executor)
+    with OperationalExecutor(LinearController(), workers=2) as executor:
+        parallel = evolve(create_coordinators(), executor)
+    assert_identical(serial, parallel)
@@ -42,3 +42,11 @@ def test_joining():
     r = ReferenceHeadway(gap0=2)
     r.create_time_gap_hwy(Joining())
     assert r.reference_headway[-1] == 1.4
+
+
+def test_horizon_extended():
+    r = ReferenceHeadway(interval=3)
+    r.create_time_gap_hwy(Platooning())
+    times = [t for _ in range(5) for t, _, _ in r]
+    assert len(times) == 50
+    assert times[-1] > 3
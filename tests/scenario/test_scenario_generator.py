@@ -0,0 +1,83 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.handler.symuvia.generator`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.handler.symuvia import SymuviaScenario
+from ensemble.handler.symuvia.generator import (
+    corridor,
+    grid,
+    validate,
+    write_scenario,
+)
+from ensemble.tools.exceptions import EnsembleAPILoadFileError
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+SCHEMA = os.path.join(os.getcwd(), "tests", "mocks", "reseau.xsd")
+
+
+def test_corridor(tmp_path):
+    tree = corridor(
+        links=4,
+        lanes=(2, 3, 1, 2),
+        demand=3600,
+        vehicle_types={"VL": 0.5, "PLT": 0.5},
+        duration=120,
+    )
+    assert validate(tree, SCHEMA)
+    path = write_scenario(tree, tmp_path / "corridor.xml")
+    scenario = SymuviaScenario.create_input(str(path))
+    assert scenario.get_network_links() == tuple(f"Link_00{i}" for i in range(4))
+    assert scenario.get_network_endpoints() == ("Ext_In", "Ext_Out")
+    assert len(scenario.get_simulation_steps()) == 120
+    lanes = tree.xpath("RESEAUX/RESEAU/TRONCONS/TRONCON/@nb_voie")
+    assert lanes == ["2", "3", "1", "2"]
+    vehicles = tree.xpath("//CREATION_VEHICULE/@typeVehicule")
+    assert 60 < len(vehicles) < 180
+    assert set(vehicles) == {"VL", "PLT"}
+
+
+def test_corridor_seed():
+    instants = "//CREATION_VEHICULE/@instant"
+    first = corridor(links=2, duration=300, seed=3).xpath(instants)
+    assert first == corridor(links=2, duration=300, seed=3).xpath(instants)
+    assert first != corridor(links=2, duration=300, seed=4).xpath(instants)
+    with pytest.raises(ValueError):
+        corridor(links=2, lanes=(1, 2, 3))
+
+
+def test_grid(tmp_path):
+    tree = grid(rows=2, columns=3, duration=600)
+    assert validate(write_scenario(tree, tmp_path / "grid.xml"), SCHEMA)
+    assert len(tree.xpath("//RESEAU/TRONCONS/TRONCON")) == 2 * 4 + 3 * 3
+    assert len(tree.xpath("//REPARTITEUR")) == 6
+    # Vehicles of the upper row only reach the upper exits
+    destinations = tree.xpath(
+        "//EXTREMITE[@id='West_1']//CREATION_VEHICULE/@destination"
+    )
+    assert destinations and "East_0" not in destinations
+
+
+def test_validate_invalid():
+    tree = corridor(links=2, duration=60)
+    del tree.xpath("//RESEAU/TRONCONS/TRONCON")[0].attrib["id_eltamont"]
+    with pytest.raises(EnsembleAPILoadFileError):
+        validate(tree, SCHEMA)
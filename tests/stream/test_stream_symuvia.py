@@ -16,6 +16,7 @@ import pytest
 from ensemble.handler.symuvia.stream import SimulatorRequest as SymuviaRequest
 from ensemble.handler.symuvia.xmlparser import XMLTrajectory
 from ensemble.tools.constants import BUFFER_STRING
+from ensemble.component.region import RegionOfInterest
 
 # ============================================================================
 # TESTS AND DEFINITIONS
@@ -456,3 +457,15 @@ def test_retrieve_time_step(symuviarequest, three_vehicle_xml):
 def test_retrieve_nb_veh(symuviarequest, three_vehicle_xml):
     symuviarequest.query = three_vehicle_xml
     assert symuviarequest.current_nbveh == 3
+
+
+def test_region_of_interest(three_vehicle_xml):
+    roi = RegionOfInterest(bbox=(60, -1, 200, 1))
+    trajectory = XMLTrajectory(three_vehicle_xml, roi)
+    assert [v["vehid"] for v in trajectory.todict] == [0, 1]
+    assert trajectory.outside == 1
+    assert XMLTrajectory(three_vehicle_xml).outside == 0
+    request = SymuviaRequest(roi=RegionOfInterest(types={"PLT"}))
+    request.query = three_vehicle_xml
+    assert request.current_outside == 3
+    assert len(request.vehicle_registry) == 0
@@ -1,6 +1,7 @@
 import pytest
 
 from ensemble.handler.vissim.stream import SimulatorRequest
+import ensemble.tools.constants as ct
 
 
 @pytest.fixture
@@ -134,3 +135,47 @@ def test_parser_conver(
         )
         == True
     )
+
+
+def test_parser_columns(simrequest, two_vehicle_dictionaries):
+    rows = tuple(tuple(d.values()) for d in two_vehicle_dictionaries)
+    simrequest.query = rows
+    columns = simrequest.columns
+    assert columns["vehid"].dtype.kind == "i"
+    assert columns["speed"].dtype.kind == "f"
+    assert columns["link"].tolist() == ["6", "6"]
+    assert not columns["driven"].any()
+    assert simrequest.current_nbveh == 2
+    assert simrequest.get_vehicles_property("vehid") == (1, 2)
+    assert simrequest.get_vehicles_property("unknown") == (None, None)
+    assert simrequest.get_vehicle_properties(2)["distance"] == 6.745019515178477
+    assert simrequest.get_vehicle_properties(3) == {}
+    simrequest.get_vehicle_properties(2)["distance"] = 0.0
+    assert simrequest.get_vehicle_properties(2)["distance"] == 6.745019515178477
+    assert simrequest.vehicles_in_link("6") == (1, 2)
+    assert simrequest.vehicles_in_link("6", lane=2) == ()
+
+
+def test_parser_follows_field_format(
+    simrequest, two_vehicle_dictionaries, monkeypatch
+):
+    monkeypatch.setitem(ct.FIELD_FORMAT_VISSIM, "Speed", float)
+    simrequest.query = two_vehicle_dictionaries
+    speed = [d["Speed"] for d in two_vehicle_dictionaries]
+    assert simrequest.columns["speed"].tolist() == speed
+
+
+def test_parser_cached_per_frame(simrequest, two_vehicle_dictionaries):
+    simrequest.query = two_vehicle_dictionaries
+    data = simrequest.get_vehicle_data()
+    assert simrequest.get_vehicle_data() is data
+    simrequest.query = two_vehicle_dictionaries[:1]
+    assert len(simrequest.get_vehicle_data()) == 1
+    assert len(data) == 2
+
+
+def test_parser_empty(simrequest):
+    assert simrequest.get_vehicle_data() == []
+    simrequest.query = ()
+    assert simrequest.current_nbveh == 0
+    assert simrequest.get_vehicles_property("vehid") == ()
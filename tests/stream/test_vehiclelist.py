@@ -119,3 +119,77 @@ def test_get_follower_inrange(symuviarequest, TEST01):
     vehlist = VehicleList(symuviarequest)
     assert vehlist.get_follower(vehlist[0], 200) is vehlist[1]
     assert vehlist.get_follower(vehlist[1], 200) is vehlist[1]
+
+
+def frame(time, creations=(), exits=(), trajs=()):
+    creation = "".join(
+        f'<CREATION entree="Ext_In" id="{i}" sortie="Ext_Out" type="VL"/>'
+        for i in creations
+    )
+    sortie = "".join(f'<SORTIE id="{i}" sortie="Ext_Out"/>' for i in exits)
+    traj = "".join(
+        f'<TRAJ abs="{x}" acc="0.00" dst="{x}" id="{i}" ord="0.00" tron="LinkA" type="VL" vit="25.00" voie="1" z="0.00"/>'
+        for i, x in trajs
+    )
+    return (
+        f'<INST nbVeh="{len(trajs)}" val="{time}.00"><CREATIONS>{creation}</CREATIONS>'
+        f"<SORTIES>{sortie}</SORTIES><TRAJS>{traj}</TRAJS><STREAMS/><LINKS/>"
+        '<SGTS/><FEUX/><ENTREES><ENTREE id="Ext_In" nb_veh_en_attente="2"/>'
+        "</ENTREES><REGULATIONS/></INST>"
+    ).encode()
+
+
+def test_update_from_events(symuviarequest, monkeypatch):
+    fallback = []
+    compare_ids = VehicleList.compare_ids
+    monkeypatch.setattr(
+        VehicleList,
+        "compare_ids",
+        lambda self, extra=[]: fallback.append(1) or compare_ids(self, extra),
+    )
+    symuviarequest.query = frame(1, creations=(0,))
+    assert symuviarequest.events.queued == {"Ext_In": 2}
+    vehlist = symuviarequest.vehicle_registry
+    assert len(vehlist) == 0
+
+    symuviarequest.query = frame(2, creations=(1,), trajs=((0, 25.0),))
+    symuviarequest.query = frame(3, trajs=((0, 50.0), (1, 25.0)))
+    assert [v.vehid for v in vehlist] == [0, 1]
+    symuviarequest.query = frame(4, exits=(0,), trajs=((1, 50.0),))
+    assert [v.vehid for v in vehlist] == [1]
+    assert fallback == []
+
+    # Vehicle missing without exit event
+    symuviarequest.query = frame(5)
+    assert len(vehlist) == 0
+    assert fallback == [1]
+
+    # Vehicle swapped without events, counts match but ids do not
+    symuviarequest.query = frame(6, trajs=((2, 25.0), (3, 50.0)))
+    symuviarequest.query = frame(7, trajs=((3, 75.0), (4, 25.0)))
+    assert [v.vehid for v in vehlist] == [3, 4]
+    assert fallback == [1, 1, 1]
+
+
+def test_registries_keep_their_ids():
+    requests = SimulatorRequest(), SimulatorRequest()
+    for request in requests:
+        request.query = frame(1, trajs=((0, 25.0),))
+        request.query = frame(2, trajs=((0, 50.0), (1, 25.0)))
+    for request in requests:
+        assert [v.vehid for v in request.vehicle_registry] == [0, 1]
+
+
+def test_get_leader_by_position(symuviarequest):
+    # Same distance, the leader is found from the coordinates
+    TEST = [
+        trkdata(
+            x, 0, 100, False, 0, 1, "LinkA", 0, 25, i, "VL", None, False, False
+        )
+        for x, i in ((150, 7), (100, 9))
+    ]
+    symuviarequest.query = transform_data(TEST)
+    vehlist = VehicleList(symuviarequest)
+    leader, ego = vehlist  # Sorted by id
+    assert vehlist.get_leader(ego) is leader
+    assert vehlist.get_follower(leader) is ego
@@ -1021,6 +1021,32 @@ def TEST22():
     return case
 
 
+@pytest.fixture
+def TEST23():
+    """StandAlone -> Join
+    Long queue of trucks split in platoons of maximum length
+    """
+    return [
+        trkdata(
+            0,
+            0,
+            1000 - 30 * i,
+            False,
+            0,
+            1,
+            "LinkA",
+            1000 - 30 * i,
+            25,
+            i,
+            "PLT",
+            StandAlone(),
+            True,
+            True,
+        )
+        for i in range(1, 15)
+    ]
+
+
 @pytest.fixture
 def symuviarequest():
     return SymuviaRequest()
@@ -1233,6 +1259,79 @@ def test_22_(symuviarequest: SymuviaRequest, TEST22: list):
     assert True
 
 
+@pytest.mark.skipif(platform.system() == "Linux", reason="Not .so available")
+def test_23_platoon_formation(symuviarequest: SymuviaRequest, TEST23: list):
+    symuviarequest.query = transform_data(TEST23)
+    vehlist = VehicleList(symuviarequest)
+    ggc = GlobalGapCoordinator(vehlist)
+    ggc.update_platoons()
+    sizes = sorted(len(ps) for ps in ggc.platoon_sets.values())
+    assert sizes == [2, 6, 6]
+    for ps in ggc.platoon_sets.values():
+        assert [vgc.positionid for vgc in ps] == list(range(len(ps)))[::-1]
+        assert all(vgc.platoonid == ps.platoonid for vgc in ps)
+
+
+@pytest.mark.skipif(platform.system() == "Linux", reason="Not .so available")
+def test_24_platoon_lifecycle(symuviarequest: SymuviaRequest, TEST23: list):
+    symuviarequest.query = transform_data(TEST23)
+    ggc = GlobalGapCoordinator(symuviarequest.vehicle_registry)
+    ggc.update_platoons()
+    assert ggc.nplatoons == 3
+
+    # Trucks 3-5 leave (chain break), last platoon leaves (dissolution)
+    remaining = [t for t in TEST23 if t.vehid not in (3, 4, 5, 13, 14)]
+    symuviarequest.query = transform_data(remaining)
+    ggc.update_platoons()
+    kinds = [event.kind for event in ggc.platoon_events]
+    assert kinds.count("created") == 3
+    assert "split" in kinds and "dissolved" in kinds
+    assert ggc.nplatoons == 3
+    assert sorted(len(ps) for ps in ggc.platoon_sets.values()) == [1, 2, 6]
+    assert len(ggc) == len(remaining)
+
+
+@pytest.mark.skipif(platform.system() == "Linux", reason="Not .so available")
+def test_25_platoon_cutin(symuviarequest: SymuviaRequest):
+    def truck(vehid, x, vehtype="PLT", lane=1):
+        return trkdata(
+            x,
+            0,
+            x,
+            False,
+            0,
+            lane,
+            "LinkA",
+            0,
+            25,
+            vehid,
+            vehtype,
+            StandAlone(),
+            True,
+            True,
+        )
+
+    symuviarequest.query = transform_data([truck(1, 200), truck(2, 170)])
+    ggc = GlobalGapCoordinator(symuviarequest.vehicle_registry)
+    ggc.update_platoons()
+    ggc.update_platoons()
+    assert isinstance(ggc[2].status, Platooning)
+
+    # Car cuts in between the trucks, then changes lane
+    symuviarequest.query = transform_data(
+        [truck(1, 202), truck(3, 185, "HDV"), truck(2, 172)]
+    )
+    ggc.update_platoons()
+    assert ggc[2].intruder
+    assert isinstance(ggc[2].status, Cutin)
+    symuviarequest.query = transform_data(
+        [truck(1, 204), truck(3, 185, "HDV", 2), truck(2, 174)]
+    )
+    ggc.update_platoons()
+    assert not ggc[2].intruder
+    assert isinstance(ggc[2].status, Platooning)
+
+
 # #
 # # def test_2():
 # #     veh=PlatoonVehicle(leader_PCM_capable=1,
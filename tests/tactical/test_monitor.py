@@ -0,0 +1,114 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.control.tactical.monitor`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import pytest
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.logic.publisher import Publisher
+from ensemble.logic.platoon_set import PlatoonEvent, CREATED, DISSOLVED, MERGED
+from ensemble.component.vehicle import Vehicle
+from ensemble.control.tactical.vehcoordinator import VehGapCoordinator
+from ensemble.control.tactical.monitor import (
+    SafetyMonitor,
+    gather_pairs,
+    surrogate,
+)
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def create_coordinator(publisher, vehid, x, speed, platoonid, leader=None):
+    veh = Vehicle(publisher, vehid=vehid, vehtype="PLT", speed=speed)
+    veh.distance = x
+    vgc = VehGapCoordinator(veh)
+    vgc.platoonid = platoonid
+    if leader is not None:
+        vgc.leader = leader
+    return vgc
+
+
+@pytest.fixture
+def platoon():
+    publisher = Publisher()
+    head = create_coordinator(publisher, 1, 200.0, 20.0, 0)
+    middle = create_coordinator(publisher, 2, 160.0, 25.0, 0, head)
+    tail = create_coordinator(publisher, 3, 130.0, 20.0, 0, middle)
+    return [head, middle, tail]
+
+
+def test_surrogate_indicators(platoon):
+    data = gather_pairs(platoon)
+    assert data["vehid"].tolist() == [2, 3]
+    metrics = surrogate(data)
+    for vgc, error in zip(platoon[1:], metrics["spacing_error"]):
+        assert error == vgc.dx - vgc.dx_ref
+    assert metrics["time_gap"].tolist() == [40.0 / 25.0, 30.0 / 20.0]
+    assert metrics["ttc"].tolist() == [40.0 / 5.0, np.inf]
+    assert metrics["drac"].tolist() == [25.0 / 80.0, 0.0]
+
+
+def test_streaming_aggregates():
+    rng = np.random.default_rng(3)
+    publisher = Publisher()
+    monitor = SafetyMonitor()
+    samples = {0: [], 1: []}
+    for step in range(50):
+        vgcs = []
+        for platoonid in (0, 1):
+            head = create_coordinator(publisher, 0, 1000.0, 20.0, platoonid)
+            gaps = rng.uniform(20.0, 40.0, 5)
+            for vehid, gap in enumerate(gaps, start=1):
+                vgc = create_coordinator(
+                    publisher, vehid, 1000.0 - gap, 20.0, platoonid, head
+                )
+                vgcs.append(vgc)
+            samples[platoonid].extend(gaps / 20.0)
+        monitor.update(vgcs, float(step))
+
+    assert len(monitor) == 2
+    assert monitor.steps == 50
+    summary = monitor.summary()
+    assert summary["samples"].tolist() == [250, 250]
+    for platoonid, values in samples.items():
+        key = (platoonid, 0.0)
+        assert monitor.minimum("time_gap")[key] == pytest.approx(min(values))
+        for q in (5, 50, 95):
+            expected = np.percentile(values, q)
+            result = monitor.percentile("time_gap", q)[key]
+            assert abs(result - expected) < 0.05  # bin width
+
+
+def test_reused_ids_start_new_lifetimes(platoon):
+    monitor = SafetyMonitor()
+    monitor.update(platoon, 0.0)
+    monitor.update(platoon, 1.0)
+    monitor.on_event(PlatoonEvent(DISSOLVED, 0))
+    monitor.on_event(PlatoonEvent(CREATED, 0))
+    monitor.update(platoon, 2.0)
+    monitor.on_event(PlatoonEvent(MERGED, 1, source=0))
+    monitor.update(platoon, 3.0)
+
+    summary = monitor.summary()
+    assert summary.index.names == ["platoonid", "created_at"]
+    assert summary["samples"].to_dict() == {
+        (0, 0.0): 4,
+        (0, 2.0): 2,
+        (0, 3.0): 2,
+    }
+
@@ -0,0 +1,158 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.control.tactical.solver`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import pytest
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.logic.publisher import Publisher
+from ensemble.handler.symuvia.stream import SimulatorRequest
+from ensemble.component.vehiclelist import VehicleList
+from ensemble.control.tactical.gapcordinator import GlobalGapCoordinator
+from ensemble.logic.platoon_states import (
+    STATES,
+    StandAlone,
+    Joining,
+    Platooning,
+)
+from ensemble.component.vehicle import Vehicle
+from ensemble.control.tactical.vehcoordinator import VehGapCoordinator
+from ensemble.control.tactical import solver
+from ensemble.control.tactical.solver import solve_states, REEVALP
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def create_coordinator(publisher, vehid, x, status, leader=None):
+    veh = Vehicle(publisher, vehid=vehid, vehtype="PLT", speed=25.0)
+    veh.distance = x
+    vgc = VehGapCoordinator(veh)
+    vgc.status = status
+    if leader is not None:
+        vgc.leader = leader
+    return vgc
+
+
+@pytest.fixture
+def fleet():
+    rng = np.random.default_rng(42)
+    publisher = Publisher()
+    vgcs = []
+    for vehid in range(200):
+        leader = None
+        if vgcs and rng.random() < 0.8:
+            leader = vgcs[rng.integers(len(vgcs))]
+        x = 5000.0 - 20.0 * vehid
+        if leader is not None and rng.random() < 0.3:
+            x = leader.x - leader.dx_ref  # gap at reference
+        status = STATES[rng.integers(len(STATES))]()
+        vgc = create_coordinator(publisher, vehid, x, status, leader)
+        vgc.positionid = int(rng.integers(0, 7))
+        vgc.comv2x = bool(rng.random() < 0.9)
+        vgcs.append(vgc)
+    return vgcs
+
+
+def test_solver_matches_state_objects(fleet):
+    expected = [type(vgc.status.next_state(vgc)) for vgc in fleet]
+    result = [type(state) for state in solve_states(fleet)]
+    assert result == expected
+    assert len(set(result)) > 2
+
+
+def test_solver_transitions():
+    publisher = Publisher()
+    head = create_coordinator(publisher, 1, 100.0, StandAlone())
+    join = create_coordinator(publisher, 2, 50.0, StandAlone(), head)
+    confirm = create_coordinator(publisher, 3, 70.0, Joining(), head)
+    split = create_coordinator(publisher, 4, -500.0, Platooning(), head)
+    states = solve_states([head, join, confirm, split])
+    assert states[0] is head.status
+    assert [type(s).__name__ for s in states[1:]] == [
+        "Joining",
+        "Platooning",
+        "Splitting",
+    ]
+
+
+def test_solver_skips_clean_coordinators():
+    publisher = Publisher()
+    head = create_coordinator(publisher, 1, 1000.0, StandAlone())
+    far = create_coordinator(publisher, 2, 500.0, StandAlone(), head)
+    vgcs = [head, far]
+
+    states = solve_states(vgcs, update=1)
+    assert all(state is not None for state in states)
+    for vgc in vgcs:
+        vgc.mark_evaluated(1)
+    assert solve_states(vgcs, update=2) == [None, None]
+
+    # Leader change
+    far.leader = create_coordinator(publisher, 3, 520.0, StandAlone())
+    assert solve_states(vgcs, update=3)[1] is not None
+    far.mark_evaluated(3)
+
+    # Timer
+    assert solve_states(vgcs, update=3 + REEVALP) != [None, None]
+
+
+def test_solver_gathers_dirty_coordinators_only(monkeypatch):
+    publisher = Publisher()
+    head = create_coordinator(publisher, 1, 1000.0, StandAlone())
+    far = create_coordinator(publisher, 2, 500.0, StandAlone(), head)
+    for vgc in (head, far):
+        vgc.mark_evaluated(1)
+    gathered = []
+    gather = solver.gather
+    monkeypatch.setattr(
+        solver, "gather", lambda vgcs: gathered.append(vgcs) or gather(vgcs)
+    )
+
+    assert solve_states([head, far], update=2) == [None, None]
+    assert gathered == []
+
+    far.dirty = True
+    states = solve_states([head, far], update=2)
+    assert states[0] is None and states[1] is not None
+    assert gathered == [[far]]
+
+
+
+def test_held_steps_keep_update_counter():
+    publisher = Publisher()
+    head = create_coordinator(publisher, 1, 1000.0, StandAlone())
+    far = create_coordinator(publisher, 2, 500.0, StandAlone(), head)
+    registry = GlobalGapCoordinator(VehicleList(SimulatorRequest()))
+    registry.iter_group_link = lambda **kwargs: iter([head, far])
+    for vgc in (head, far):
+        vgc.mark_evaluated(0)
+
+    registry.update_states()
+    registry.update_states()
+    assert registry.skipped == 2
+    updates = registry._updates
+
+    for _ in range(2 * REEVALP):
+        registry.update_states(unsolved=True)
+    assert registry._updates == updates
+    assert registry.skipped == 2
+
+    # No forced re-evaluation, the period counts tactical updates
+    registry.update_states()
+    assert registry._updates == updates + 1
+    assert registry.skipped == 2
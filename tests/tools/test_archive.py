@@ -0,0 +1,108 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.tools.archive`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.handler.replay.source import open_source
+from ensemble.handler.symuvia.xmlparser import XMLTrajectory, frame_time
+from ensemble.tools.archive import FrameArchive
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def frame(time, trajs=()):
+    traj = "".join(
+        f'<TRAJ abs="{x}" acc="0.00" dst="{x}" id="{i}" ord="0.00" tron="Zone_001" type="VL" vit="25.00" voie="1" z="0.00"/>'
+        for i, x in trajs
+    )
+    return (
+        f'<INST nbVeh="{len(trajs)}" val="{time}.00"><CREATIONS/><SORTIES/>'
+        f"<TRAJS>{traj}</TRAJS><STREAMS/><LINKS/><SGTS/><FEUX/><ENTREES/>"
+        "<REGULATIONS/></INST>"
+    ).encode()
+
+
+FRAMES = [frame(t, ((0, 25.0 * t), (1, 25.0 * t - 10))) for t in range(1, 11)]
+
+
+@pytest.fixture
+def archive(tmp_path):
+    with FrameArchive(str(tmp_path / "run"), "w") as archive:
+        for step, data in enumerate(FRAMES, 1):
+            archive.append(data, step, frame_time(data))
+    return str(tmp_path / "run")
+
+
+def test_archive_random_access(archive):
+    with FrameArchive(archive) as reader:
+        assert len(reader) == 10
+        assert reader.codec == "zlib"
+        assert reader.times.tolist() == [float(t) for t in range(1, 11)]
+        assert reader.position(7) == 6
+        assert reader.get(7) == FRAMES[6]
+        assert list(reader.range(3, 6)) == FRAMES[2:5]
+        assert list(reader) == FRAMES
+        with pytest.raises(KeyError):
+            reader.get(11)
+        with pytest.raises(ValueError):
+            reader.append(FRAMES[0])
+
+
+def test_archive_append_mode(archive):
+    with FrameArchive(archive, "a") as writer:
+        writer.append(FRAMES[0], 20)
+        writer.append(FRAMES[1])
+        assert writer.get(21) == FRAMES[1]
+    with FrameArchive(archive) as reader:
+        assert reader.steps.tolist() == list(range(1, 11)) + [20, 21]
+        assert reader.position(20) == 10  # Found past the gap
+        assert list(reader.range(10)) == [FRAMES[9], FRAMES[0], FRAMES[1]]
+
+
+def test_archive_truncated_index(archive):
+    with open(f"{archive}.index", "ab") as f:
+        f.write(b"\0" * 5)
+    with FrameArchive(archive) as reader:
+        assert len(reader) == 10
+
+
+@pytest.mark.parametrize("codec", ["none", "lzma"])
+def test_archive_codecs(tmp_path, codec):
+    path = str(tmp_path / "run")
+    with FrameArchive(path, "w", codec=codec) as writer:
+        for data in FRAMES:
+            writer.append(data)
+    with FrameArchive(path, codec="zlib") as reader:
+        assert reader.codec == codec
+        assert reader.steps.tolist() == list(range(10))
+        assert reader[3] == FRAMES[3]
+
+
+def test_archive_trajectory(archive):
+    with FrameArchive(archive) as reader:
+        trajectory = XMLTrajectory.from_archive(reader, 4)
+        assert trajectory.todict == XMLTrajectory(FRAMES[3]).todict
+
+
+def test_archive_replay_source(archive):
+    source = open_source(archive)
+    assert isinstance(source, FrameArchive)
+    assert source.times.tolist() == [float(t) for t in range(1, 11)]
+    assert source[9] == FRAMES[9]
+    source.close()
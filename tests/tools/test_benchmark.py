@@ -0,0 +1,93 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.tools.benchmark`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.tools.benchmark import (
+    CASES,
+    case,
+    compare_results,
+    format_time,
+    load_results,
+    measure,
+    run_cases,
+    save_results,
+)
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+@pytest.fixture
+def cases():
+    @case("test.sum", sizes=(10, 100))
+    def total(n):
+        data = list(range(n))
+        return lambda: sum(data)
+
+    @case("test.missing", sizes=(10,))
+    def missing(n):
+        raise OSError("library not found")
+
+    yield ["test.sum", "test.missing"]
+    CASES.pop("test.sum")
+    CASES.pop("test.missing")
+
+
+def test_measure_reaches_min_time():
+    result = measure(lambda: sum(range(100)), repeat=3, min_time=0.01)
+    assert result["repeat"] == 3
+    assert result["number"] > 1
+    assert 0 < result["min"] <= result["median"]
+
+
+def test_run_cases_skips_missing_libraries(cases):
+    logged = []
+    results = run_cases(
+        cases, repeat=2, min_time=0.001, log=lambda k, r: logged.append(k)
+    )
+    assert logged == ["test.sum/10", "test.sum/100", "test.missing/10"]
+    assert results["results"]["test.sum/100"]["n"] == 100
+    assert "min" in results["results"]["test.sum/10"]
+    assert results["results"]["test.missing/10"]["skipped"] == (
+        "library not found"
+    )
+    assert "python" in results["machine"]
+
+
+def test_compare_with_saved_baseline(cases, tmp_path):
+    path = str(tmp_path / "baseline.json")
+    baseline = run_cases(cases, sizes=(10,), repeat=2, min_time=0.001)
+    save_results(baseline, path)
+    baseline = load_results(path)
+
+    slower = {"results": {"test.sum/10": {"min": 0.0}}}
+    slower["results"]["test.sum/10"]["min"] = (
+        baseline["results"]["test.sum/10"]["min"] * 2
+    )
+    rows = compare_results(slower, baseline, tolerance=0.25)
+    assert [row["key"] for row in rows] == ["test.sum/10"]
+    assert rows[0]["ratio"] == pytest.approx(2)
+    assert rows[0]["regression"]
+    assert not compare_results(baseline, baseline)[0]["regression"]
+
+
+def test_format_time():
+    assert format_time(2.0) == "2 s"
+    assert format_time(1.5e-3) == "1.5 ms"
+    assert format_time(2e-9) == "2 ns"
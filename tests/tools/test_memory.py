@@ -0,0 +1,73 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.tools.memory`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import csv
+import json
+import tracemalloc
+from types import SimpleNamespace
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.logic.platoon_set import PlatoonSet
+from ensemble.tools.memory import FIELDS, MemoryProbe, count_objects
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def configurator(step: int = 0):
+    """Stand-in of a configurator without simulation"""
+    return SimpleNamespace(connector=SimpleNamespace(), simulation_time=step)
+
+
+def test_count_objects():
+    before = count_objects()["platoon_sets"]
+    platoons = [PlatoonSet() for _ in range(5)]
+    assert count_objects()["platoon_sets"] == before + len(platoons)
+
+
+def test_probe_timeline_and_growth(tmp_path):
+    prefix = str(tmp_path / "memory")
+    leak = []
+    with MemoryProbe(prefix, interval=3) as probe:
+        assert tracemalloc.is_tracing()
+        for step in range(10):
+            leak.append(bytearray(100_000))
+            probe(configurator(step))
+    assert not tracemalloc.is_tracing()
+    # Steps 3, 6, 9 and the last step on close
+    assert [s["step"] for s in probe.samples] == [3, 6, 9, 10]
+    assert probe.samples[-1]["traced"] > probe.samples[0]["traced"]
+    assert probe.samples[0]["registry"] == 0
+    assert probe.growth[0]["source"].startswith(__file__)
+    assert probe.growth[0]["size_diff"] >= 600_000
+
+    with open(f"{prefix}.json") as f:
+        report = json.load(f)
+    assert report["interval"] == 3
+    assert len(report["timeline"]) == 4
+    with open(f"{prefix}.csv") as f:
+        reader = csv.DictReader(f)
+        assert tuple(reader.fieldnames) == FIELDS
+        assert len(list(reader)) == 4
+
+
+def test_probe_without_steps(tmp_path):
+    prefix = tmp_path / "memory"
+    with MemoryProbe(str(prefix)) as probe:
+        pass
+    assert probe.samples == []
+    assert not (tmp_path / "memory.json").exists()
@@ -0,0 +1,75 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.tools.metrics`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from types import SimpleNamespace
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.tools.metrics import MetricsExporter, rss_bytes
+from ensemble.tools.profiler import PROFILER
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+@pytest.fixture
+def configurator():
+    request = SimpleNamespace(vehicle_registry=list(range(12)))
+    return SimpleNamespace(
+        connector=SimpleNamespace(simulation_step=30, request=request),
+        simulation_time=30.0,
+        platoon_registry=SimpleNamespace(nplatoons=2),
+    )
+
+
+def scrape(url, accept=""):
+    with urlopen(Request(url, headers={"Accept": accept}), timeout=5) as r:
+        return r.headers["Content-Type"], r.read().decode()
+
+
+def test_metrics_endpoint(configurator):
+    PROFILER.reset()
+    with MetricsExporter(port=0) as exporter:
+        assert PROFILER.enabled
+        with PROFILER.section("phase.query"):
+            pass
+        exporter.publish(configurator)
+        kind, text = scrape(exporter.url)
+        lines = text.splitlines()
+        assert kind.startswith("text/plain")
+        assert "ensemble_step 30" in lines
+        assert "ensemble_vehicles 12" in lines
+        assert "ensemble_platoons 2" in lines
+        assert "# TYPE ensemble_phase_seconds summary" in lines
+        assert 'ensemble_phase_seconds_count{phase="query"} 1' in lines
+        ratio = [l for l in lines if l.startswith("ensemble_realtime_ratio ")]
+        assert float(ratio[0].split()[1]) > 0
+
+        kind, text = scrape(exporter.url, "application/openmetrics-text")
+        assert kind.startswith("application/openmetrics-text")
+        assert text.endswith("# EOF\n")
+
+        with pytest.raises(HTTPError):
+            urlopen(exporter.url.replace("metrics", "other"), timeout=5)
+    assert not PROFILER.enabled
+    PROFILER.reset()
+
+
+def test_rss_bytes():
+    assert rss_bytes() > 0
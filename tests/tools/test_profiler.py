@@ -0,0 +1,107 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.tools.profiler`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import csv
+import json
+import pstats
+import time
+import pytest
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.tools.profiler import Histogram, Profiler, profile_run
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def test_histogram_percentiles():
+    rng = np.random.default_rng(0)
+    samples = rng.lognormal(-6, 1, 5000)
+    hist = Histogram()
+    for value in samples:
+        hist.add(value)
+    stats = hist.to_dict()
+    assert stats["count"] == 5000
+    assert stats["min"] == samples.min()
+    assert stats["total"] == pytest.approx(samples.sum())
+    for q in (50, 95, 99):
+        # Log bins of a tenth of decade: relative error below 26%
+        assert stats[f"p{q}"] == pytest.approx(
+            np.percentile(samples, q), rel=0.26
+        )
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler()
+    with profiler.section("parse"):
+        pass
+    profiler.count("vehicles", 10)
+    assert profiler.to_dict() == {"timers": {}, "counters": {}}
+
+
+def test_sections_counters_and_exports(tmp_path):
+    profiler = Profiler(enabled=True)
+    for n in range(3):
+        with profiler.section("parse"):
+            sum(range(1000))
+        profiler.count("vehicles", n)
+    timed = profiler.wrap("phase.query", lambda x: x + 1)
+    assert timed(1) == 2
+
+    stats = profiler.to_dict()
+    assert stats["timers"]["parse"]["wall"]["count"] == 3
+    assert stats["timers"]["phase.query"]["cpu"]["count"] == 1
+    assert stats["counters"]["vehicles"]["total"] == 3
+    assert stats["counters"]["vehicles"]["max"] == 2
+
+    profiler.to_json(tmp_path / "profile.json")
+    profiler.to_csv(tmp_path / "profile.csv")
+    with open(tmp_path / "profile.json") as f:
+        assert json.load(f)["counters"]["vehicles"]["count"] == 3
+    with open(tmp_path / "profile.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert [(r["name"], r["kind"]) for r in rows] == [
+        ("parse", "wall"),
+        ("parse", "cpu"),
+        ("phase.query", "wall"),
+        ("phase.query", "cpu"),
+        ("vehicles", "counter"),
+    ]
+
+
+def test_nested_sections():
+    profiler = Profiler(enabled=True)
+    with profiler.section("step"):
+        time.sleep(0.02)
+        with profiler.section("step"):
+            pass
+    stats = profiler.to_dict()["timers"]["step"]["wall"]
+    assert stats["count"] == 2
+    assert stats["max"] >= 0.02
+
+
+def test_profile_run_exports(tmp_path):
+    prefix = str(tmp_path / "run")
+    with profile_run(prefix) as profiler:
+        with profiler.section("tactical"):
+            sorted(range(1000))
+    assert not profiler.enabled
+    assert profiler.timers["tactical"][0].count == 1
+    assert pstats.Stats(f"{prefix}.pstats").total_calls > 0
+    assert (tmp_path / "run.json").exists()
+    assert (tmp_path / "run.csv").exists()
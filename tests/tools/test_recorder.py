@@ -0,0 +1,137 @@
+"""
+Unit testing
+============
+
+    Note:
+        Tests for `ensemble.tools.recorder`
+
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from ensemble.handler.symuvia.stream import SimulatorRequest
+from ensemble.handler.vissim.stream import SimulatorRequest as VissimRequest
+from ensemble.tools.recorder import (
+    COLUMNS,
+    RecordingHook,
+    TrajectoryRecorder,
+    load_trajectories,
+)
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def frame(time, trajs=()):
+    traj = "".join(
+        f'<TRAJ abs="{x}" acc="0.00" dst="{x}" id="{i}" ord="0.00" tron="LinkA" type="{t}" vit="25.00" voie="1" z="0.00"/>'
+        for i, t, x in trajs
+    )
+    return (
+        f'<INST nbVeh="{len(trajs)}" val="{time}.00"><CREATIONS/><SORTIES/>'
+        f"<TRAJS>{traj}</TRAJS><STREAMS/><LINKS/><SGTS/><FEUX/><ENTREES/>"
+        "<REGULATIONS/></INST>"
+    ).encode()
+
+
+@pytest.fixture
+def request_():
+    return SimulatorRequest()
+
+
+def test_recorder_chunks(request_, tmp_path):
+    registry = SimpleNamespace(
+        vgcs=lambda: [
+            SimpleNamespace(
+                vehid=1,
+                platoonid=3,
+                status=SimpleNamespace(),
+                positionid=np.int64(0),
+            )
+        ]
+    )
+    with TrajectoryRecorder(
+        request_, str(tmp_path), registry, chunk_rows=3, fmt="npz"
+    ) as recorder:
+        request_.query = frame(1, ((0, "VL", 10.0), (1, "PL", 20.0)))
+        request_.query = frame(2, ((0, "VL", 35.0), (1, "PL", 45.0)))
+        request_.query = frame(3, ((1, "PL", 70.0),))
+    assert recorder not in request_.get_subscribers("default")
+    assert sorted(os.listdir(tmp_path)) == ["chunk-00000.npz", "chunk-00001.npz"]
+
+    df = load_trajectories(str(tmp_path))
+    assert tuple(df.columns) == tuple(COLUMNS)
+    assert len(df) == recorder.rows == 5
+    assert df["step"].tolist() == [0, 0, 1, 1, 2]
+    assert df["time"].tolist() == [1.0, 1.0, 2.0, 2.0, 3.0]
+    assert df["abscissa"].tolist() == [10.0, 20.0, 35.0, 45.0, 70.0]
+    assert df["vehtype"].tolist() == ["VL", "PL"] * 2 + ["PL"]
+    assert df["platoonid"].tolist() == [-1, 3, -1, 3, 3]
+    assert df["state"].tolist() == ["", "SimpleNamespace"] * 2 + ["SimpleNamespace"]
+
+
+def test_recorder_typed_columns(tmp_path):
+    request = VissimRequest()
+    recorder = TrajectoryRecorder(request, str(tmp_path), fmt="npz")
+    request.query = ((1.0, 0.0, 5.0, 7, 2.0, 6, "630", 36.0, 1),)
+    recorder.close()
+    df = load_trajectories(str(tmp_path))
+    assert df["vehid"].tolist() == [7]
+    assert df["link"].tolist() == ["6"]
+    assert df["speed"].tolist() == [10.0]
+    assert np.isnan(df["time"]).all()
+
+
+def test_recording_hook(request_, tmp_path):
+    configurator = SimpleNamespace(connector=SimpleNamespace(request=request_))
+    with RecordingHook(str(tmp_path), fmt="npz") as recording:
+        recording(configurator)
+        request_.query = frame(1, ((0, "VL", 10.0),))
+        recording(configurator)
+        other = SimulatorRequest()
+        configurator.connector.request = other
+        recording(configurator)
+        other.query = frame(1, ((4, "VL", 10.0),))
+    assert load_trajectories(str(tmp_path))["vehid"].tolist() == [0, 4]
+
+
+def test_recording_hook_snapshot(request_, tmp_path):
+    coordinators = []
+    registry = SimpleNamespace(vgcs=lambda: coordinators)
+    configurator = SimpleNamespace(
+        connector=SimpleNamespace(request=request_), platoon_registry=registry
+    )
+    with RecordingHook(str(tmp_path), chunk_rows=1, fmt="npz") as recording:
+        recording(configurator)
+        request_.query = frame(1, ((1, "PL", 20.0),))
+        coordinators.append(
+            SimpleNamespace(
+                vehid=1, platoonid=3, status=SimpleNamespace(), positionid=0
+            )
+        )
+        recording.snapshot(configurator)
+        recording(configurator)
+        request_.query = frame(2, ((1, "PL", 45.0),))
+        coordinators.clear()
+        recording.snapshot(configurator)
+    df = load_trajectories(str(tmp_path))
+    assert df["platoonid"].tolist() == [3, -1]
+    assert df["state"].tolist() == ["SimpleNamespace", ""]
+
+
+def test_recorder_unknown_format(request_, tmp_path):
+    with pytest.raises(ValueError):
+        TrajectoryRecorder(request_, str(tmp_path), fmt="csv")
+    assert len(load_trajectories(str(tmp_path))) == 0